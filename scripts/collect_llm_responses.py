@@ -1,19 +1,22 @@
+import argparse
+import asyncio
 import json
 import os
+import random
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from time import sleep
+from time import monotonic, perf_counter
 
 # Add C:\libs to path for model client libraries installed there
 import sys
 sys.path.insert(0, "C:\\libs")
 
-import openai
-import anthropic
-import google.generativeai as genai
-from mistralai.client import Mistral
-from openai import OpenAI as DeepSeekClient  # DeepSeek is OpenAI-compatible
 from dotenv import load_dotenv
 
+import llm_cache
+
 load_dotenv()
 
 # =============================================================================
@@ -24,13 +27,23 @@ INSTRUMENTS_FILE  = Path("data/prompts/instruments.json")
 PEER_EVAL_FILE    = Path("data/prompts/peer_eval_pairs.json")
 RAW_DIR           = Path("data/raw")
 
-# Model identifiers — keys must match instruments.json "models" list
+# Model identifiers and per-provider limits — keys must match instruments.json "models" list
+#   id:          provider model identifier
+#   rpm / tpm:   requests / tokens per minute allowed by the account tier
+#   concurrency: max in-flight requests in the async collection engine
+#   temperature: sampling temperature sent with the request (omitted = provider default)
+# Adjust rpm / tpm to your own account tier before a full run.
 MODELS = {
-    "gpt-4o":                        "gpt-4o",
-    "claude-sonnet":                 "claude-sonnet-4-5",
-    "deepseek-v3":                   "deepseek-chat",
-    "mistral-large":                 "mistral-large-latest",
-    "gemini-3.1-flash-lite-preview": "gemini-3.1-flash-lite-preview",
+    "gpt-4o":                        {"id": "gpt-4o", "temperature": 1,
+                                      "rpm": 500, "tpm": 30_000,  "concurrency": 8},
+    "claude-sonnet":                 {"id": "claude-sonnet-4-5",
+                                      "rpm": 50,  "tpm": 30_000,  "concurrency": 4},
+    "deepseek-v3":                   {"id": "deepseek-chat",
+                                      "rpm": 300, "tpm": 500_000, "concurrency": 8},
+    "mistral-large":                 {"id": "mistral-large-latest",
+                                      "rpm": 60,  "tpm": 500_000, "concurrency": 4},
+    "gemini-3.1-flash-lite-preview": {"id": "gemini-3.1-flash-lite-preview",
+                                      "rpm": 15,  "tpm": 250_000, "concurrency": 4},
 }
 
 # Instruments to collect in this run
@@ -53,26 +66,79 @@ MAX_TOKENS_OPEN = 1024
 # Max tokens for structured JSON responses (I3)
 MAX_TOKENS_JSON = 2048
 
-RETRY_ATTEMPTS = 3
-RETRY_DELAY    = 5   # seconds between retries
-CALL_DELAY     = 1   # seconds between normal calls
+RETRY_ATTEMPTS   = 5    # attempts per call for retryable errors
+RETRY_BASE_DELAY = 2    # seconds; backoff ceiling doubles per attempt
+RETRY_MAX_DELAY  = 60   # seconds; cap on a single backoff wait
+PARSE_ATTEMPTS   = 3    # I1 re-queries when the JSON response is unparseable
 
-# =============================================================================
-# Client setup
-# =============================================================================
+# Per-provider circuit breaker: opens after BREAKER_THRESHOLD consecutive
+# server/timeout failures, lets one probe call through after BREAKER_COOLDOWN,
+# and gives up on the provider for this run after BREAKER_MAX_TRIPS failed probes.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN  = 60
+BREAKER_MAX_TRIPS = 3
 
-openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Fallbacks for MODELS entries that omit a limit
+DEFAULT_CONCURRENCY = 2
+DEFAULT_RPM         = 60
+DEFAULT_TPM         = 100_000
 
-anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+# Rough prompt-size heuristic used for TPM accounting
+CHARS_PER_TOKEN = 4
 
-deepseek_client = DeepSeekClient(
-    api_key=os.getenv("DEEPSEEK_API_KEY"),
-    base_url="https://api.deepseek.com/v1",
-)
+# MODELS entry whose slot and limits I5 extraction calls use (EXTRACTOR_MODEL is served by Anthropic)
+EXTRACTOR_PROVIDER = "claude-sonnet"
+
+# I4 and I5 read I1/I2 responses, so they are collected after every other instrument
+DEPENDENT_INSTRUMENTS = ["instrument_4", "instrument_5"]
 
-mistral_client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
+# =============================================================================
+# Client setup
+# SDKs are imported and clients built on first use, so only providers that are
+# actually called this run are loaded (and --help / --dry-run start instantly).
+# =============================================================================
 
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+DEEPSEEK_BASE_URL = "https://api.deepseek.com/v1"   # DeepSeek is OpenAI-compatible
+
+_clients: dict[str, object] = {}
+
+
+def _make_client(name: str):
+    if name == "openai":
+        import openai
+        return openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    if name == "async_openai":
+        import openai
+        return openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    if name == "anthropic":
+        import anthropic
+        return anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    if name == "async_anthropic":
+        import anthropic
+        return anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    if name == "deepseek":
+        import openai
+        return openai.OpenAI(api_key=os.getenv("DEEPSEEK_API_KEY"), base_url=DEEPSEEK_BASE_URL)
+    if name == "async_deepseek":
+        import openai
+        return openai.AsyncOpenAI(api_key=os.getenv("DEEPSEEK_API_KEY"), base_url=DEEPSEEK_BASE_URL)
+    if name == "mistral":
+        # Mistral exposes async methods on its regular client
+        from mistralai.client import Mistral
+        return Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
+    if name == "gemini":
+        # google.generativeai is configured module-wide; the module is the "client"
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        return genai
+    raise KeyError(f"Unknown client: {name}")
+
+
+def get_client(name: str):
+    """Return the named SDK client, importing and constructing it on first use."""
+    if name not in _clients:
+        _clients[name] = _make_client(name)
+    return _clients[name]
 
 # =============================================================================
 # Model callers
@@ -80,21 +146,21 @@ genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 # =============================================================================
 
 def call_openai(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
-    resp = openai_client.chat.completions.create(
-        model=MODELS["gpt-4o"],
+    resp = get_client("openai").chat.completions.create(
+        model=MODELS["gpt-4o"]["id"],
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user",   "content": user_prompt},
         ],
         max_tokens=max_tokens,
-        temperature=1,
+        temperature=MODELS["gpt-4o"]["temperature"],
     )
     return resp.choices[0].message.content.strip()
 
 
 def call_anthropic(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
-    resp = anthropic_client.messages.create(
-        model=MODELS["claude-sonnet"],
+    resp = get_client("anthropic").messages.create(
+        model=MODELS["claude-sonnet"]["id"],
         max_tokens=max_tokens,
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
@@ -103,8 +169,8 @@ def call_anthropic(system_prompt: str, user_prompt: str, max_tokens: int) -> str
 
 
 def call_deepseek(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
-    resp = deepseek_client.chat.completions.create(
-        model=MODELS["deepseek-v3"],
+    resp = get_client("deepseek").chat.completions.create(
+        model=MODELS["deepseek-v3"]["id"],
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user",   "content": user_prompt},
@@ -115,8 +181,8 @@ def call_deepseek(system_prompt: str, user_prompt: str, max_tokens: int) -> str
 
 
 def call_mistral(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
-    resp = mistral_client.chat.complete(
-        model=MODELS["mistral-large"],
+    resp = get_client("mistral").chat.complete(
+        model=MODELS["mistral-large"]["id"],
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user",   "content": user_prompt},
@@ -127,8 +193,8 @@ def call_mistral(system_prompt: str, user_prompt: str, max_tokens: int) -> str |
 
 
 def call_gemini(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
-    model = genai.GenerativeModel(
-        model_name=MODELS["gemini-3.1-flash-lite-preview"],
+    model = get_client("gemini").GenerativeModel(
+        model_name=MODELS["gemini-3.1-flash-lite-preview"]["id"],
         system_instruction=system_prompt,
     )
     resp = model.generate_content(user_prompt)
@@ -144,22 +210,537 @@ MODEL_CALLERS = {
 }
 
 # =============================================================================
-# Retry wrapper
+# Async model callers
+# Same contract as MODEL_CALLERS, backed by each SDK's async client.
+# Models without an entry here fall back to MODEL_CALLERS in a worker thread.
 # =============================================================================
 
-def call_with_retry(model_id: str, system_prompt: str, user_prompt: str,
-                    max_tokens: int) -> str | None:
-    caller = MODEL_CALLERS[model_id]
+async def acall_openai(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
+    resp = await get_client("async_openai").chat.completions.create(
+        model=MODELS["gpt-4o"]["id"],
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user",   "content": user_prompt},
+        ],
+        max_tokens=max_tokens,
+        temperature=MODELS["gpt-4o"]["temperature"],
+    )
+    return resp.choices[0].message.content.strip()
+
+
+async def acall_anthropic(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
+    resp = await get_client("async_anthropic").messages.create(
+        model=MODELS["claude-sonnet"]["id"],
+        max_tokens=max_tokens,
+        system=system_prompt,
+        messages=[{"role": "user", "content": user_prompt}],
+    )
+    return resp.content[0].text.strip()
+
+
+async def acall_deepseek(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
+    resp = await get_client("async_deepseek").chat.completions.create(
+        model=MODELS["deepseek-v3"]["id"],
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user",   "content": user_prompt},
+        ],
+        max_tokens=max_tokens,
+    )
+    return resp.choices[0].message.content.strip()
+
+
+async def acall_mistral(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
+    resp = await get_client("mistral").chat.complete_async(
+        model=MODELS["mistral-large"]["id"],
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user",   "content": user_prompt},
+        ],
+        max_tokens=max_tokens,
+    )
+    return resp.choices[0].message.content.strip()
+
+
+async def acall_gemini(system_prompt: str, user_prompt: str, max_tokens: int) -> str | None:
+    model = get_client("gemini").GenerativeModel(
+        model_name=MODELS["gemini-3.1-flash-lite-preview"]["id"],
+        system_instruction=system_prompt,
+    )
+    resp = await model.generate_content_async(user_prompt)
+    return resp.text.strip()
+
+
+ASYNC_MODEL_CALLERS = {
+    "gpt-4o":                        acall_openai,
+    "claude-sonnet":                 acall_anthropic,
+    "deepseek-v3":                   acall_deepseek,
+    "mistral-large":                 acall_mistral,
+    "gemini-3.1-flash-lite-preview": acall_gemini,
+}
+
+
+async def acall_model(model_id: str, system_prompt: str, user_prompt: str,
+                      max_tokens: int) -> str | None:
+    caller = ASYNC_MODEL_CALLERS.get(model_id)
+    if caller is not None:
+        return await caller(system_prompt, user_prompt, max_tokens)
+    return await asyncio.to_thread(
+        MODEL_CALLERS[model_id], system_prompt, user_prompt, max_tokens
+    )
+
+# =============================================================================
+# Rate limiting
+#
+# Each MODELS entry gets two token buckets: one for requests per minute and one
+# for tokens per minute. A call reserves 1 request plus its estimated token use
+# (prompt length / CHARS_PER_TOKEN + max_tokens) and waits until both buckets
+# can cover it. Buckets hold one minute of quota and refill continuously, the
+# same scheme the providers use server-side, so calls run as fast as the quota
+# allows and no faster.
+# =============================================================================
+
+def estimate_tokens(system_prompt: str | None, user_prompt: str, max_tokens: int) -> int:
+    """Upper-bound token cost of one call: prompt estimate + full completion budget."""
+    prompt_chars = len(system_prompt or "") + len(user_prompt)
+    return -(-prompt_chars // CHARS_PER_TOKEN) + max_tokens
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to `per_minute` units."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate     = per_minute / 60.0
+        self.level    = float(per_minute)
+        self.updated  = monotonic()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self.level   = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)   # oversize requests wait for a full bucket
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """RPM + TPM limiter for one provider slot, with usage accounting."""
+
+    def __init__(self, provider: str, rpm: float, tpm: float):
+        self.provider  = provider
+        self.rpm       = rpm
+        self.tpm       = tpm
+        self.requests  = TokenBucket(rpm)
+        self.tokens    = TokenBucket(tpm)
+        self.lock      = asyncio.Lock()   # FIFO: callers are admitted in arrival order
+        self.blocked_until = 0.0          # set from Retry-After on 429 responses
+        self.n_calls   = 0
+        self.n_tokens  = 0
+        self.waited    = 0.0
+        self.first_at  = None
+        self.last_at   = None
+
+    async def acquire(self, tokens: int) -> None:
+        async with self.lock:
+            while True:
+                wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens),
+                           self.blocked_until - monotonic())
+                if wait <= 0:
+                    break
+                self.waited += wait
+                await asyncio.sleep(wait)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+
+            now = monotonic()
+            self.first_at = self.first_at or now
+            self.last_at  = now
+            self.n_calls  += 1
+            self.n_tokens += tokens
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back every caller of this provider for `seconds` (server-requested pause)."""
+        self.blocked_until = max(self.blocked_until, monotonic() + seconds)
+
+    def usage(self) -> dict:
+        """Achieved request/token rates and their share of the configured quota."""
+        minutes = max((self.last_at or 0) - (self.first_at or 0), 60.0) / 60.0
+        rpm = self.n_calls / minutes
+        tpm = self.n_tokens / minutes
+        return {
+            "calls":      self.n_calls,
+            "est_tokens": self.n_tokens,
+            "rpm":        round(rpm, 1),
+            "rpm_pct":    round(rpm / self.rpm * 100, 1),
+            "tpm":        round(tpm),
+            "tpm_pct":    round(tpm / self.tpm * 100, 1),
+            "waited_s":   round(self.waited, 1),
+        }
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    if provider not in _rate_limiters:
+        cfg = MODELS.get(provider, {})
+        _rate_limiters[provider] = RateLimiter(
+            provider,
+            rpm=cfg.get("rpm", DEFAULT_RPM),
+            tpm=cfg.get("tpm", DEFAULT_TPM),
+        )
+    return _rate_limiters[provider]
+
+
+def print_rate_limit_report() -> None:
+    if not _rate_limiters:
+        return
+    print("\nRate-limit usage (share of configured quota over the active period):")
+    for provider, limiter in _rate_limiters.items():
+        u = limiter.usage()
+        print(
+            f"  {MODEL_LABELS.get(provider, provider):<24} {u['calls']:>5} calls  "
+            f"{u['rpm']:>7.1f} rpm ({u['rpm_pct']:>5.1f}% of {limiter.rpm:g})  "
+            f"{u['tpm']:>8} tpm ({u['tpm_pct']:>5.1f}% of {limiter.tpm:g})  "
+            f"throttled {u['waited_s']:.1f}s"
+        )
+
+
+# =============================================================================
+# Retry policy
+#
+# SDK errors are sorted into four classes by HTTP status / exception type:
+#   rate_limit  429, RateLimitError, ResourceExhausted
+#   server      5xx (incl. 529 overloaded), 409, connection errors
+#   timeout     408, client/async timeouts, DeadlineExceeded
+#   fatal       other 4xx (bad request, auth, unknown model) and response-shape errors
+# Fatal errors are not retried. Everything else backs off exponentially with full
+# jitter, or for the server-requested delay (Retry-After / rate-limit reset
+# headers) when one is given. Server and timeout failures feed a per-provider
+# circuit breaker; 401/403/404 take the provider out for the rest of the run.
+# =============================================================================
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit breaker has given up."""
+
+
+def _status_code(e: Exception) -> int | None:
+    for attr in ("status_code", "status", "code"):
+        val = getattr(e, attr, None)
+        if isinstance(val, int):
+            return val
+    response = getattr(e, "response", None) or getattr(e, "raw_response", None)
+    val = getattr(response, "status_code", None)
+    return val if isinstance(val, int) else None
+
+
+def classify_error(e: Exception) -> str:
+    """Return "rate_limit", "server", "timeout" or "fatal" for an SDK exception."""
+    if isinstance(e, CircuitOpenError):
+        return "fatal"
+    name   = type(e).__name__
+    status = _status_code(e)
+    if status == 429 or "RateLimit" in name or "ResourceExhausted" in name:
+        return "rate_limit"
+    if status == 408 or isinstance(e, (TimeoutError, asyncio.TimeoutError)) \
+            or "Timeout" in name or "DeadlineExceeded" in name:
+        return "timeout"
+    if status is not None:
+        if status >= 500 or status == 409:
+            return "server"
+        if 400 <= status < 500:
+            return "fatal"
+    if "Connection" in name or "Unavailable" in name or "InternalServerError" in name:
+        return "server"
+    if isinstance(e, (ValueError, TypeError, KeyError, AttributeError, IndexError)):
+        # e.g. a blocked Gemini response has no .text — retrying will not help
+        return "fatal"
+    return "server"
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNIT = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_reset(value: str) -> float | None:
+    """Parse a reset header: seconds ("7"), duration ("1m30s", "20ms") or timestamp."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNIT[u] for n, u in parts)
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+RESET_HEADERS = [
+    "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens",          # OpenAI / DeepSeek
+    "anthropic-ratelimit-requests-reset", "anthropic-ratelimit-tokens-reset",
+    "anthropic-ratelimit-input-tokens-reset", "anthropic-ratelimit-output-tokens-reset",
+]
+
+
+def retry_after_seconds(e: Exception) -> float | None:
+    """Server-requested delay from Retry-After(-ms) or rate-limit reset headers."""
+    response = getattr(e, "response", None) or getattr(e, "raw_response", None)
+    headers  = getattr(response, "headers", None)
+    if not headers:
+        return None
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if headers.get("retry-after"):
+        delay = _parse_reset(headers["retry-after"])
+        if delay is not None:
+            return max(0.0, delay)
+    resets = [_parse_reset(headers[h]) for h in RESET_HEADERS if headers.get(h)]
+    resets = [r for r in resets if r is not None]
+    return max(0.0, max(resets)) if resets else None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given (1-based) attempt."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Closed → open after repeated failures → half-open single probe → closed.
+    Every probe outcome settles the breaker: success or a 429 (the provider is
+    answering; the rate limiter paces it) closes it, any other failure reopens it.
+    """
+
+    def __init__(self, provider: str):
+        self.provider  = provider
+        self.state     = "closed"
+        self.failures  = 0
+        self.trips     = 0
+        self.opened_at = 0.0
+        self.down      = None   # reason string once the provider is given up on
+        self.probe_in_flight = False
+
+    async def before_call(self, metrics: dict) -> bool:
+        """Wait until a call may be sent; returns True if the caller is the half-open probe."""
+        while True:
+            if self.down:
+                raise CircuitOpenError(f"{self.provider} circuit open: {self.down}")
+            if self.state == "closed":
+                return False
+            if self.state == "open":
+                remaining = self.opened_at + BREAKER_COOLDOWN - monotonic()
+                if remaining <= 0:
+                    self.state, self.probe_in_flight = "half_open", True
+                    return True
+                wait = remaining
+            elif not self.probe_in_flight:
+                # Half-open but the last probe was abandoned: this caller probes
+                self.probe_in_flight = True
+                return True
+            else:
+                wait = 1.0                      # another caller's probe is in flight
+            metrics["breaker_wait_s"] += wait
+            await asyncio.sleep(wait)
+
+    def _open(self) -> None:
+        self.state, self.failures, self.opened_at = "open", 0, monotonic()
+        self.probe_in_flight = False
+        self.trips += 1
+        if self.trips >= BREAKER_MAX_TRIPS:
+            self.down = f"{self.trips} failed recovery probes"
+        print(f"    [breaker] {self.provider} circuit opened (trip {self.trips})")
+
+    def _close(self) -> None:
+        self.state, self.failures, self.trips = "closed", 0, 0
+        self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        self._close()
+
+    def record_failure(self, kind: str, status: int | None, probe: bool = False) -> None:
+        if kind == "fatal" and status in (401, 403, 404):
+            self.down = f"HTTP {status}"
+            self.probe_in_flight = False
+            return
+        if kind == "rate_limit":
+            if probe:
+                self._close()
+            return
+        if kind == "fatal" and not probe:
+            return
+        self.failures += 1
+        if probe or self.failures >= BREAKER_THRESHOLD:
+            self._open()
+
+    def abandon_probe(self) -> None:
+        """The probe ended without an outcome (e.g. cancelled); the next caller probes."""
+        self.probe_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_retry_metrics: dict[str, dict] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    if provider not in _breakers:
+        _breakers[provider] = CircuitBreaker(provider)
+    return _breakers[provider]
+
+
+def get_retry_metrics(provider: str) -> dict:
+    if provider not in _retry_metrics:
+        _retry_metrics[provider] = {
+            "attempts": 0, "succeeded": 0, "gave_up": 0,
+            "retries": {"rate_limit": 0, "server": 0, "timeout": 0},
+            "fatal": 0, "backoff_wait_s": 0.0, "breaker_wait_s": 0.0,
+        }
+    return _retry_metrics[provider]
+
+
+def retry_metrics() -> dict:
+    """Per-provider retry counts and time spent waiting, plus breaker state."""
+    return {
+        provider: {**m, "breaker_trips": get_breaker(provider).trips,
+                   "breaker_down": get_breaker(provider).down}
+        for provider, m in _retry_metrics.items()
+    }
+
+
+def print_retry_report() -> None:
+    if not _retry_metrics:
+        return
+    print("\nRetry metrics:")
+    for provider, m in retry_metrics().items():
+        r = m["retries"]
+        print(
+            f"  {MODEL_LABELS.get(provider, provider):<24} {m['attempts']:>5} attempts  "
+            f"{m['succeeded']:>5} ok  {m['gave_up']:>3} gave up  {m['fatal']:>3} fatal  "
+            f"retries 429={r['rate_limit']} 5xx={r['server']} timeout={r['timeout']}  "
+            f"backoff {m['backoff_wait_s']:.1f}s  breaker {m['breaker_wait_s']:.1f}s"
+            + (f"  [down: {m['breaker_down']}]" if m["breaker_down"] else "")
+        )
+
+
+async def run_with_retry(provider: str, tokens: int, call, what: str):
+    """
+    Await call() under the provider's rate limiter, circuit breaker and retry
+    policy. Returns the call's result, or None once retries are exhausted or
+    the error is fatal.
+    """
+    limiter = get_rate_limiter(provider)
+    breaker = get_breaker(provider)
+    metrics = get_retry_metrics(provider)
+
     for attempt in range(1, RETRY_ATTEMPTS + 1):
         try:
-            return caller(system_prompt, user_prompt, max_tokens)
+            probe = await breaker.before_call(metrics)
+        except CircuitOpenError as e:
+            metrics["gave_up"] += 1
+            print(f"    [{what}] skipped: {e}")
+            return None
+        try:
+            await limiter.acquire(tokens)
+            metrics["attempts"] += 1
+            result = await call()
         except Exception as e:
-            print(f"    [Attempt {attempt}/{RETRY_ATTEMPTS}] {model_id} failed: {e}")
-            if attempt < RETRY_ATTEMPTS:
-                sleep(RETRY_DELAY)
+            kind   = classify_error(e)
+            status = _status_code(e)
+            breaker.record_failure(kind, status, probe)
+            print(f"    [Attempt {attempt}/{RETRY_ATTEMPTS}] {what} failed ({kind}): {e}")
+            if kind == "fatal":
+                metrics["fatal"] += 1
+                return None
+            if attempt == RETRY_ATTEMPTS:
+                break
+            metrics["retries"][kind] += 1
+            delay = retry_after_seconds(e)
+            if delay is not None:
+                delay += random.uniform(0, 1)    # de-synchronise waiting callers
+                if kind == "rate_limit":
+                    limiter.block_for(delay)    # pause the whole provider, not just this call
+            else:
+                delay = backoff_delay(attempt)
+            metrics["backoff_wait_s"] += delay
+            await asyncio.sleep(delay)
+        except BaseException:
+            # Cancelled mid-call: do not leave other callers waiting on this probe
+            if probe:
+                breaker.abandon_probe()
+            raise
+        else:
+            breaker.record_success()
+            metrics["succeeded"] += 1
+            return result
+
+    metrics["gave_up"] += 1
     return None
 
 
+async def acall_cached(provider: str, model: str, system_prompt: str | None,
+                       user_prompt: str, max_tokens: int, tag: str | None,
+                       call, what: str, parse=None) -> tuple[str | None, dict | None]:
+    """
+    Serve a request from the shared LLM cache, or run it through run_with_retry()
+    and cache the response. Cache hits skip the rate limiter entirely.
+    Returns (raw, parse(raw)); parsed is None without a parser. With a parser,
+    only replies that parse are cached, and a cached reply that no longer
+    parses is dropped and re-requested.
+    """
+    cache = llm_cache.get_cache()
+    key   = llm_cache.cache_key(provider, model, system_prompt, user_prompt, max_tokens,
+                                MODELS[provider].get("temperature"), tag)
+    cached = cache.get(key)
+    if cached is not None:
+        if parse is None:
+            return cached, None
+        parsed = parse(cached)
+        if parsed:
+            return cached, parsed
+        cache.delete(key)
+    result = await run_with_retry(
+        provider, estimate_tokens(system_prompt or "", user_prompt, max_tokens), call, what,
+    )
+    parsed = parse(result) if result and parse is not None else None
+    if result and (parse is None or parsed):
+        cache.put(key, result)
+    return result, parsed
+
+
+async def acall_with_retry(model_id: str, system_prompt: str, user_prompt: str,
+                           max_tokens: int, tag: str | None = None,
+                           parse=None) -> tuple[str | None, dict | None]:
+    """
+    Call model_id through acall_model(), cached, rate limited, circuit broken and
+    retried per provider (see run_with_retry). `tag` separates repeated samples of
+    the same prompt (e.g. "run2"); `parse` validates the reply before it is cached
+    (see acall_cached).
+    """
+    return await acall_cached(
+        model_id, MODELS[model_id]["id"], system_prompt, user_prompt, max_tokens, tag,
+        lambda: acall_model(model_id, system_prompt, user_prompt, max_tokens),
+        model_id, parse,
+    )
+
+
 # =============================================================================
 # Instrument 3 prompt builder
 #
@@ -234,6 +815,13 @@ def parse_i3_response(raw: str) -> dict | None:
 #
 # Each instrument gets its own file: data/raw/instrument_N.json
 #
+# During collection, completed cells are appended to an append-only journal
+# (data/raw/instrument_N.journal.jsonl), one line per cell:
+#   {"keys": ["gpt-4o", "baseline", "1", "I1_Q1"], "value": {"raw": ..., "parsed": ...}}
+# load_instrument() replays the journal over the JSON file (crash recovery) and
+# compact_instrument() folds it back into the nested JSON the analysis scripts
+# read, then removes the journal. Per-call persistence is one appended line.
+#
 # I1 / I2 structure:
 # {
 #   "gpt-4o": {
@@ -272,18 +860,81 @@ def instrument_path(instrument_id: str) -> Path:
     return RAW_DIR / f"{instrument_id}.json"
 
 
+def journal_path(instrument_id: str) -> Path:
+    return RAW_DIR / f"{instrument_id}.journal.jsonl"
+
+
+def _set_path(data: dict, keys: list[str], value) -> None:
+    node = data
+    for k in keys[:-1]:
+        node = node.setdefault(k, {})
+    node[keys[-1]] = value
+
+
+def replay_journal(instrument_id: str, data: dict) -> int:
+    """Apply journaled cells to data in order. Returns the number of entries applied."""
+    path = journal_path(instrument_id)
+    if not path.exists():
+        return 0
+    applied = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn final line from a crash mid-write — the cell is simply re-collected
+                continue
+            _set_path(data, entry["keys"], entry["value"])
+            applied += 1
+    return applied
+
+
 def load_instrument(instrument_id: str) -> dict:
     path = instrument_path(instrument_id)
+    data = {}
     if path.exists():
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+            data = json.load(f)
+    n = replay_journal(instrument_id, data)
+    if n:
+        print(f"  [recover] {instrument_id}: replayed {n} journaled cell(s)")
+    return data
 
 
 def save_instrument(instrument_id: str, data: dict) -> None:
+    """Atomically rewrite the full instrument JSON (write to temp, then rename)."""
     RAW_DIR.mkdir(parents=True, exist_ok=True)
-    with open(instrument_path(instrument_id), "w", encoding="utf-8") as f:
+    path = instrument_path(instrument_id)
+    tmp  = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+_journal_handles: dict[str, object] = {}
+
+
+def append_journal(instrument_id: str, keys: list[str], value) -> None:
+    """Append one completed cell to the instrument's journal and flush it to the OS."""
+    f = _journal_handles.get(instrument_id)
+    if f is None:
+        RAW_DIR.mkdir(parents=True, exist_ok=True)
+        f = open(journal_path(instrument_id), "a", encoding="utf-8")
+        _journal_handles[instrument_id] = f
+    f.write(json.dumps({"keys": keys, "value": value}, ensure_ascii=False) + "\n")
+    f.flush()
+
+
+def compact_instrument(instrument_id: str, data: dict) -> None:
+    """
+    Rebuild instrument_N.json from the in-memory data (which already includes every
+    journaled cell) and drop the journal.
+    """
+    f = _journal_handles.pop(instrument_id, None)
+    if f is not None:
+        f.close()
+    save_instrument(instrument_id, data)
+    journal_path(instrument_id).unlink(missing_ok=True)
 
 
 def is_complete(data: dict, model: str, condition: str,
@@ -660,44 +1311,395 @@ def store_i5_response(data: dict, model: str, condition: str, run: int,
     data[model][condition][str(run)][question_id] = {"raw": raw, "parsed": parsed}
 
 
-def call_i5_extractor(prompt: str) -> str | None:
+I5_EXTRACTOR_SYSTEM = (
+    "You are a research assistant analyzing AI governance responses "
+    "to identify cited sources. Respond ONLY with valid JSON. "
+    "No preamble, no markdown fences."
+)
+
+
+async def acall_i5_extractor(prompt: str) -> tuple[str | None, dict | None]:
     """
-    Always calls Claude Sonnet for source extraction regardless of the original model.
-    Uses the shared retry pattern.
+    Always calls EXTRACTOR_MODEL for source extraction regardless of the original
+    model, through the extractor provider's limiter, breaker and retry policy.
+    Returns (raw, parsed); only parseable extractions are cached.
     """
-    for attempt in range(1, RETRY_ATTEMPTS + 1):
-        try:
-            resp = anthropic_client.messages.create(
-                model=EXTRACTOR_MODEL,
-                max_tokens=2048,
-                system=(
-                    "You are a research assistant analyzing AI governance responses "
-                    "to identify cited sources. Respond ONLY with valid JSON. "
-                    "No preamble, no markdown fences."
-                ),
-                messages=[{"role": "user", "content": prompt}],
-            )
-            return resp.content[0].text.strip()
-        except Exception as e:
-            print(f"    [Attempt {attempt}/{RETRY_ATTEMPTS}] I5 extractor failed: {e}")
-            if attempt < RETRY_ATTEMPTS:
-                sleep(RETRY_DELAY)
-    return None
+    async def call() -> str:
+        resp = await get_client("async_anthropic").messages.create(
+            model=EXTRACTOR_MODEL,
+            max_tokens=2048,
+            system=I5_EXTRACTOR_SYSTEM,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return resp.content[0].text.strip()
+
+    return await acall_cached(
+        EXTRACTOR_PROVIDER, EXTRACTOR_MODEL, I5_EXTRACTOR_SYSTEM, prompt, 2048, None,
+        call, "I5 extractor", parse_i5_response,
+    )
+
+
+# =============================================================================
+# Async collection engine
+#
+# Every pending (instrument, model, condition, run, question) cell becomes one
+# task. Tasks for different providers run concurrently; each provider is capped
+# at its MODELS "concurrency" in-flight requests and paced by its RateLimiter. Completed cells are stored and saved
+# from the event loop thread, so the per-instrument dicts need no locking.
+#
+# Cell dict:
+# {
+#   "instrument":    "instrument_1",
+#   "provider":      "gpt-4o",          <- MODELS key whose slot the call uses
+#   "model":         "gpt-4o",          <- model whose data cell is filled (I1–I3, I5)
+#   "condition":     "baseline",
+#   "run":           1,
+#   "question_id":   "I1_Q1",
+#   "pair_id":       None,              <- I4 only
+#   "system_prompt": "...",
+#   "prompt":        "...",
+#   "max_tokens":    2048,
+#   "label":         "gpt-4o | baseline | run 1 | I1_Q1",
+# }
+# =============================================================================
+
+def _cell(instrument_id: str, provider: str, model: str | None, condition: str | None,
+          run: int | None, question_id: str, system_prompt: str | None, prompt: str,
+          max_tokens: int, label: str, pair_id: str | None = None) -> dict:
+    return {
+        "instrument":    instrument_id,
+        "provider":      provider,
+        "model":         model,
+        "condition":     condition,
+        "run":           run,
+        "question_id":   question_id,
+        "pair_id":       pair_id,
+        "system_prompt": system_prompt,
+        "prompt":        prompt,
+        "max_tokens":    max_tokens,
+        "label":         label,
+    }
+
+
+def build_cells(instrument_id: str, instruments_data: dict, pairs: list[dict],
+                data: dict) -> tuple[list[dict], int]:
+    """
+    Return (pending cells, skipped count) for one instrument.
+    Skip-if-complete semantics match the is_complete* helpers; I4/I5 cells
+    whose source response is missing are skipped as well.
+    """
+    instrument    = instruments_data["instruments"][instrument_id]
+    conditions    = instruments_data["conditions"]
+    models        = instruments_data["models"]
+    runs_per_cond = instruments_data["runs_per_condition"]
+    stored        = data[instrument_id]
+
+    cells   = []
+    skipped = 0
+
+    # ---- Instrument 5: epistemic source extraction via Claude Sonnet ----
+    if instrument_id == "instrument_5":
+        i1_src = data["instrument_1"]
+        i2_src = data["instrument_2"]
+        src_map = {
+            "I1_Q1": i1_src, "I1_Q2": i1_src, "I1_Q3": i1_src,
+            "I2_S1": i2_src, "I2_S2": i2_src, "I2_S3": i2_src,
+        }
+        for model_id in models:
+            for condition_id in conditions:
+                if condition_id not in instrument["conditions"]:
+                    continue
+                for run in range(1, runs_per_cond + 1):
+                    for q_id in I5_SOURCE_QUESTIONS:
+                        label = f"{model_id} | {condition_id} | run {run} | {q_id}"
+                        if is_complete_i5(stored, model_id, condition_id, run, q_id):
+                            skipped += 1
+                            print(f"  [skip] {label}")
+                            continue
+
+                        # Fetch the original response from I1 or I2.
+                        # I1 new format stores {raw, parsed} dicts — extract text.
+                        src_val = (
+                            src_map[q_id]
+                            .get(model_id, {})
+                            .get(condition_id, {})
+                            .get(str(run), {})
+                            .get(q_id, "")
+                        )
+                        if isinstance(src_val, dict):
+                            _p = src_val.get("parsed") or {}
+                            src_response = _p.get("response") or src_val.get("raw") or ""
+                        else:
+                            src_response = src_val or ""
+
+                        if not src_response:
+                            print(f"  [skip] {label} — source response not found")
+                            skipped += 1
+                            continue
+
+                        cells.append(_cell(
+                            instrument_id, EXTRACTOR_PROVIDER, model_id, condition_id,
+                            run, q_id, I5_EXTRACTOR_SYSTEM,
+                            build_i5_prompt(q_id, src_response), 2048, label,
+                        ))
+
+    # ---- Instrument 4: peer evaluation, one call per pair × question ----
+    elif instrument_id == "instrument_4":
+        system_prompt = conditions["baseline"]["system_prompt"]
+        i1_data = data["instrument_1"]
+        i2_data = data["instrument_2"]
+
+        for pair in pairs:
+            pair_id   = pair["pair_id"]
+            evaluator = pair["evaluator"]
+            evaluatee = pair["evaluatee"]
+
+            for q_id in pair["source_questions"]:
+                label = (f"{pair_id} ({MODEL_LABELS.get(evaluator, evaluator)} evaluates "
+                         f"{MODEL_LABELS.get(evaluatee, evaluatee)}) | {q_id}")
+                if is_complete_i4(stored, pair_id, q_id):
+                    skipped += 1
+                    print(f"  [skip] {label}")
+                    continue
+
+                # Fetch evaluatee's run 1 baseline response
+                src = i1_data if q_id.startswith("I1") else i2_data
+                evaluatee_response = src.get(evaluatee, {}).get(
+                    "baseline", {}).get("1", {}).get(q_id, "")
+
+                if not evaluatee_response:
+                    print(f"  [skip] {label} — evaluatee response not found")
+                    skipped += 1
+                    continue
+
+                prompt = build_i4_prompt(q_id, ALL_QUESTION_TEXT[q_id],
+                                         evaluatee_response, instrument)
+                cells.append(_cell(
+                    instrument_id, evaluator, None, "baseline", None, q_id,
+                    system_prompt, prompt, MAX_TOKENS_JSON, label, pair_id=pair_id,
+                ))
+
+    # ---- Instrument 3: one bundled call per run ----
+    elif instrument_id == "instrument_3":
+        i3_prompt = build_i3_prompt(instrument)
+        for model_id in models:
+            for condition_id, condition in conditions.items():
+                if condition_id not in instrument["conditions"]:
+                    continue
+                for run in range(1, runs_per_cond + 1):
+                    label = f"{model_id} | {condition_id} | run {run} | all scenarios"
+                    if is_complete_i3(stored, model_id, condition_id, run):
+                        skipped += 1
+                        print(f"  [skip] {label}")
+                        continue
+                    cells.append(_cell(
+                        instrument_id, model_id, model_id, condition_id, run, "all",
+                        condition["system_prompt"], i3_prompt, MAX_TOKENS_JSON, label,
+                    ))
+
+    # ---- Instrument 1 (JSON + sources) / Instrument 2 (free text) ----
+    else:
+        is_done    = is_complete_i1 if instrument_id == "instrument_1" else is_complete
+        max_tokens = MAX_TOKENS_JSON if instrument_id == "instrument_1" else MAX_TOKENS_OPEN
+        for model_id in models:
+            for condition_id, condition in conditions.items():
+                if condition_id not in instrument["conditions"]:
+                    continue
+                for run in range(1, runs_per_cond + 1):
+                    for question in instrument["questions"]:
+                        q_id  = question["id"]
+                        label = f"{model_id} | {condition_id} | run {run} | {q_id}"
+                        if is_done(stored, model_id, condition_id, run, q_id):
+                            skipped += 1
+                            print(f"  [skip] {label}")
+                            continue
+                        prompt = (build_i1_prompt(question)
+                                  if instrument_id == "instrument_1" else question["text"])
+                        cells.append(_cell(
+                            instrument_id, model_id, model_id, condition_id, run, q_id,
+                            condition["system_prompt"], prompt, max_tokens, label,
+                        ))
+
+    return cells, skipped
+
+
+async def collect_cell(cell: dict) -> tuple[str | None, dict | None]:
+    """Make the model call(s) for one cell and return (raw, parsed)."""
+    instrument_id = cell["instrument"]
+
+    if instrument_id == "instrument_5":
+        return await acall_i5_extractor(cell["prompt"])
+
+    # Independent runs of the same prompt must not share a cached response
+    tag = f"run{cell['run']}" if cell["run"] is not None else None
+
+    if instrument_id == "instrument_1":
+        # Re-query when the JSON is unparseable, as the sequential loop did;
+        # each re-query gets its own cache entry so replays follow the same path
+        raw, parsed = None, None
+        for parse_attempt in range(1, PARSE_ATTEMPTS + 1):
+            attempt_tag = tag if parse_attempt == 1 else f"{tag}/parse{parse_attempt}"
+            raw, parsed = await acall_with_retry(cell["provider"], cell["system_prompt"],
+                                                 cell["prompt"], cell["max_tokens"],
+                                                 attempt_tag, parse_i1_response)
+            if parsed:
+                break
+            if not raw:
+                break    # the call itself failed; retries were already spent
+            if parse_attempt < PARSE_ATTEMPTS:
+                print(f"    [i1-retry {parse_attempt}/{PARSE_ATTEMPTS}] {cell['label']}"
+                      f" — JSON still invalid, re-querying")
+        return raw, parsed
+
+    parse = {"instrument_3": parse_i3_response,
+             "instrument_4": parse_i4_response}.get(instrument_id)
+    return await acall_with_retry(cell["provider"], cell["system_prompt"],
+                                  cell["prompt"], cell["max_tokens"], tag, parse)
+
+
+def cell_keys(cell: dict) -> list[str]:
+    """Path of the cell inside its instrument dict (matches the store_* helpers)."""
+    if cell["instrument"] == "instrument_4":
+        return [cell["pair_id"], cell["question_id"]]
+    keys = [cell["model"], cell["condition"], str(cell["run"])]
+    if cell["instrument"] != "instrument_3":
+        keys.append(cell["question_id"])
+    return keys
+
+
+def store_cell(data: dict, cell: dict, raw: str | None, parsed: dict | None) -> None:
+    """Write one collected cell into its instrument dict via the store_* helpers."""
+    instrument_id = cell["instrument"]
+    stored = data[instrument_id]
+    model, condition, run, q_id = (cell["model"], cell["condition"],
+                                   cell["run"], cell["question_id"])
+    if instrument_id == "instrument_1":
+        store_i1_response(stored, model, condition, run, q_id, raw, parsed)
+    elif instrument_id == "instrument_3":
+        store_i3_response(stored, model, condition, run, raw, parsed)
+    elif instrument_id == "instrument_4":
+        store_i4_response(stored, cell["pair_id"], q_id, raw, parsed)
+    elif instrument_id == "instrument_5":
+        store_i5_response(stored, model, condition, run, q_id, raw, parsed)
+    else:
+        store_response(stored, model, condition, run, q_id, raw)
+
+
+async def run_cells(cells: list[dict], data: dict) -> int:
+    """Collect all cells concurrently, bounded per provider. Returns cells completed."""
+    semaphores = {
+        provider: asyncio.Semaphore(
+            MODELS.get(provider, {}).get("concurrency", DEFAULT_CONCURRENCY)
+        )
+        for provider in {c["provider"] for c in cells}
+    }
+    completed = 0
+
+    async def worker(cell: dict) -> None:
+        nonlocal completed
+        async with semaphores[cell["provider"]]:
+            raw, parsed = await collect_cell(cell)
+            store_cell(data, cell, raw, parsed)
+
+            keys  = cell_keys(cell)
+            value = data[cell["instrument"]]
+            for k in keys:
+                value = value[k]
+            append_journal(cell["instrument"], keys, value)
+            completed += 1
+
+            if cell["instrument"] == "instrument_2":
+                status = "ok" if raw else "FAILED"
+            else:
+                status = "ok" if parsed else ("raw only" if raw else "FAILED")
+            print(f"  [call] {cell['instrument']} | {cell['label']} ... {status}")
+
+    await asyncio.gather(*(worker(c) for c in cells))
+    return completed
+
+
+async def collect_all(instruments_data: dict, pairs: list[dict],
+                      dry_run: bool = False) -> tuple[int, int]:
+    """
+    Collect every pending cell of ACTIVE_INSTRUMENTS. Independent instruments are
+    collected together in one concurrent phase; DEPENDENT_INSTRUMENTS follow in a
+    second phase so they see the freshly collected I1/I2 responses.
+    With dry_run, pending calls are counted per provider and nothing is sent or
+    written (dependent instruments only see I1/I2 responses already on disk).
+    Returns (completed, skipped).
+    """
+    needed = set(ACTIVE_INSTRUMENTS)
+    if any(i_id in DEPENDENT_INSTRUMENTS for i_id in ACTIVE_INSTRUMENTS):
+        needed |= {"instrument_1", "instrument_2"}
+    data = {i_id: load_instrument(i_id) for i_id in needed}
+
+    phases = [
+        [i_id for i_id in ACTIVE_INSTRUMENTS if i_id not in DEPENDENT_INSTRUMENTS],
+        [i_id for i_id in ACTIVE_INSTRUMENTS if i_id in DEPENDENT_INSTRUMENTS],
+    ]
+
+    completed = 0
+    skipped   = 0
+    try:
+        for phase in phases:
+            if not phase:
+                continue
+            cells = []
+            for instrument_id in phase:
+                instrument = instruments_data["instruments"][instrument_id]
+                print(f"{'='*60}")
+                print(f"Instrument: {instrument_id} — {instrument['label']}")
+                print(f"{'='*60}")
+                i_cells, i_skipped = build_cells(instrument_id, instruments_data, pairs, data)
+                print(f"  {len(i_cells)} pending, {i_skipped} skipped\n")
+                cells   += i_cells
+                skipped += i_skipped
+            if dry_run:
+                per_provider = {}
+                for cell in cells:
+                    per_provider[cell["provider"]] = per_provider.get(cell["provider"], 0) + 1
+                for provider, n in sorted(per_provider.items()):
+                    print(f"  [dry-run] {MODEL_LABELS.get(provider, provider)}: {n} call(s)")
+                continue
+            completed += await run_cells(cells, data)
+    finally:
+        # Fold journals back into the nested JSON files, also on Ctrl-C / errors
+        for instrument_id, i_data in ([] if dry_run else data.items()):
+            if instrument_id in _journal_handles or journal_path(instrument_id).exists():
+                compact_instrument(instrument_id, i_data)
+
+    return completed, skipped
 
 
 # =============================================================================
 # Main
 # =============================================================================
 
-if __name__ == "__main__":
+def run_collection(instruments: list[str] | None = None, models: list[str] | None = None,
+                   dry_run: bool = False) -> None:
+    """
+    Collect the given instruments (default ACTIVE_INSTRUMENTS) for the given
+    models (default: every model in instruments.json). I4 pairs are limited to
+    the selected evaluators, since the evaluator is the model being called.
+    """
+    global ACTIVE_INSTRUMENTS
+    if instruments:
+        ACTIVE_INSTRUMENTS = list(instruments)
+
     with open(INSTRUMENTS_FILE, "r", encoding="utf-8") as f:
         instruments_data = json.load(f)
 
     with open(PEER_EVAL_FILE, "r", encoding="utf-8") as f:
         peer_eval_data = json.load(f)
 
-    pairs         = peer_eval_data["pairs"]
-    conditions    = instruments_data["conditions"]
+    pairs = peer_eval_data["pairs"]
+    if models:
+        unknown = set(models) - set(instruments_data["models"])
+        if unknown:
+            raise ValueError(f"Unknown model(s): {sorted(unknown)}")
+        instruments_data["models"] = [m for m in instruments_data["models"] if m in models]
+        pairs = [p for p in pairs if p["evaluator"] in models]
+
     models        = instruments_data["models"]
     runs_per_cond = instruments_data["runs_per_condition"]
 
@@ -731,253 +1733,37 @@ if __name__ == "__main__":
             * n_questions
         )
 
-    completed = 0
-    skipped   = 0
-
-    print(f"Starting collection — {total} total calls across {len(ACTIVE_INSTRUMENTS)} instrument(s).")
+    print(f"Starting collection — {total} total calls across {len(ACTIVE_INSTRUMENTS)} "
+          f"instrument(s), {len(models)} model(s).")
     print(f"Output directory: {RAW_DIR}\n")
 
-    for instrument_id in ACTIVE_INSTRUMENTS:
-        instrument = instruments_data["instruments"][instrument_id]
-        data = load_instrument(instrument_id)
-
-        print(f"{'='*60}")
-        print(f"Instrument: {instrument_id} — {instrument['label']}")
-        print(f"{'='*60}")
-
-        # ---- Instrument 5: epistemic source extraction via Claude Sonnet ----
-        if instrument_id == "instrument_5":
-            # Load source data from I1 and I2
-            i1_src = load_instrument("instrument_1")
-            i2_src = load_instrument("instrument_2")
-            src_map = {
-                "I1_Q1": i1_src, "I1_Q2": i1_src, "I1_Q3": i1_src,
-                "I2_S1": i2_src, "I2_S2": i2_src, "I2_S3": i2_src,
-            }
-
-            for model_id in models:
-                for condition_id, condition in conditions.items():
-                    if condition_id not in instrument["conditions"]:
-                        continue
-
-                    for run in range(1, runs_per_cond + 1):
-                        for q_id in I5_SOURCE_QUESTIONS:
-                            if is_complete_i5(data, model_id, condition_id, run, q_id):
-                                skipped += 1
-                                print(f"  [skip] {model_id} | {condition_id} | run {run} | {q_id}")
-                                continue
-
-                            # Fetch the original response from I1 or I2.
-                            # I1 new format stores {raw, parsed} dicts — extract text.
-                            src_val = (
-                                src_map[q_id]
-                                .get(model_id, {})
-                                .get(condition_id, {})
-                                .get(str(run), {})
-                                .get(q_id, "")
-                            )
-                            if isinstance(src_val, dict):
-                                _p = src_val.get("parsed") or {}
-                                src_response = _p.get("response") or src_val.get("raw") or ""
-                            else:
-                                src_response = src_val or ""
-
-                            if not src_response:
-                                print(
-                                    f"  [skip] {model_id} | {condition_id} | run {run} | {q_id}"
-                                    f" — source response not found"
-                                )
-                                skipped += 1
-                                continue
-
-                            prompt = build_i5_prompt(q_id, src_response)
-
-                            print(
-                                f"  [call] {model_id} | {condition_id} | run {run} | {q_id} ... ",
-                                end="", flush=True,
-                            )
-
-                            raw    = call_i5_extractor(prompt)
-                            parsed = parse_i5_response(raw) if raw else None
-
-                            store_i5_response(data, model_id, condition_id, run, q_id, raw, parsed)
-                            save_instrument(instrument_id, data)
-
-                            status = "ok" if parsed else ("raw only" if raw else "FAILED")
-                            print(status)
-                            completed += 1
-                            sleep(CALL_DELAY)
-
-        # ---- Instrument 4: peer evaluation, one call per pair × question ----
-        elif instrument_id == "instrument_4":
-            system_prompt = conditions["baseline"]["system_prompt"]
-
-            # Load I1 and I2 raw data to pull evaluatee responses
-            i1_data = load_instrument("instrument_1")
-            i2_data = load_instrument("instrument_2")
-
-            for pair in pairs:
-                pair_id   = pair["pair_id"]
-                evaluator = pair["evaluator"]
-                evaluatee = pair["evaluatee"]
-                questions = pair["source_questions"]
-
-                print(f"  Pair {pair_id}: {MODEL_LABELS.get(evaluator, evaluator)}"
-                      f" evaluates {MODEL_LABELS.get(evaluatee, evaluatee)}")
-
-                for q_id in questions:
-                    if is_complete_i4(data, pair_id, q_id):
-                        skipped += 1
-                        print(f"    [skip] {pair_id} | {q_id}")
-                        continue
-
-                    # Fetch evaluatee's run 1 baseline response
-                    if q_id.startswith("I1"):
-                        evaluatee_response = i1_data.get(evaluatee, {}).get(
-                            "baseline", {}).get("1", {}).get(q_id, "")
-                    else:
-                        evaluatee_response = i2_data.get(evaluatee, {}).get(
-                            "baseline", {}).get("1", {}).get(q_id, "")
-
-                    if not evaluatee_response:
-                        print(f"    [skip] {pair_id} | {q_id} — evaluatee response not found")
-                        skipped += 1
-                        continue
-
-                    question_text = ALL_QUESTION_TEXT[q_id]
-                    prompt = build_i4_prompt(q_id, question_text,
-                                             evaluatee_response, instrument)
-
-                    print(f"    [call] {pair_id} | {q_id} ... ", end="", flush=True)
-
-                    raw    = call_with_retry(evaluator, system_prompt, prompt,
-                                             MAX_TOKENS_JSON)
-                    parsed = parse_i4_response(raw) if raw else None
-
-                    store_i4_response(data, pair_id, q_id, raw, parsed)
-                    save_instrument(instrument_id, data)
+    if dry_run:
+        asyncio.run(collect_all(instruments_data, pairs, dry_run=True))
+        return
 
-                    status = "ok" if parsed else ("raw only" if raw else "FAILED")
-                    print(status)
-                    completed += 1
-                    sleep(CALL_DELAY)
+    started = perf_counter()
+    completed, skipped = asyncio.run(collect_all(instruments_data, pairs))
 
-        # ---- Instrument 3: one bundled call per run ----
-        elif instrument_id == "instrument_3":
-            i3_prompt = build_i3_prompt(instrument)
-
-            for model_id in models:
-                for condition_id, condition in conditions.items():
-                    if condition_id not in instrument["conditions"]:
-                        continue
-
-                    system_prompt = condition["system_prompt"]
-
-                    for run in range(1, runs_per_cond + 1):
-                        if is_complete_i3(data, model_id, condition_id, run):
-                            skipped += 1
-                            print(f"  [skip] {model_id} | {condition_id} | run {run} | all scenarios")
-                            continue
-
-                        print(
-                            f"  [call] {model_id} | {condition_id} | run {run} | all scenarios ... ",
-                            end="", flush=True
-                        )
-
-                        raw    = call_with_retry(model_id, system_prompt, i3_prompt,
-                                                 MAX_TOKENS_JSON)
-                        parsed = parse_i3_response(raw) if raw else None
-
-                        store_i3_response(data, model_id, condition_id, run, raw, parsed)
-                        save_instrument(instrument_id, data)
-
-                        status = "ok" if parsed else ("raw only" if raw else "FAILED")
-                        print(status)
-                        completed += 1
-                        sleep(CALL_DELAY)
-
-        # ---- Instrument 1: JSON-forced, one call per question (response + sources) ----
-        elif instrument_id == "instrument_1":
-            for model_id in models:
-                for condition_id, condition in conditions.items():
-                    if condition_id not in instrument["conditions"]:
-                        continue
-
-                    system_prompt = condition["system_prompt"]
-
-                    for run in range(1, runs_per_cond + 1):
-                        for question in instrument["questions"]:
-                            q_id = question["id"]
-
-                            if is_complete_i1(data, model_id, condition_id, run, q_id):
-                                skipped += 1
-                                print(f"  [skip] {model_id} | {condition_id} | run {run} | {q_id}")
-                                continue
-
-                            print(
-                                f"  [call] {model_id} | {condition_id} | run {run} | {q_id} ... ",
-                                end="", flush=True
-                            )
-
-                            prompt = build_i1_prompt(question)
-                            raw, parsed = None, None
-                            for parse_attempt in range(1, RETRY_ATTEMPTS + 1):
-                                raw    = call_with_retry(model_id, system_prompt,
-                                                         prompt, MAX_TOKENS_JSON)
-                                parsed = parse_i1_response(raw) if raw else None
-                                if parsed:
-                                    break
-                                if parse_attempt < RETRY_ATTEMPTS:
-                                    print(
-                                        f"\n    [i1-retry {parse_attempt}/{RETRY_ATTEMPTS}]"
-                                        f" JSON still invalid — re-querying... ",
-                                        end="", flush=True,
-                                    )
-                                    sleep(RETRY_DELAY)
-
-                            store_i1_response(data, model_id, condition_id, run, q_id, raw, parsed)
-                            save_instrument(instrument_id, data)
-
-                            status = "ok" if parsed else ("raw only" if raw else "FAILED")
-                            print(status)
-                            completed += 1
-                            sleep(CALL_DELAY)
-
-        # ---- Instrument 2: free-text response per question ----
-        else:
-            for model_id in models:
-                for condition_id, condition in conditions.items():
-                    if condition_id not in instrument["conditions"]:
-                        continue
-
-                    system_prompt = condition["system_prompt"]
-
-                    for run in range(1, runs_per_cond + 1):
-                        for question in instrument["questions"]:
-                            q_id = question["id"]
-
-                            if is_complete(data, model_id, condition_id, run, q_id):
-                                skipped += 1
-                                print(f"  [skip] {model_id} | {condition_id} | run {run} | {q_id}")
-                                continue
-
-                            print(
-                                f"  [call] {model_id} | {condition_id} | run {run} | {q_id} ... ",
-                                end="", flush=True
-                            )
-
-                            response = call_with_retry(model_id, system_prompt,
-                                                       question["text"], MAX_TOKENS_OPEN)
-
-                            store_response(data, model_id, condition_id, run, q_id, response)
-                            save_instrument(instrument_id, data)
-
-                            print("ok" if response else "FAILED")
-                            completed += 1
-                            sleep(CALL_DELAY)
-
-    print(f"\nDone. {completed} new responses collected, {skipped} already complete.")
+    print(f"\nDone. {completed} new responses collected, {skipped} already complete "
+          f"({perf_counter() - started:.0f}s).")
     print(f"Files saved to {RAW_DIR}/")
     for i_id in ACTIVE_INSTRUMENTS:
         p = instrument_path(i_id)
-        print(f"  {p}")
\ No newline at end of file
+        print(f"  {p}")
+    print_rate_limit_report()
+    print_retry_report()
+    llm_cache.print_cache_report()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Collect LLM responses for the active instruments into data/raw/.")
+    parser.add_argument("--instruments", nargs="+", metavar="ID",
+                        choices=[f"instrument_{i}" for i in range(1, 6)],
+                        help="instruments to collect (default: ACTIVE_INSTRUMENTS)")
+    parser.add_argument("--models", nargs="+", metavar="MODEL", choices=list(MODELS),
+                        help="models to collect (default: all in instruments.json)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="list pending calls per provider without contacting any API")
+    args = parser.parse_args()
+    run_collection(args.instruments, args.models, dry_run=args.dry_run)
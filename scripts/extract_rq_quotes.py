@@ -1,9 +1,10 @@
 """
 extract_rq_quotes.py
 
-Reads instrument_1.json and instrument_5.json and generates a structured
-Markdown document (results/rq_quotations.md) with quotations and source
-analysis addressing RQ1 and RQ2.
+Reads instrument_1.json and instrument_5.json (through the shared tables in
+response_tables.py) and generates a structured Markdown document
+(results/rq_quotations.md) with quotations and source analysis addressing
+RQ1 and RQ2.
 
 RQ1: How do LLMs define legal certainty, accountability, and enforceability?
      (H1: surface-level competence; cross-model convergence)
@@ -15,11 +16,12 @@ Run from the project root:
     python scripts/extract_rq_quotes.py
 """
 
-import json
 from collections import Counter
 from pathlib import Path
 
-RAW_DIR    = Path("data/raw")
+from response_tables import InstrumentView, load_tables
+
+RAW_DIR     = Path("data/raw")
 RESULTS_DIR = Path("results")
 
 MODEL_LABELS = {
@@ -44,51 +46,23 @@ TIER_LABELS = {
 }
 
 
-def load_json(name: str) -> dict | None:
-    p = RAW_DIR / f"{name}.json"
-    if p.exists():
-        with open(p, encoding="utf-8") as f:
-            return json.load(f)
-    return None
+def get_run1_response(i1_data: InstrumentView, model: str, condition: str, q_id: str) -> str:
+    return i1_data.text(model, condition, q_id, run=1)
 
 
-def get_run1_response(i1_data: dict, model: str, condition: str, q_id: str) -> str:
-    val = i1_data.get(model, {}).get(condition, {}).get("1", {}).get(q_id, {})
-    if isinstance(val, dict):
-        parsed = val.get("parsed") or {}
-        return parsed.get("response") or val.get("raw") or ""
-    return str(val) if val else ""
+def get_i1_sources(i1_data: InstrumentView, model: str,
+                   condition: str = "baseline") -> list[dict]:
+    return i1_data.source_records(model, [condition])
 
 
-def get_i1_sources(i1_data: dict, model: str, condition: str = "baseline") -> list[dict]:
-    sources = []
-    for run_str, qs in i1_data.get(model, {}).get(condition, {}).items():
-        if not isinstance(qs, dict):
-            continue
-        for q_id, val in qs.items():
-            if not isinstance(val, dict):
-                continue
-            parsed = val.get("parsed") or {}
-            for s in parsed.get("sources", []):
-                if isinstance(s, dict):
-                    sources.append({**s, "_question": q_id})
-    return sources
-
-
-def get_i5_sources(i5_data: dict, model: str) -> list[dict]:
-    sources = []
-    for cond in i5_data.get(model, {}):
-        for run_str, qs in i5_data[model][cond].items():
-            if not isinstance(qs, dict):
-                continue
-            for q_id, q_data in qs.items():
-                if not isinstance(q_data, dict):
-                    continue
-                parsed = q_data.get("parsed") or {}
-                for s in parsed.get("sources", []):
-                    if isinstance(s, dict):
-                        sources.append({**s, "_question": q_id, "_condition": cond})
-    return sources
+def get_i5_sources(i5_data: InstrumentView, model: str) -> list[dict]:
+    return i5_data.source_records(model)
+
+
+def i5_jurisdiction_keys(i5_data: InstrumentView):
+    """Upper-cased jurisdiction per source-index row, blank → UNSPECIFIED."""
+    juris = i5_data.source_index.df["jurisdiction"].astype(object).fillna("")
+    return juris.replace("", "unspecified").str.upper().to_numpy()
 
 
 def wrap(text: str, width: int = 90) -> str:
@@ -106,8 +80,8 @@ def wrap(text: str, width: int = 90) -> str:
     return "\n> ".join(lines)
 
 
-def build_doc(i1_data: dict, i5_data: dict | None) -> str:
-    models = list(i1_data.keys())
+def build_doc(i1_data: InstrumentView, i5_data: InstrumentView | None) -> str:
+    models = i1_data.models
     lines = []
 
     # =========================================================================
@@ -285,15 +259,19 @@ def build_doc(i1_data: dict, i5_data: dict | None) -> str:
             "|-------|-------|-----------|-------------|-----------------|-----------------|",
         ]
 
-        for model in models:
-            label   = MODEL_LABELS.get(model, model)
-            sources = get_i5_sources(i5_data, model)
-            total   = len(sources) or 1
+        index     = i5_data.source_index
+        totals    = index.totals(models)
+        tiers     = index.counts("tier", models).reindex(columns=[1, 2, 3, 4], fill_value=0)
+        unver_all = index.counts(~index.df["verifiable"].fillna(True).astype(bool), models)
+        juris     = i5_jurisdiction_keys(i5_data)
 
-            tier1  = sum(1 for s in sources if s.get("legitimacy_tier") == 1)
-            tier34 = sum(1 for s in sources if s.get("legitimacy_tier") in [3, 4])
-            unver  = sum(1 for s in sources if not s.get("verifiable", True))
-            by_j   = Counter((s.get("jurisdiction") or "unspecified").upper() for s in sources)
+        for model in models:
+            label  = MODEL_LABELS.get(model, model)
+            total  = int(totals[model]) or 1
+            tier1  = int(tiers.at[model, 1])
+            tier34 = int(tiers.at[model, 3] + tiers.at[model, 4])
+            unver  = int(unver_all.at[model, True]) if True in unver_all.columns else 0
+            by_j   = Counter(juris[index.positions(model)])
             top_j  = by_j.most_common(1)[0][0] if by_j else "—"
 
             lines.append(
@@ -339,9 +317,8 @@ def build_doc(i1_data: dict, i5_data: dict | None) -> str:
         ]
         for model in models:
             label   = MODEL_LABELS.get(model, model)
-            sources = get_i5_sources(i5_data, model)
-            total   = len(sources) or 1
-            by_j    = Counter((s.get("jurisdiction") or "unspecified").upper() for s in sources)
+            total   = int(totals[model]) or 1
+            by_j    = Counter(juris[index.positions(model)])
 
             def pct(j):
                 known = {"EU", "US", "UN", "UK"}
@@ -384,10 +361,11 @@ SOURCE_TYPE_TO_TIER = {
 
 
 if __name__ == "__main__":
-    i1_data = load_json("instrument_1")
-    i5_data = load_json("instrument_5")
+    tables  = load_tables(RAW_DIR)
+    i1_data = tables.view("instrument_1")
+    i5_data = tables.view("instrument_5") or None
 
-    if i1_data is None:
+    if not i1_data:
         print("[error] data/raw/instrument_1.json not found.")
         raise SystemExit(1)
 
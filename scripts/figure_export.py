@@ -0,0 +1,311 @@
+"""
+figure_export.py
+
+Writes plotly figures to disk for plot_response_results.py.
+
+FigureExporter queues figures and renders them in a pool of worker processes.
+Each figure travels as its JSON spec. Static image export (Kaleido, which
+drives a headless Chromium) dominates plotting time. Each worker therefore
+opens one Kaleido session when it starts and reuses it for every image it
+writes, instead of paying browser startup per file. With workers <= 1 the same
+rendering runs in-process.
+
+Formats are any of FORMATS; an empty list writes nothing (compute-only runs).
+HTML pages load one shared plotly.js (PLOTLYJS_FILE in the asset directory)
+instead of each embedding its own ~3.5 MB copy. "json" writes the figure spec
+to specs/<name>.json next to the figure; write_index() builds a single-page
+report from those specs that only draws a figure when it scrolls into view.
+The report loads each spec as a specs/<name>.js script rather than fetching
+the JSON, so it also works opened straight from disk (file://).
+"""
+
+import html
+import json
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import plotly.io as pio
+
+FORMATS       = ("html", "json", "png", "svg")
+IMAGE_SCALE   = 2
+PLOTLYJS_FILE = "plotly.min.js"
+INDEX_FILE    = "index.html"
+
+_kaleido_server = False
+
+
+def start_kaleido_session() -> None:
+    """Keep one Kaleido browser alive for this process (kaleido >= 1.0).
+
+    Older kaleido releases already keep their subprocess alive between calls,
+    so there is nothing to start for them.
+    """
+    global _kaleido_server
+    if _kaleido_server:
+        return
+    try:
+        import kaleido
+    except ImportError:
+        return
+    if hasattr(kaleido, "start_sync_server"):
+        kaleido.start_sync_server(silence_warnings=True)
+        _kaleido_server = True
+
+
+def stop_kaleido_session() -> None:
+    global _kaleido_server
+    if _kaleido_server:
+        import kaleido
+        kaleido.stop_sync_server(silence_warnings=True)
+        _kaleido_server = False
+
+
+def output_path(path_stem: Path, fmt: str) -> Path:
+    """Where a figure saved as path_stem is written in format fmt."""
+    if fmt == "json":
+        return path_stem.parent / "specs" / f"{path_stem.name}.json"
+    return path_stem.with_suffix(f".{fmt}")
+
+
+def write_plotlyjs(asset_dir: Path) -> Path:
+    """Write the bundled plotly.js to asset_dir unless an identical copy is there."""
+    from plotly.offline import get_plotlyjs
+    path = asset_dir / PLOTLYJS_FILE
+    js   = get_plotlyjs()
+    if not path.exists() or path.stat().st_size != len(js.encode("utf-8")) \
+            or path.read_text(encoding="utf-8") != js:
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(js, encoding="utf-8")
+    return path
+
+
+def render_spec(spec: str, path_stem: str, formats: list[str],
+                plotlyjs: str | None = None) -> list[str]:
+    """
+    Write one figure spec as path_stem.<fmt> for each format; returns the paths.
+    HTML references the plotly.js file at `plotlyjs` when given, else embeds it.
+    """
+    fig  = None
+    stem = Path(path_stem)
+    written = []
+    for fmt in formats:
+        path = output_path(stem, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "json":
+            path.write_text(spec, encoding="utf-8")
+            written.append(str(path))
+            continue
+        if fig is None:
+            fig = pio.from_json(spec, skip_invalid=True)
+        if fmt == "html":
+            # A path ending in .js makes plotly emit <script src=...> instead of inlining
+            include = Path(os.path.relpath(plotlyjs, path.parent)).as_posix() if plotlyjs else True
+            fig.write_html(str(path), include_plotlyjs=include)
+        else:
+            start_kaleido_session()
+            fig.write_image(str(path), format=fmt, scale=IMAGE_SCALE)
+        written.append(str(path))
+    return written
+
+
+def timed_render_spec(*args) -> tuple[list[str], float]:
+    """render_spec() plus the seconds it took, measured where it ran."""
+    started = perf_counter()
+    written = render_spec(*args)
+    return written, perf_counter() - started
+
+
+class FigureExporter:
+    """
+    Renders submitted figures in `workers` processes. on_done callbacks run
+    in the submitting process once a figure's files are all written;
+    failures are reported and their callbacks skipped. `timings` holds the
+    export seconds of each written figure, keyed by path stem.
+    """
+
+    def __init__(self, formats: list[str], workers: int = 1, asset_dir: Path | None = None):
+        unknown = set(formats) - set(FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown figure format(s): {sorted(unknown)}")
+        self.formats   = list(formats)
+        self.workers   = workers
+        self.asset_dir = asset_dir
+        self._plotlyjs: str | None = None
+        self.rendered = 0
+        self.failed   = 0
+        self.timings: dict[str, float] = {}
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[Future, str, object]] = []
+
+    @property
+    def parallel(self) -> bool:
+        # HTML alone is cheap enough that shipping specs to workers does not pay
+        return self.workers > 1 and any(fmt in ("png", "svg") for fmt in self.formats)
+
+    def submit(self, fig, path_stem: Path, on_done=None) -> None:
+        if not self.formats:
+            if on_done:
+                on_done()
+            return
+        if "html" in self.formats and self.asset_dir and self._plotlyjs is None:
+            self._plotlyjs = str(write_plotlyjs(self.asset_dir))
+        spec = fig.to_json()
+        args = (spec, str(path_stem), self.formats, self._plotlyjs)
+        if self.parallel:
+            if self._pool is None:
+                # spawn: workers must not inherit the parent's threads or model state
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=start_kaleido_session,
+                )
+            future = self._pool.submit(timed_render_spec, *args)
+        else:
+            future = Future()
+            try:
+                future.set_result(timed_render_spec(*args))
+            except Exception as e:
+                future.set_exception(e)
+        self._pending.append((future, str(path_stem), on_done))
+        if not self.parallel:
+            self.wait()
+
+    def wait(self) -> None:
+        """Block until every submitted figure is written."""
+        pending, self._pending = self._pending, []
+        for future, stem, on_done in pending:
+            try:
+                _, seconds = future.result()
+            except Exception as e:
+                self.failed += 1
+                print(f"  [error] Could not render {stem}: {type(e).__name__}: {str(e).strip()}")
+                continue
+            self.rendered += 1
+            self.timings[stem] = seconds
+            print(f"  Saved: {stem}.{' / .'.join(self.formats)}")
+            if on_done:
+                on_done()
+
+    def close(self) -> None:
+        self.wait()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        stop_kaleido_session()
+
+
+INDEX_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  body {{ margin: 0 auto; max-width: 1500px; padding: 24px; background: #ffffff;
+         color: #333333; font-family: "IBM Plex Mono", "Courier New", monospace; }}
+  nav a {{ margin-right: 16px; }}
+  h2 {{ margin-top: 48px; border-bottom: 1px solid #dddddd; }}
+  .fig {{ min-height: 480px; margin: 24px 0; overflow-x: auto; }}
+  .fig .status {{ color: #999999; font-size: 12px; }}
+</style>
+<script src="{plotlyjs}"></script>
+</head>
+<body>
+<h1>{title}</h1>
+<nav>{nav}</nav>
+{sections}
+<script>
+  // Figures are loaded and drawn only when their placeholder nears the viewport.
+  // Each spec is a script that registers itself in window.FTN_SPECS; unlike
+  // fetch(), a <script src> also loads from file:// pages.
+  window.FTN_SPECS = window.FTN_SPECS || {{}};
+  const loadSpec = (el) => new Promise((resolve, reject) => {{
+    const script = document.createElement("script");
+    script.src = el.dataset.spec;
+    script.onload = () => el.dataset.key in window.FTN_SPECS
+      ? resolve(window.FTN_SPECS[el.dataset.key]) : reject();
+    script.onerror = reject;
+    document.head.appendChild(script);
+  }});
+  const draw = (el) => {{
+    const status = el.querySelector(".status");
+    const plot   = document.createElement("div");
+    return loadSpec(el)
+      .then((fig) => {{
+        el.appendChild(plot);
+        return Plotly.newPlot(plot, fig.data, fig.layout, {{responsive: true}});
+      }})
+      .then(() => {{
+        status.remove();
+        delete window.FTN_SPECS[el.dataset.key];
+      }})
+      .catch(() => {{
+        plot.remove();
+        status.textContent = "Could not draw " + el.dataset.spec + " — ";
+      }});
+  }};
+  const observer = new IntersectionObserver((entries) => {{
+    for (const entry of entries) {{
+      if (entry.isIntersecting) {{
+        observer.unobserve(entry.target);
+        draw(entry.target);
+      }}
+    }}
+  }}, {{rootMargin: "400px 0px"}});
+  document.querySelectorAll(".fig").forEach((el) => observer.observe(el));
+</script>
+</body>
+</html>
+"""
+
+
+def write_spec_script(spec: Path, key: str) -> Path:
+    """
+    Write spec (a specs/<name>.json file) as specs/<name>.js, a script that
+    stores the figure in window.FTN_SPECS[key]. Skipped while it is up to date.
+    """
+    path = spec.with_suffix(".js")
+    if not path.exists() or path.stat().st_mtime_ns < spec.stat().st_mtime_ns:
+        path.write_text(
+            "(window.FTN_SPECS = window.FTN_SPECS || {})"
+            f"[{json.dumps(key)}] = {spec.read_text(encoding='utf-8')};\n",
+            encoding="utf-8",
+        )
+    return path
+
+
+def write_index(results_dir: Path, title: str = "Results") -> Path:
+    """
+    Write results_dir/index.html listing every figure spec under
+    results_dir/<section>/specs/, grouped by section. Figures are loaded lazily,
+    each from the .js copy of its spec written here.
+    """
+    sections = {}
+    for spec in sorted(results_dir.glob("*/specs/*.json")):
+        sections.setdefault(spec.parent.parent.name, []).append(spec)
+
+    nav, blocks = [], []
+    for section, specs in sections.items():
+        label = html.escape(section.replace("_", " ").title())
+        nav.append(f'<a href="#{html.escape(section)}">{label}</a>')
+        blocks.append(f'<h2 id="{html.escape(section)}">{label}</h2>')
+        for spec in specs:
+            key  = f"{section}/{spec.stem}"
+            rel  = write_spec_script(spec, key).relative_to(results_dir).as_posix()
+            page = spec.parent.parent / f"{spec.stem}.html"
+            link = (f' <a href="{html.escape(page.relative_to(results_dir).as_posix())}">'
+                    f'standalone page</a>' if page.exists() else "")
+            blocks.append(
+                f'<div class="fig" data-spec="{html.escape(rel)}" data-key="{html.escape(key)}">'
+                f'<span class="status">{html.escape(spec.stem)}</span>{link}</div>'
+            )
+
+    path = results_dir / INDEX_FILE
+    write_plotlyjs(results_dir)
+    path.write_text(INDEX_TEMPLATE.format(
+        title=html.escape(title), plotlyjs=PLOTLYJS_FILE,
+        nav="\n".join(nav), sections="\n".join(blocks),
+    ), encoding="utf-8")
+    return path
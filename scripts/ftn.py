@@ -0,0 +1,149 @@
+"""
+ftn.py
+
+Command-line entry point for the study pipeline. Each subcommand runs only the
+selected targets and resolves just the data they depend on:
+
+  python scripts/ftn.py collect --instruments i3 --models gpt-4o
+  python scripts/ftn.py plot --only i5 --figures sankey
+  python scripts/ftn.py stats --hypotheses h2,h3
+
+collect  wraps collect_llm_responses.run_collection(): I4 / I5 read the I1 / I2
+         responses already collected; --models limits which models are queried
+         (and which I4 evaluators).
+plot     wraps plot_response_results.run_plots(): --only picks instruments,
+         --figures keeps targets whose name contains a pattern (globs allowed,
+         e.g. 'scores_radar_*'). Only the hypothesis tests annotating the
+         selected figures run, and the embedding model / Sankey LLM calls are
+         only loaded when a stale selected target needs them.
+stats    runs hypothesis tests without drawing figures.
+
+Instruments are given as i1..i5 or instrument_1..instrument_5; lists may be
+space- or comma-separated. The pipeline modules are imported by the subcommand
+that needs them, so `ftn collect` never loads plotly and `ftn plot` never loads
+the provider SDKs.
+"""
+
+import argparse
+
+INSTRUMENT_IDS = [f"instrument_{i}" for i in range(1, 6)]
+HYPOTHESIS_IDS = ["h1", "h2", "h3", "h4"]
+FORMAT_CHOICES = ["html", "json", "png", "svg", "none"]
+
+
+def split_list(values: list[str] | None) -> list[str] | None:
+    """Flatten ["i3,i5", "i1"] into ["i3", "i5", "i1"]."""
+    if values is None:
+        return None
+    return [v.strip() for value in values for v in value.split(",") if v.strip()]
+
+
+def instrument_id(name: str) -> str:
+    """'i3', '3' or 'instrument_3' → 'instrument_3'."""
+    key = name.lower().removeprefix("instrument_").removeprefix("i")
+    i_id = f"instrument_{key}"
+    if i_id not in INSTRUMENT_IDS:
+        raise argparse.ArgumentTypeError(
+            f"unknown instrument {name!r} (expected i1..i5 or instrument_1..instrument_5)")
+    return i_id
+
+
+def hypothesis_id(name: str) -> str:
+    h_id = name.lower()
+    if h_id not in HYPOTHESIS_IDS:
+        raise argparse.ArgumentTypeError(
+            f"unknown hypothesis {name!r} (expected one of {', '.join(HYPOTHESIS_IDS)})")
+    return h_id
+
+
+def parse_list(parser: argparse.ArgumentParser, values: list[str] | None, convert):
+    if values is None:
+        return None
+    try:
+        return list(dict.fromkeys(convert(v) for v in split_list(values)))
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+
+# =============================================================================
+# Subcommands
+# =============================================================================
+
+def cmd_collect(args, parser) -> None:
+    from collect_llm_responses import run_collection
+    try:
+        run_collection(parse_list(parser, args.instruments, instrument_id),
+                       split_list(args.models), dry_run=args.dry_run)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def cmd_plot(args, parser) -> None:
+    from plot_response_results import run_plots
+    hypotheses = parse_list(parser, args.hypotheses, hypothesis_id)
+    run_plots(parse_list(parser, args.only, instrument_id),
+              figures=split_list(args.figures),
+              hypotheses=[] if args.skip_stats else hypotheses,
+              force=args.force, formats=args.formats, workers=args.workers,
+              restyle=args.restyle, trace_memory=args.trace_memory)
+
+
+def cmd_stats(args, parser) -> None:
+    from plot_response_results import run_plots
+    run_plots(figures=[],
+              hypotheses=parse_list(parser, args.hypotheses, hypothesis_id) or HYPOTHESIS_IDS,
+              force=[] if args.force else None, trace_memory=args.trace_memory)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ftn", description="Framing the Neutral: collect responses, plot, run H1–H4.")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    p = sub.add_parser("collect", help="collect LLM responses into data/raw/")
+    p.add_argument("--instruments", nargs="+", metavar="ID",
+                   help="instruments to collect, e.g. i3 (default: ACTIVE_INSTRUMENTS)")
+    p.add_argument("--models", nargs="+", metavar="MODEL",
+                   help="models to query, e.g. gpt-4o (default: all in instruments.json)")
+    p.add_argument("--dry-run", action="store_true",
+                   help="list pending calls per provider without contacting any API")
+    p.set_defaults(func=cmd_collect)
+
+    p = sub.add_parser("plot", help="build figures (and the tests annotating them)")
+    p.add_argument("--only", "--instruments", dest="only", nargs="+", metavar="ID",
+                   help="instruments to plot, e.g. i5 (default: ACTIVE_INSTRUMENTS)")
+    p.add_argument("--figures", nargs="+", metavar="PATTERN",
+                   help="only targets whose name contains PATTERN (globs allowed)")
+    p.add_argument("--hypotheses", nargs="+", metavar="H",
+                   help="hypothesis tests to run (default: those annotating the figures)")
+    p.add_argument("--skip-stats", action="store_true",
+                   help="skip H1–H4; figures are drawn without stats annotations")
+    p.add_argument("--force", nargs="*", metavar="PATTERN",
+                   help="rebuild even if up to date: everything, or the targets "
+                        "matching these globs")
+    p.add_argument("--formats", nargs="+", metavar="FMT", choices=FORMAT_CHOICES,
+                   help="figure formats to write; 'none' builds targets without figures")
+    p.add_argument("--workers", type=int, metavar="N", help="figure export processes")
+    p.add_argument("--restyle", action="store_true",
+                   help="only re-render figures from their saved data/ JSON")
+    p.add_argument("--trace-memory", action="store_true",
+                   help="record per-stage Python allocation peaks in profile.json (slower)")
+    p.set_defaults(func=cmd_plot)
+
+    p = sub.add_parser("stats", help="run hypothesis tests without drawing figures")
+    p.add_argument("--hypotheses", nargs="+", metavar="H",
+                   help="tests to run, e.g. h2,h3 (default: all)")
+    p.add_argument("--force", action="store_true",
+                   help="rerun even if inputs are unchanged since the last run")
+    p.add_argument("--trace-memory", action="store_true",
+                   help="record per-stage Python allocation peaks in profile.json (slower)")
+    p.set_defaults(func=cmd_stats)
+    return parser
+
+
+# The guard matters: figure export workers are spawned processes that
+# re-import this module
+if __name__ == "__main__":
+    parser = build_parser()
+    args = parser.parse_args()
+    args.func(args, parser)
@@ -0,0 +1,170 @@
+"""
+llm_cache.py
+
+Content-addressed on-disk cache of LLM responses, shared by
+collect_llm_responses.py and plot_response_results.py.
+
+Each entry is keyed by a SHA-256 of the full request:
+    (provider, model id, system prompt, user prompt, max_tokens, temperature, tag)
+where `tag` distinguishes intentionally repeated samples (e.g. "run2") so that
+independent runs of the same prompt are never collapsed into one response.
+
+Entries live in a single SQLite file (data/cache/llm_responses.sqlite). When the
+stored text exceeds MAX_CACHE_BYTES, least-recently-used entries are evicted.
+Hit / miss counters are kept per process and reported by stats().
+
+Only successful responses should be put(): callers validate (e.g. parse JSON)
+before caching so that a bad response is re-requested on the next run.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+
+CACHE_FILE      = Path("data/cache/llm_responses.sqlite")
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+EVICT_TO        = 0.9   # evict down to this fraction of MAX_CACHE_BYTES
+
+
+def cache_key(provider: str, model: str, system_prompt: str | None, user_prompt: str,
+              max_tokens: int, temperature: float | None = None,
+              tag: str | None = None) -> str:
+    """Stable hex digest of one LLM request."""
+    payload = json.dumps(
+        [provider, model, system_prompt or "", user_prompt, max_tokens, temperature, tag],
+        ensure_ascii=False, separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Thread-safe SQLite response store with size-based LRU eviction."""
+
+    def __init__(self, path: Path | None = None, max_bytes: int | None = None):
+        path = path or CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path      = path
+        self.max_bytes = max_bytes or MAX_CACHE_BYTES
+        self.hits      = 0
+        self.misses    = 0
+        self._lock     = threading.Lock()
+        self._db       = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)"
+        )
+        self._db.commit()
+        self._bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time(), key)
+            )
+            self._db.commit()
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        now  = time()
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._bytes += size - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= row[0]
+                self._db.commit()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until under EVICT_TO × max_bytes."""
+        target = int(self.max_bytes * EVICT_TO)
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        )
+        doomed = []
+        for key, size in rows:
+            if self._bytes <= target:
+                break
+            doomed.append((key,))
+            self._bytes -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits":     self.hits,
+            "misses":   self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "entries":  entries,
+            "bytes":    self._bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_cache: LLMCache | None = None
+
+
+def get_cache() -> LLMCache:
+    """Process-wide cache instance, opened on first use."""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+    return _cache
+
+
+def counters() -> dict[str, int]:
+    """Hits and misses so far in this process, without opening the cache."""
+    if _cache is None:
+        return {"hits": 0, "misses": 0}
+    return {"hits": _cache.hits, "misses": _cache.misses}
+
+
+def print_cache_report() -> None:
+    if _cache is None:
+        return
+    s = _cache.stats()
+    rate = f"{s['hit_rate'] * 100:.0f}%" if s["hit_rate"] is not None else "n/a"
+    print(f"\nLLM cache: {s['hits']} hits / {s['misses']} misses ({rate}), "
+          f"{s['entries']} entries, {s['bytes'] / 1024 / 1024:.1f} MB  [{_cache.path}]")
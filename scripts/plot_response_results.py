@@ -2,16 +2,45 @@
 plot_response_results.py
 
 Generates visualizations for Instruments 1–5. Controls which instruments
-are plotted via ACTIVE_INSTRUMENTS.
+are plotted via ACTIVE_INSTRUMENTS (or --instruments on the command line).
 
 Light theme throughout. Statistics (H1–H4) are printed before any plotting.
 
+Builds are incremental: a figure or results file is only regenerated when the
+datasets or parameters it declares (or this code) changed since the last run,
+as recorded in results/build_manifest.json. --force rebuilds regardless.
+
+Figures are exported by a pool of worker processes (figure_export.py), each
+reusing one Kaleido session; --formats picks html/json/png/svg (or none) and
+--workers the pool size. "json" writes each figure's spec to
+<instrument>/specs/<figure>.json; results/index.html draws them lazily from
+.js copies, so it opens straight from disk.
+
+Every figure is computed (<figure>_data) separately from how it is drawn; the
+computed numbers are kept in <instrument>/data/<figure>.json, and --restyle
+redraws all figures from those files alone.
+
+run_plots() is the entry point for this script and for `ftn plot` / `ftn stats`
+(ftn.py). Targets can be narrowed to instruments, figure-name patterns and
+hypotheses; only the data, scores, hypothesis tests, embeddings and LLM calls
+the selected targets read are then loaded or computed.
+
+Each run is profiled (profiling.py): stage and per-figure timings, LLM calls,
+cache hits, embedding throughput and peak memory go to results/profile.json,
+and the slowest stages are printed at the end.
+
 Output structure:
   results/
+    build_manifest.json
+    profile.json           timings of the last run
+    index.html             single page, draws each figure from specs/ on scroll
+    plotly.min.js          shared by every .html below
     instrument_1/
       wordfreq_legal_certainty.[html|png]
       wordfreq_accountability.[html|png]
       wordfreq_enforceability.[html|png]
+      distinctive_{model|ceo}_<question>.[html|png]
+      distinctive_words.json
       similarity_cross_model.[html|png]
       similarity_baseline_vs_ceo.[html|png]
     instrument_2/
@@ -38,39 +67,58 @@ Output structure:
       jurisdiction_radar.[html|png]
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
+import threading
 from collections import Counter, defaultdict
-from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
-from time import sleep
+from time import monotonic, perf_counter, sleep
 
-import anthropic
-import nltk
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from nltk.corpus import stopwords
-from scipy import stats
-from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
 
+# Heavy dependencies (anthropic, nltk, pandas, scipy, sentence_transformers) are
+# imported where they are first needed so partial runs and --help start fast.
+
+import llm_cache
+from figure_export import FORMATS, FigureExporter, output_path, write_index
+from profiling import Profiler
+from response_tables import InstrumentView, ResponseTables, SourceIndex, load_tables
+
 load_dotenv()
 
 # =============================================================================
 # Config
 # =============================================================================
 
-RAW_DIR           = Path("data/raw")
-RESULTS_DIR       = Path("results")
-SANKEY_CACHE_FILE = RESULTS_DIR / "sankey_label_cache.json"
+RAW_DIR               = Path("data/raw")
+RESULTS_DIR           = Path("results")
+SANKEY_CACHE_FILE     = RESULTS_DIR / "sankey_label_cache.json"
+EXTRACTION_CACHE_FILE = RESULTS_DIR / "extraction_cache.json"
+EMBEDDING_CACHE_DIR   = Path("data/cache/embeddings")
+BUILD_MANIFEST_FILE   = RESULTS_DIR / "build_manifest.json"
+PROFILE_FILE          = RESULTS_DIR / "profile.json"
+
+# Bump when the extract_structured() prompts change so stale extractions are redone
+EXTRACTION_PROMPT_VERSION = 1
 
 ACTIVE_INSTRUMENTS = ["instrument_1", "instrument_2", "instrument_3", "instrument_4", "instrument_5"]
 
 PEER_EVAL_FILE = Path("data/prompts/peer_eval_pairs.json")
 
+FIGURE_FORMATS = ["html", "json", "png"]   # any of figure_export.FORMATS
+RENDER_WORKERS = os.cpu_count() or 1       # processes exporting figures in parallel
+
+# tracemalloc per-stage Python allocation peaks in profile.json (slows the run down)
+PROFILE_TRACE_MEMORY = False
+
 CONDITIONS       = ["baseline", "ceo"]
 CONDITION_LABELS = {"baseline": "Baseline", "ceo": "CEO Role"}
 
@@ -89,7 +137,23 @@ I1_QUESTIONS = {
 }
 
 TOP_N_WORDS     = 20
+MAX_NGRAM       = 2     # term matrix vocabulary: unigrams + adjacent-token bigrams
+
+# Distinctive vocabulary (weighted log-odds, informative Dirichlet prior)
+LOGODDS_PRIOR_SCALE = 1.0   # prior pseudo-counts = scale × the question's pooled term counts
+LOGODDS_TOP_K       = 5     # most distinctive terms per model in figures and table
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBED_BATCH_SIZE = 64   # texts per forward pass when encoding unseen texts
+
+# Sankey node-label canonicalization
+#   "embedding": local agglomerative clustering of label embeddings (offline, deterministic)
+#   "llm":       Claude assigns new labels in batches of LABEL_LLM_BATCH
+# Assignments are cached per label in SANKEY_CACHE_FILE; delete it after changing these.
+LABEL_CANONICALIZER   = "embedding"
+LABEL_SIM_THRESHOLD   = 0.80    # cosine similarity at which two labels are merged
+LABEL_LLM_TIEBREAK    = False   # ask Claude about pairs just below the threshold
+LABEL_TIEBREAK_MARGIN = 0.05    # width of that "just below" band
+LABEL_LLM_BATCH       = 25      # new labels per Claude request ("llm" backend)
 
 # Instrument 3 — scenarios and dimensions
 I3_SCENARIOS = {
@@ -289,20 +353,101 @@ def hex_to_rgba(hex_color: str, alpha: float = 0.55) -> str:
     return f"rgba({r},{g},{b},{alpha})"
 
 
-def save_fig(fig: go.Figure, path_stem: Path) -> None:
-    path_stem.parent.mkdir(parents=True, exist_ok=True)
-    fig.write_html(str(path_stem.with_suffix(".html")))
-    fig.write_image(str(path_stem.with_suffix(".png")), scale=2)
-    print(f"  Saved: {path_stem}.html / .png")
+_exporter: FigureExporter | None = None
+
+
+def get_exporter() -> FigureExporter:
+    """Shared FigureExporter writing FIGURE_FORMATS with RENDER_WORKERS processes."""
+    global _exporter
+    if _exporter is None:
+        _exporter = FigureExporter(FIGURE_FORMATS, RENDER_WORKERS, asset_dir=RESULTS_DIR)
+    return _exporter
+
+
+def save_fig(fig: go.Figure, path_stem: Path, on_done=None) -> None:
+    """Queue fig for export as path_stem.<fmt>; on_done() runs once it is written."""
+    get_exporter().submit(fig, path_stem, on_done)
+
+
+# =============================================================================
+# Profiling
+# Every stage of a run (data loading, score extraction, embedding and LLM
+# prefetches, each target's compute + render, each figure's export) is timed
+# and written to PROFILE_FILE together with the LLM calls, cache hits and
+# embeddings it caused; a summary of the slowest stages ends every run.
+# =============================================================================
+
+_profiler: Profiler | None = None
+
+
+def get_profiler() -> Profiler:
+    global _profiler
+    if _profiler is None:
+        def store_counter(attr: str):
+            return lambda: getattr(_embedding_store, attr) if _embedding_store else 0
+
+        _profiler = Profiler({
+            "llm_calls":        lambda: _llm_calls,
+            "llm_cache_hits":   lambda: llm_cache.counters()["hits"],
+            "llm_cache_misses": lambda: llm_cache.counters()["misses"],
+            "texts_encoded":    store_counter("encoded"),
+            "encode_seconds":   store_counter("encode_seconds"),
+        }, trace_memory=PROFILE_TRACE_MEMORY)
+    return _profiler
+
+
+def stage(name: str, kind: str = "stage"):
+    """Context manager timing one stage of the run."""
+    return get_profiler().stage(name, kind)
+
+
+def write_profile() -> None:
+    """Add the exporter's per-figure timings, write PROFILE_FILE and print the summary."""
+    profiler = get_profiler()
+    if _exporter:
+        for stem, seconds in _exporter.timings.items():
+            name = Path(stem).relative_to(RESULTS_DIR).as_posix()
+            profiler.record(f"{name} (export)", seconds, kind="export")
+
+    extra = {}
+    store = _embedding_store
+    if store and store.encoded:
+        rate = store.encoded / store.encode_seconds if store.encode_seconds else None
+        extra["embeddings"] = {
+            "texts_encoded":     store.encoded,
+            "served_from_store": store.hits,
+            "encode_seconds":    round(store.encode_seconds, 3),
+            "texts_per_second":  round(rate, 1) if rate else None,
+        }
+    previous = profiler.write(PROFILE_FILE, extra)
+    profiler.print_summary(previous)
+    if "embeddings" in extra:
+        emb = extra["embeddings"]
+        print(f"  embeddings: {emb['texts_encoded']} texts in {emb['encode_seconds']:.2f}s "
+              f"({emb['texts_per_second']} texts/s)")
+    print(f"  Saved: {PROFILE_FILE}")
 
 
 # =============================================================================
 # NLP helpers
 # =============================================================================
 
-nltk.download("stopwords", quiet=True)
-nltk.download("punkt",     quiet=True)
-STOP_WORDS = set(stopwords.words("english"))
+_stop_words: set[str] | None = None
+
+
+def stop_words() -> set[str]:
+    """NLTK English stopwords, downloading the corpus only if it is missing."""
+    global _stop_words
+    if _stop_words is None:
+        import nltk
+        from nltk.corpus import stopwords
+        try:
+            _stop_words = set(stopwords.words("english"))
+        except LookupError:
+            nltk.download("stopwords", quiet=True)
+            _stop_words = set(stopwords.words("english"))
+    return _stop_words
+
 
 DOMAIN_STOP = {
     "ai", "systems", "system", "governance", "framework", "must",
@@ -313,60 +458,509 @@ DOMAIN_STOP = {
 }
 
 
+_NON_ALPHA = re.compile(r"[^a-z\s]")
+_excluded_words: set[str] | None = None
+
+
 def tokenize(text: str) -> list[str]:
-    text = text.lower()
-    text = re.sub(r"[^a-z\s]", " ", text)
+    global _excluded_words
+    if _excluded_words is None:
+        _excluded_words = stop_words() | DOMAIN_STOP
     return [
-        t for t in text.split()
-        if t not in STOP_WORDS and t not in DOMAIN_STOP and len(t) > 3
+        t for t in _NON_ALPHA.sub(" ", text.lower()).split()
+        if len(t) > 3 and t not in _excluded_words
     ]
 
 
-def _extract_text(val) -> str:
+# Instrument data is read through response_tables.InstrumentView (one shared
+# tidy table per run, see load_tables in Main) rather than the nested JSON.
+
+def get_responses(data: InstrumentView, model: str, condition: str,
+                  question_id: str) -> list[str]:
+    """Non-empty response texts for model × condition × question, in run order."""
+    return data.texts(model, condition, question_id)
+
+
+def get_run1(data: InstrumentView, model: str, condition: str, question_id: str) -> str:
+    return data.text(model, condition, question_id, run=1)
+
+
+# =============================================================================
+# Term matrix
+# Each instrument's responses are tokenized once into a sparse document × term
+# count matrix (one document per model × condition × run × question) with a
+# shared unigram + bigram vocabulary. Word-frequency figures select document
+# rows, sum them per column group and normalize; no figure re-tokenizes text.
+# =============================================================================
+
+class TermMatrix:
     """
-    Extract response text from either legacy string or new {raw, parsed} dict.
-    Used to maintain backward compatibility with old I1 plain-string data.
+    Sparse term counts for one instrument. Bigrams are adjacent tokens after
+    stopword filtering ("legal certainty"). Per-document term order is kept
+    as first appearance so top-term ties break exactly as Counter.most_common.
     """
-    if isinstance(val, str):
-        return val
-    if isinstance(val, dict):
-        parsed = val.get("parsed") or {}
-        return parsed.get("response") or val.get("raw") or ""
-    return ""
 
+    def __init__(self, data: InstrumentView, max_ngram: int = MAX_NGRAM):
+        from scipy import sparse
 
-def get_responses(data: dict, model: str, condition: str,
-                  question_id: str) -> list[str]:
-    runs = data.get(model, {}).get(condition, {})
-    out  = []
-    for r in sorted(runs.keys(), key=int):
-        text = _extract_text(runs[r].get(question_id))
-        if text:
-            out.append(text)
+        vocab: dict[str, int] = {}
+        indptr, indices, values, n_tokens = [0], [], [], []
+        self.doc_index: dict[tuple[str, str, str], list[int]] = defaultdict(list)
+        df = data.responses
+        for model, cond, q_id, text in zip(df["model"], df["condition"],
+                                           df["question"], df["text"]):
+            if not text:
+                continue
+            tokens = tokenize(text)
+            terms  = tokens
+            if max_ngram >= 2:
+                terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for term, count in Counter(terms).items():
+                indices.append(vocab.setdefault(term, len(vocab)))
+                values.append(count)
+            indptr.append(len(indices))
+            self.doc_index[(model, cond, q_id)].append(len(n_tokens))
+            n_tokens.append(len(tokens))
+
+        self.vocab    = vocab
+        self.terms    = list(vocab)
+        self.ngram    = np.array([t.count(" ") + 1 for t in self.terms], dtype=np.int8)
+        self.n_tokens = np.array(n_tokens, dtype=np.int64)
+        self._indptr  = np.array(indptr, dtype=np.int64)
+        self._indices = np.array(indices, dtype=np.int64)
+        self.counts   = sparse.csr_matrix(
+            (np.array(values, dtype=np.int64), self._indices.copy(), self._indptr.copy()),
+            shape=(len(n_tokens), len(vocab)),
+        )
+
+    def docs(self, models: list[str], conditions: list[str], question_id: str) -> list[int]:
+        """Document rows for models × conditions × one question, in run order."""
+        return [d for m in models for c in conditions
+                for d in self.doc_index.get((m, c, question_id), [])]
+
+    def group_counts(self, groups: list[list[int]]):
+        """Summed term counts per group of document rows → sparse (groups × terms)."""
+        from scipy import sparse
+        rows = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+        cols = np.array([d for g in groups for d in g], dtype=np.int64)
+        member = sparse.csr_matrix((np.ones(len(cols), dtype=np.int64), (rows, cols)),
+                                   shape=(len(groups), self.counts.shape[0]))
+        return member @ self.counts
+
+    def group_tokens(self, groups: list[list[int]]) -> np.ndarray:
+        return np.array([self.n_tokens[g].sum() for g in groups], dtype=np.int64)
+
+    def frequencies(self, groups: list[list[int]],
+                    ngram: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Relative frequencies (count / group token count) of the n-gram terms
+        present in any group → (term ids, dense groups × terms).
+        """
+        counts  = self.group_counts(groups)
+        present = np.unique(counts.indices)
+        present = present[self.ngram[present] == ngram]
+        total   = np.maximum(self.group_tokens(groups), 1)
+        return present, counts[:, present].toarray() / total[:, None]
+
+    def first_seen(self, docs: list[int]) -> np.ndarray:
+        """Rank of each term's first appearance across `docs` taken in order."""
+        seq = (np.concatenate([self._indices[self._indptr[d]:self._indptr[d + 1]] for d in docs])
+               if docs else np.empty(0, dtype=np.int64))
+        uniq, pos = np.unique(seq, return_index=True)
+        rank = np.full(len(self.terms), len(seq), dtype=np.int64)
+        rank[uniq] = pos
+        return rank
+
+    def top_terms(self, term_ids: np.ndarray, scores: np.ndarray,
+                  docs: list[int], n: int) -> list[int]:
+        """Positions in term_ids of the n highest scores, ties by first appearance."""
+        rank = self.first_seen(docs)[term_ids]
+        return np.lexsort((rank, -scores))[:n].tolist()
+
+
+_term_matrices: dict[str, TermMatrix] = {}
+
+
+def get_term_matrix(data: InstrumentView) -> TermMatrix:
+    """Process-wide TermMatrix per instrument, built on first use."""
+    if data.instrument_id not in _term_matrices:
+        _term_matrices[data.instrument_id] = TermMatrix(data)
+    return _term_matrices[data.instrument_id]
+
+
+# =============================================================================
+# Distinctive vocabulary
+# Weighted log-odds ratio with an informative Dirichlet prior (Monroe, Colaresi
+# & Quinn 2008): each model vs all other models, and CEO vs baseline within
+# each model, stacked as rows of one contrast matrix over the term matrix.
+# =============================================================================
+
+def log_odds_dirichlet(y_a: np.ndarray, y_b: np.ndarray,
+                       alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Log-odds ratio δ of every term in corpus a vs corpus b and its z-score
+    δ / σ, with prior pseudo-counts alpha. Rows of y_a / y_b are independent
+    contrasts (contrasts × terms); returns (δ, z) of the same shape.
+    """
+    a0       = alpha.sum()
+    ya, yb   = y_a + alpha, y_b + alpha
+    n_a      = y_a.sum(axis=1, keepdims=True) + a0
+    n_b      = y_b.sum(axis=1, keepdims=True) + a0
+    delta    = np.log(ya / (n_a - ya)) - np.log(yb / (n_b - yb))
+    variance = 1.0 / ya + 1.0 / yb
+    return delta, delta / np.sqrt(variance)
+
+
+def distinctive_words(tm: TermMatrix, question_id: str, models: list[str]) -> dict:
+    """
+    Unigram log-odds z-scores for one question. The prior pseudo-counts are
+    the question's pooled term counts (all models and conditions) scaled by
+    LOGODDS_PRIOR_SCALE.
+
+    Returns {"terms", "counts", "model_z", "model_delta", "ceo_z", "ceo_delta"}
+    with models × terms arrays: model_* rows are each model vs the rest,
+    ceo_* rows are each model's CEO vs baseline responses.
+    """
+    groups   = [tm.docs([m], [c], question_id) for m in models for c in CONDITIONS]
+    counts   = tm.group_counts(groups)
+    term_ids = np.unique(counts.indices)
+    term_ids = term_ids[tm.ngram[term_ids] == 1]
+    cells    = counts[:, term_ids].toarray().astype(float)
+    cells    = cells.reshape(len(models), len(CONDITIONS), len(term_ids))
+
+    alpha = cells.sum(axis=(0, 1)) * LOGODDS_PRIOR_SCALE
+
+    per_model = cells.sum(axis=1)
+    base, ceo = cells[:, CONDITIONS.index("baseline")], cells[:, CONDITIONS.index("ceo")]
+    y_a = np.vstack([per_model, ceo])
+    y_b = np.vstack([per_model.sum(axis=0) - per_model, base])
+    delta, z = log_odds_dirichlet(y_a, y_b, alpha)
+
+    n = len(models)
+    return {
+        "terms":       [tm.terms[t] for t in term_ids],
+        "counts":      per_model,
+        "model_z":     z[:n],     "model_delta": delta[:n],
+        "ceo_z":       z[n:],     "ceo_delta":   delta[n:],
+    }
+
+
+def top_distinctive(z: np.ndarray, k: int, absolute: bool = False) -> list[int]:
+    """Union of each row's k highest (or largest-|z|) term columns, in row order."""
+    score = np.abs(z) if absolute else z
+    top   = np.argsort(-score, axis=1, kind="stable")[:, :k]
+    return list(dict.fromkeys(top.ravel().tolist()))
+
+
+def distinctive_words_table(data: InstrumentView, models: list[str]) -> dict:
+    """
+    JSON-ready table per I1 question: each model's most distinctive terms vs
+    the other models, and the terms most shifted towards CEO / baseline.
+    """
+    tm  = get_term_matrix(data)
+    out = {}
+    for q_id in I1_QUESTIONS:
+        d = distinctive_words(tm, q_id, models)
+        if not d["terms"]:
+            continue
+
+        def rows(i, cols, z, delta):
+            return [{"term": d["terms"][c], "z": round(float(z[i, c]), 3),
+                     "log_odds": round(float(delta[i, c]), 4),
+                     "count": int(d["counts"][i, c])} for c in cols]
+
+        k = LOGODDS_TOP_K
+        model_order = np.argsort(-d["model_z"], axis=1, kind="stable")
+        ceo_order   = np.argsort(-d["ceo_z"], axis=1, kind="stable")
+        out[q_id] = {
+            "question": I1_QUESTIONS[q_id],
+            "model_vs_rest": {
+                m: rows(i, model_order[i, :k], d["model_z"], d["model_delta"])
+                for i, m in enumerate(models)
+            },
+            "ceo_vs_baseline": {
+                m: {"ceo":      rows(i, ceo_order[i, :k], d["ceo_z"], d["ceo_delta"]),
+                    "baseline": rows(i, ceo_order[i, ::-1][:k], d["ceo_z"], d["ceo_delta"])}
+                for i, m in enumerate(models)
+            },
+        }
     return out
 
 
-def get_run1(data: dict, model: str, condition: str, question_id: str) -> str:
-    val = data.get(model, {}).get(condition, {}).get("1", {}).get(question_id)
-    return _extract_text(val) if val is not None else ""
+# =============================================================================
+# Embedding store
+# Encodings persist in EMBEDDING_CACHE_DIR as one .npy matrix per embedding
+# model plus a {sha256(text): row} index, so each text is encoded only once
+# across figures, hypothesis tests and runs.
+# =============================================================================
+
+class EmbeddingStore:
+    """
+    Drop-in for SentenceTransformer.encode() backed by a persistent cache.
+    The encoder itself is only loaded when a text has never been seen.
+    """
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL,
+                 cache_dir: Path = EMBEDDING_CACHE_DIR):
+        slug             = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        self.model_name  = model_name
+        self.matrix_path = cache_dir / f"{slug}.npy"
+        self.index_path  = cache_dir / f"{slug}.index.json"
+        self.hits        = 0      # texts served from the store
+        self.encoded     = 0      # texts encoded this run
+        self.encode_seconds = 0.0 # time spent encoding them (model load excluded)
+        self._model      = None
+        self._matrix     = None   # memory-mapped rows already on disk
+        self._index: dict[str, int]     = {}
+        self._pending: list[np.ndarray] = []
+        self._lock       = threading.Lock()
+
+        if self.index_path.exists() and self.matrix_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("model") == model_name:
+                self._matrix = np.load(self.matrix_path, mmap_mode="r")
+                self._index  = {h: r for h, r in meta["rows"].items()
+                                if r < len(self._matrix)}
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _encoder(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            print(f"Loading embedding model {self.model_name}...")
+            with stage("load embedding model"):
+                self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def _row(self, r: int) -> np.ndarray:
+        n_disk = 0 if self._matrix is None else len(self._matrix)
+        return self._matrix[r] if r < n_disk else self._pending[r - n_disk]
+
+    def encode(self, texts: list[str], show_progress_bar: bool = False) -> np.ndarray:
+        with self._lock:
+            return self._encode(texts, show_progress_bar)
+
+    def _encode(self, texts: list[str], show_progress_bar: bool) -> np.ndarray:
+        hashes = [self.text_hash(t) for t in texts]
+        unseen = {}
+        for h, t in zip(hashes, texts):
+            if h not in self._index and h not in unseen:
+                unseen[h] = t
+        self.hits += len(texts) - len(unseen)
+
+        if unseen:
+            encoder = self._encoder()
+            started = perf_counter()
+            new = encoder.encode(list(unseen.values()), batch_size=EMBED_BATCH_SIZE,
+                                 show_progress_bar=show_progress_bar)
+            self.encode_seconds += perf_counter() - started
+            n_rows = len(self._index)
+            for k, (h, vec) in enumerate(zip(unseen, new)):
+                self._index[h] = n_rows + k
+                self._pending.append(np.asarray(vec, dtype=np.float32))
+            self.encoded += len(unseen)
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([self._row(self._index[h]) for h in hashes])
+
+    def save(self) -> None:
+        """Append newly encoded rows to the on-disk matrix and rewrite the index."""
+        if not self._pending:
+            return
+        self.matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        combined = np.stack(self._pending)
+        if self._matrix is not None:
+            # concatenate copies the mapped rows, so nothing below refers to the mapping
+            combined = np.concatenate([self._matrix, combined])
+        tmp = self.matrix_path.with_suffix(".tmp.npy")
+        np.save(tmp, combined)
+        del combined
+        # Drop the last reference to the old memmap so its file mapping is
+        # closed; Windows refuses to replace a file that is still mapped
+        self._matrix = None
+        os.replace(tmp, self.matrix_path)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"model": self.model_name, "rows": self._index}, f)
+        self._matrix  = np.load(self.matrix_path, mmap_mode="r")
+        self._pending = []
+        print(f"  Embedding store: {self.encoded} new texts encoded, "
+              f"{self.hits} served from cache ({len(self._index)} stored)")
+
+
+_embedding_store: EmbeddingStore | None = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Shared EmbeddingStore for EMBEDDING_MODEL (figures, H1 and label clustering)."""
+    global _embedding_store
+    if _embedding_store is None:
+        _embedding_store = EmbeddingStore(EMBEDDING_MODEL)
+    return _embedding_store
+
+
+def h1_text_pairs(i1_data: InstrumentView, i2_data: InstrumentView, models: list[str]):
+    """
+    Yield (model, run1–3 I1 texts, run-1 I1 text, run-1 I2 text) for every
+    H1 dimension pair. Shared by run_hypothesis_tests and prefetch_embeddings.
+    """
+    dim_pairs = [("I1_Q1", "I2_S1"), ("I1_Q2", "I2_S2"), ("I1_Q3", "I2_S3")]
+    for model in models:
+        for i1_qid, i2_sid in dim_pairs:
+            run_texts = [i1_data.text(model, "baseline", i1_qid, run=r) for r in [1, 2, 3]]
+            i1_text   = get_run1(i1_data, model, "baseline", i1_qid)
+            i2_text   = get_run1(i2_data, model, "baseline", i2_sid)
+            yield model, [t for t in run_texts if t], i1_text, i2_text
+
+
+def prefetch_embeddings(store: EmbeddingStore, i1_data: InstrumentView | None,
+                        i2_data: InstrumentView | None, models: list[str],
+                        figures: bool = True, h1: bool = True) -> None:
+    """
+    Encode every text the I1 figures (figures=True) and H1 (h1=True) need in one
+    batched pass, so the per-figure lookups below are pure cache reads.
+    """
+    texts = []
+    if figures and i1_data:
+        for model in models:
+            for cond in CONDITIONS:
+                for q_id in I1_QUESTIONS:
+                    texts.extend(get_responses(i1_data, model, cond, q_id))
+    if h1 and i1_data and i2_data:
+        for _, run_texts, i1_text, i2_text in h1_text_pairs(i1_data, i2_data, models):
+            texts.extend(run_texts)
+            texts.extend(t for t in (i1_text, i2_text) if t)
+    if texts:
+        store.encode(texts)
 
 
-def avg_embedding(texts: list[str], model: SentenceTransformer) -> np.ndarray:
+def avg_embedding(texts: list[str], model: EmbeddingStore) -> np.ndarray:
     embs = model.encode(texts, show_progress_bar=False)
     return embs.mean(axis=0)
 
 
-def cosine_sim(a: np.ndarray, b: np.ndarray) -> float:
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-10))
+def normalize_rows(m: np.ndarray) -> np.ndarray:
+    m = np.asarray(m, dtype=np.float64)
+    return m / (np.linalg.norm(m, axis=1, keepdims=True) + 1e-10)
+
+
+def cosine_matrix(a: np.ndarray, b: np.ndarray | None = None) -> np.ndarray:
+    """All-pairs cosine similarity between the rows of a and b (default: a)."""
+    na = normalize_rows(a)
+    nb = na if b is None else normalize_rows(b)
+    return na @ nb.T
+
+
+def rowwise_cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosine similarity of a[i] with b[i] for every row i."""
+    return np.einsum("ij,ij->i", normalize_rows(a), normalize_rows(b))
 
 
 # =============================================================================
 # LLM extraction helper
 # =============================================================================
 
-_extraction_cache: dict[str, dict] = {}
+# Provider slot / model id used for analysis-time calls. The slot matches the
+# collector's MODELS key so both scripts address the same llm_cache entries.
+ANALYSIS_PROVIDER = "claude-sonnet"
+ANALYSIS_MODEL    = "claude-sonnet-4-5"
+
+# Concurrency and pacing for uncached analysis calls (Sankey extraction + clustering)
+LLM_WORKERS = 8    # threads in the Sankey prefetch pool
+LLM_RPM     = 50   # requests per minute allowed to ANALYSIS_MODEL
+
+# Persisted to EXTRACTION_CACHE_FILE; None until first use (see _load_extraction_cache)
+_extraction_cache: dict[str, dict] | None = None
+
+_anthropic_client = None
+_anthropic_lock   = threading.Lock()
+_llm_calls        = 0    # uncached ANALYSIS_MODEL requests sent this run
+
+
+def get_anthropic_client():
+    """Anthropic client, created on the first uncached analysis call."""
+    global _anthropic_client
+    with _anthropic_lock:
+        if _anthropic_client is None:
+            import anthropic
+            _anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    return _anthropic_client
+
+
+class RateGate:
+    """Spaces calls at least 60 / rpm seconds apart across all threads."""
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm
+        self._next    = 0.0
+        self._lock    = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now        = monotonic()
+            slot       = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            sleep(slot - now)
+
+
+_llm_gate = RateGate(LLM_RPM)
+
+
+def _claude_json(prompt: str, max_tokens: int):
+    """
+    Send a single-turn prompt to ANALYSIS_MODEL and parse the JSON reply.
+    Replies are served from / stored in the shared llm_cache; only replies that
+    parse are cached, so a malformed answer is re-requested next time.
+    """
+    global _llm_calls
+    cache = llm_cache.get_cache()
+    key   = llm_cache.cache_key(ANALYSIS_PROVIDER, ANALYSIS_MODEL, None, prompt, max_tokens)
+    raw   = cache.get(key)
+    fresh = raw is None
+    if fresh:
+        _llm_gate.wait()
+        resp = get_anthropic_client().messages.create(
+            model=ANALYSIS_MODEL,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        with _anthropic_lock:
+            _llm_calls += 1
+        raw = resp.content[0].text.strip()
+    cleaned = re.sub(r"^```json\s*", "", raw)
+    cleaned = re.sub(r"```$", "", cleaned).strip()
+    result  = json.loads(cleaned)
+    if fresh:
+        cache.put(key, raw)
+    return result
+
+
+def _load_extraction_cache() -> dict[str, dict]:
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = {}
+        if EXTRACTION_CACHE_FILE.exists():
+            with open(EXTRACTION_CACHE_FILE, "r", encoding="utf-8") as f:
+                _extraction_cache = json.load(f)
+    return _extraction_cache
 
-anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+def _save_extraction_cache() -> None:
+    if _extraction_cache is None:
+        return
+    EXTRACTION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(EXTRACTION_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(_extraction_cache, f, indent=2, ensure_ascii=False)
+
+
+def extraction_cache_key(text: str, extraction_type: str) -> str:
+    """Deterministic key: extraction type + prompt version + SHA-256 of the text."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{extraction_type}::v{EXTRACTION_PROMPT_VERSION}::{digest}"
 
 
 def extract_structured(text: str, extraction_type: str) -> dict:
@@ -385,9 +979,10 @@ def extract_structured(text: str, extraction_type: str) -> dict:
             "solutions": ["international treaty", "harmonized standards", ...]
           }
     """
-    cache_key = f"{extraction_type}::{hash(text)}"
-    if cache_key in _extraction_cache:
-        return _extraction_cache[cache_key]
+    extraction_cache = _load_extraction_cache()
+    cache_key = extraction_cache_key(text, extraction_type)
+    if cache_key in extraction_cache:
+        return extraction_cache[cache_key]
 
     if extraction_type == "s2_accountability":
         prompt = (
@@ -421,17 +1016,8 @@ def extract_structured(text: str, extraction_type: str) -> dict:
         return {}
 
     try:
-        resp = anthropic_client.messages.create(
-            model="claude-sonnet-4-5",
-            max_tokens=512,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        raw = resp.content[0].text.strip()
-        raw = re.sub(r"^```json\s*", "", raw)
-        raw = re.sub(r"```$", "", raw).strip()
-        result = json.loads(raw)
-        _extraction_cache[cache_key] = result
-        sleep(0.3)
+        result = _claude_json(prompt, max_tokens=512)
+        extraction_cache[cache_key] = result
         return result
     except Exception as e:
         print(f"    [extract_structured] failed for {extraction_type}: {e}")
@@ -439,103 +1025,280 @@ def extract_structured(text: str, extraction_type: str) -> dict:
 
 
 # =============================================================================
-# Sankey label deduplication via LLM clustering
-# Cache is persisted to SANKEY_CACHE_FILE so clustering only runs once.
+# Sankey label deduplication
+# Both backends (LABEL_CANONICALIZER) assign labels incrementally against a
+# per-(context, label) store persisted to SANKEY_CACHE_FILE: labels already
+# mapped keep their canonical, only unseen labels are clustered.
 # =============================================================================
 
-_sankey_label_cache: dict[str, dict] = {}
+# {context: {label: canonical}}; None until first use (see _load_sankey_cache)
+_sankey_label_cache: dict[str, dict[str, str]] | None = None
+
+
+def _migrate_sankey_cache(raw: dict) -> dict[str, dict[str, str]]:
+    """
+    Fold legacy entries keyed "context::label1:label2:..." (one per full label
+    set) into the per-label layout. The first mapping seen for a label wins.
+    """
+    store: dict[str, dict[str, str]] = {}
+    for key, mapping in raw.items():
+        context = key.split("::", 1)[0]
+        known   = store.setdefault(context, {})
+        for label, canonical in mapping.items():
+            known.setdefault(label, canonical)
+    return store
 
 
-def _load_sankey_cache() -> None:
+def _load_sankey_cache() -> dict[str, dict[str, str]]:
     global _sankey_label_cache
-    if SANKEY_CACHE_FILE.exists():
-        with open(SANKEY_CACHE_FILE, "r", encoding="utf-8") as f:
-            _sankey_label_cache = json.load(f)
+    if _sankey_label_cache is None:
+        _sankey_label_cache = {}
+        if SANKEY_CACHE_FILE.exists():
+            with open(SANKEY_CACHE_FILE, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if any("::" in key for key in raw):
+                print(f"  [migrate] {SANKEY_CACHE_FILE} → per-label layout")
+                raw = _migrate_sankey_cache(raw)
+            _sankey_label_cache = raw
+    return _sankey_label_cache
 
 
 def _save_sankey_cache() -> None:
+    if _sankey_label_cache is None:
+        return
     SANKEY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(SANKEY_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(_sankey_label_cache, f, indent=2, ensure_ascii=False)
+        json.dump(_sankey_label_cache, f, indent=2, ensure_ascii=False, sort_keys=True)
 
 
-def get_sankey_label_mapping(labels: list[str], context: str) -> dict[str, str]:
+def cluster_labels(embs: np.ndarray, threshold: float = LABEL_SIM_THRESHOLD) -> list[int]:
     """
-    Use Claude Sonnet to cluster synonym labels and return a canonical mapping.
-    Cache key is context + sorted label set. Returns {original: canonical}.
+    Average-linkage agglomerative clustering on cosine distance; labels whose
+    clusters are at least `threshold` similar are merged. Returns a cluster id per row.
     """
-    if not labels:
-        return {}
-    cache_key = f"{context}::{':'.join(sorted(labels))}"
-    if cache_key in _sankey_label_cache:
-        return _sankey_label_cache[cache_key]
+    if len(embs) < 2:
+        return [0] * len(embs)
+    from scipy.cluster.hierarchy import fcluster, linkage
+    from scipy.spatial.distance import pdist
+    dist = np.clip(pdist(normalize_rows(embs), metric="cosine"), 0.0, None)
+    tree = linkage(dist, method="average")
+    return fcluster(tree, t=1.0 - threshold, criterion="distance").tolist()
+
+
+def medoid_label(labels: list[str], sims: np.ndarray) -> str:
+    """Label with the highest total similarity to the rest (ties: shortest, then A–Z)."""
+    totals = sims.sum(axis=1)
+    best   = min(range(len(labels)),
+                 key=lambda i: (-round(float(totals[i]), 6), len(labels[i]), labels[i]))
+    return labels[best]
+
 
+def _llm_same_concept(label: str, canonical: str, context: str) -> bool:
+    """Tie-breaker: ask Claude whether `label` is a near-synonym of `canonical`."""
     prompt = (
         "You are a research assistant deduplicating labels in a Sankey diagram "
-        f"for an AI governance study (context: {context}). "
-        "Some labels below are near-synonyms or paraphrases of the same concept.\n\n"
-        "Map every label to its best canonical form. "
-        "Near-synonyms should share the same canonical label. "
-        "If a label is already canonical (no synonym in the list), map it to itself.\n\n"
-        f"Labels:\n{json.dumps(labels, indent=2)}\n\n"
-        "Respond ONLY with a JSON object mapping each input label to its canonical form. "
-        "No preamble, no markdown.\n"
-        'Example: {"independent audit": "independent audit", '
-        '"third-party audit": "independent audit"}'
+        f"for an AI governance study (context: {context}).\n\n"
+        f"Label A: {json.dumps(label)}\nLabel B: {json.dumps(canonical)}\n\n"
+        "Are these near-synonyms or paraphrases of the same concept? "
+        'Respond ONLY with a JSON object: {"same": true} or {"same": false}.'
     )
-
     try:
-        resp = anthropic_client.messages.create(
-            model="claude-sonnet-4-5",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        raw = resp.content[0].text.strip()
-        raw = re.sub(r"^```json\s*", "", raw)
-        raw = re.sub(r"```$", "", raw).strip()
-        mapping = json.loads(raw)
-        # Ensure every input label is present
-        for label in labels:
-            if label not in mapping:
-                mapping[label] = label
-        _sankey_label_cache[cache_key] = mapping
-        sleep(0.3)
-        return mapping
+        return bool(_claude_json(prompt, max_tokens=32).get("same"))
     except Exception as e:
-        print(f"    [get_sankey_label_mapping] failed: {e}")
-        identity = {label: label for label in labels}
-        _sankey_label_cache[cache_key] = identity
-        return identity
+        print(f"    [label tie-break] failed: {e}")
+        return False
+
+
+def canonicalize_labels(labels: list[str], context: str) -> dict[str, str]:
+    """
+    Map labels to canonical forms by embedding similarity, incrementally:
+    labels already in the per-context map keep their canonical; a new label joins
+    the nearest existing canonical when similar enough, otherwise new labels are
+    clustered among themselves and each cluster's medoid becomes a canonical.
+    Returns {original: canonical}.
+    """
+    known = _load_sankey_cache().setdefault(context, {})
+    new   = [l for l in dict.fromkeys(labels) if l not in known]
+    if new:
+        store     = get_embedding_store()
+        canonical = sorted(set(known.values()))
+        canon_emb = store.encode(canonical) if canonical else None
+        new_embs  = store.encode(new)
+
+        # 1. Attach to existing canonicals
+        unassigned = []
+        if canonical:
+            sims = cosine_matrix(new_embs, canon_emb)
+            for i, label in enumerate(new):
+                j    = int(sims[i].argmax())
+                best = float(sims[i, j])
+                if best >= LABEL_SIM_THRESHOLD:
+                    known[label] = canonical[j]
+                else:
+                    unassigned.append(i)
+        else:
+            unassigned = list(range(len(new)))
+
+        # 2. Cluster the rest; medoids become canonicals (optionally merged into a
+        #    near-miss existing canonical by the LLM tie-breaker)
+        if unassigned:
+            sub_labels = [new[i] for i in unassigned]
+            sub_embs   = new_embs[unassigned]
+            clusters: dict[int, list[int]] = defaultdict(list)
+            for k, cid in enumerate(cluster_labels(sub_embs)):
+                clusters[cid].append(k)
+            for members in sorted(clusters.values()):
+                member_labels = [sub_labels[k] for k in members]
+                centre = medoid_label(member_labels, cosine_matrix(sub_embs[members]))
+                target = centre
+                if LABEL_LLM_TIEBREAK and canonical:
+                    c_emb = store.encode([centre])
+                    sims  = cosine_matrix(c_emb, store.encode(canonical))[0]
+                    j     = int(sims.argmax())
+                    if (LABEL_SIM_THRESHOLD - LABEL_TIEBREAK_MARGIN <= sims[j] < LABEL_SIM_THRESHOLD
+                            and _llm_same_concept(centre, canonical[j], context)):
+                        target = canonical[j]
+                for label in member_labels:
+                    known[label] = target
+                if target == centre:
+                    canonical.append(centre)
+
+    return {label: known[label] for label in labels}
+
+
+def llm_canonicalize_labels(labels: list[str], context: str) -> dict[str, str]:
+    """
+    Claude backend, incremental like canonicalize_labels(): unseen labels are sent
+    in batches of LABEL_LLM_BATCH together with the current canonical labels, and
+    each is mapped to one of those canonicals or kept as a new one.
+    Failed batches are left unmapped (identity for this run) and retried next run.
+    """
+    known = _load_sankey_cache().setdefault(context, {})
+    new   = [l for l in dict.fromkeys(labels) if l not in known]
+    for start in range(0, len(new), LABEL_LLM_BATCH):
+        batch     = new[start:start + LABEL_LLM_BATCH]
+        canonical = sorted(set(known.values()))
+        prompt = (
+            "You are a research assistant deduplicating labels in a Sankey diagram "
+            f"for an AI governance study (context: {context}). "
+            "Some labels below are near-synonyms or paraphrases of the same concept.\n\n"
+            "Map every new label to its best canonical form. If it is a near-synonym of "
+            "an existing canonical label, use that label exactly. Near-synonyms among the "
+            "new labels should share the same canonical label. "
+            "If a label has no synonym, map it to itself.\n\n"
+            f"Existing canonical labels:\n{json.dumps(canonical, indent=2)}\n\n"
+            f"New labels:\n{json.dumps(batch, indent=2)}\n\n"
+            "Respond ONLY with a JSON object mapping each new label to its canonical form. "
+            "No preamble, no markdown.\n"
+            'Example: {"third-party audit": "independent audit", '
+            '"ombudsman": "ombudsman"}'
+        )
+        try:
+            mapping = _claude_json(prompt, max_tokens=1024)
+        except Exception as e:
+            print(f"    [get_sankey_label_mapping] failed: {e}")
+            continue
+        for label in batch:
+            target = mapping.get(label)
+            known[label] = target if isinstance(target, str) and target else label
+
+    return {label: known.get(label, label) for label in labels}
+
+
+def get_sankey_label_mapping(labels: list[str], context: str) -> dict[str, str]:
+    """
+    Cluster synonym labels and return a canonical mapping {original: canonical},
+    using the backend selected by LABEL_CANONICALIZER.
+    """
+    if not labels:
+        return {}
+    if LABEL_CANONICALIZER == "llm":
+        return llm_canonicalize_labels(labels, context)
+    return canonicalize_labels(labels, context)
+
+
+# =============================================================================
+# Sankey LLM prefetch
+# Runs every extraction and label-clustering call the Sankeys need through a
+# bounded thread pool (paced by LLM_RPM), so the builders below only read caches.
+# =============================================================================
+
+# extraction_type -> [(field, get_sankey_label_mapping context)]
+SANKEY_EXTRACTIONS = {
+    "I2_S2": ("s2_accountability", [("responsible_parties", "accountability_responsible_parties"),
+                                    ("mechanisms",          "accountability_mechanisms")]),
+    "I2_S3": ("s3_enforcement",    [("challenges",          "enforcement_challenges"),
+                                    ("solutions",           "enforcement_solutions")]),
+}
+
+
+def prefetch_sankey_llm(i2_data: InstrumentView | None, i5_data: InstrumentView | None,
+                        models: list[str]) -> None:
+    _load_extraction_cache()
+    _load_sankey_cache()
+
+    jobs = []
+    if i2_data:
+        for q_id, (etype, _) in SANKEY_EXTRACTIONS.items():
+            for model in models:
+                for cond in CONDITIONS:
+                    text = get_run1(i2_data, model, cond, q_id)
+                    if text:
+                        jobs.append((q_id, text, etype))
+
+    label_sets: dict[str, list[str]] = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=LLM_WORKERS) as pool:
+        if jobs:
+            print(f"  {len(jobs)} extractions ({LLM_WORKERS} workers, {LLM_RPM} rpm)")
+        extracted = pool.map(lambda job: extract_structured(job[1], job[2]), jobs)
+        for (q_id, _, _), result in zip(jobs, extracted):
+            for field, context in SANKEY_EXTRACTIONS[q_id][1]:
+                label_sets[context].extend(result.get(field, []))
+
+        if i5_data:
+            for _, stype, juris in i5_flow_labels(i5_data, models):
+                label_sets["i5_source_types"].append(stype)
+                label_sets["i5_jurisdictions"].append(juris)
+
+        mapping_jobs = [(context, list(dict.fromkeys(labels)))
+                        for context, labels in label_sets.items() if labels]
+        if mapping_jobs:
+            print(f"  {len(mapping_jobs)} label mappings")
+        list(pool.map(lambda job: get_sankey_label_mapping(job[1], job[0]), mapping_jobs))
 
 
 # =============================================================================
 # INSTRUMENT 1 plots
 # =============================================================================
 
-def i1_wordfreq_heatmap(data: dict, q_id: str, q_label: str,
-                         models: list[str]) -> go.Figure:
-    col_labels, col_freqs = [], {}
+def i1_wordfreq_heatmap_data(data: InstrumentView, q_id: str, q_label: str,
+                              models: list[str]) -> dict:
+    tm = get_term_matrix(data)
+    columns, groups = [], []
     for model in models:
         for cond in CONDITIONS:
-            texts = get_responses(data, model, cond, q_id)
-            if not texts:
-                continue
-            tokens = tokenize(" ".join(texts))
-            total  = len(tokens) or 1
-            label  = f"{MODEL_LABELS.get(model, model)}<br>({CONDITION_LABELS[cond]})"
-            col_labels.append(label)
-            col_freqs[label] = {w: c / total for w, c in Counter(tokens).items()}
-
-    global_ctr = Counter()
-    for freq in col_freqs.values():
-        global_ctr.update(freq)
-    top_words = [w for w, _ in global_ctr.most_common(TOP_N_WORDS)]
+            docs = tm.docs([model], [cond], q_id)
+            if docs:
+                columns.append([model, cond])
+                groups.append(docs)
+
+    # Rank words by relative frequency summed over columns
+    term_ids, freqs = tm.frequencies(groups)
+    top = tm.top_terms(term_ids, freqs.sum(axis=0), [d for g in groups for d in g], TOP_N_WORDS)
+    return {
+        "q_label": q_label,
+        "columns": columns,
+        "words":   [tm.terms[term_ids[i]] for i in top],
+        "z":       freqs[:, top].T.tolist(),
+    }
 
-    z = [[col_freqs.get(col, {}).get(w, 0.0) for col in col_labels]
-         for w in top_words]
 
+def i1_wordfreq_heatmap(d: dict) -> go.Figure:
+    q_label    = d["q_label"]
+    col_labels = [f"{MODEL_LABELS.get(model, model)}<br>({CONDITION_LABELS[cond]})"
+                  for model, cond in d["columns"]]
     fig = go.Figure(go.Heatmap(
-        z=z, x=col_labels, y=top_words,
+        z=d["z"], x=col_labels, y=d["words"],
         colorscale=COLORSCALE_REDBLUE,
         colorbar=dict(title="Norm. Freq", tickfont=dict(color=TEXT_SEC)),
         hovertemplate="<b>%{y}</b><br>%{x}<br>Freq: %{z:.4f}<extra></extra>",
@@ -547,9 +1310,58 @@ def i1_wordfreq_heatmap(data: dict, q_id: str, q_label: str,
     return fig
 
 
-def i1_cross_model_similarity(data: dict, models: list[str],
-                               embed_model: SentenceTransformer) -> go.Figure:
-    labels  = [MODEL_LABELS.get(m, m) for m in models]
+def i1_distinctive_words_heatmap_data(data: InstrumentView, q_id: str, q_label: str,
+                                      models: list[str], contrast: str = "model") -> dict:
+    """
+    Log-odds z-scores: rows = each model's LOGODDS_TOP_K most distinctive
+    terms, cols = models. contrast="model" scores each model vs the others;
+    contrast="ceo" scores CEO vs baseline within each model.
+    """
+    dw  = distinctive_words(get_term_matrix(data), q_id, models)
+    out = {"q_label": q_label, "contrast": contrast, "models": models, "terms": [], "z": []}
+    if dw["terms"]:
+        z_all = dw[f"{contrast}_z"]
+        cols  = top_distinctive(z_all, LOGODDS_TOP_K, absolute=(contrast == "ceo"))
+        out["terms"] = [dw["terms"][c] for c in cols]
+        out["z"]     = z_all[:, cols].T.tolist()
+    return out
+
+
+def i1_distinctive_words_heatmap(d: dict) -> go.Figure:
+    q_label, contrast, terms, z = d["q_label"], d["contrast"], d["terms"], d["z"]
+    if not terms:
+        fig = go.Figure()
+        fig.update_layout(**base_layout(f"Distinctive Words — {q_label} — No data"))
+        return fig
+
+    zmax = float(np.abs(np.array(z)).max()) or 1.0
+
+    if contrast == "ceo":
+        title = (f"CEO vs Baseline Vocabulary — <b>{q_label}</b><br>"
+                 "<sup>Log-odds z-score with informative Dirichlet prior — "
+                 "positive = CEO role, negative = baseline</sup>")
+    else:
+        title = (f"Distinctive Words — <b>{q_label}</b><br>"
+                 "<sup>Log-odds z-score with informative Dirichlet prior — "
+                 "each model vs all other models</sup>")
+
+    fig = go.Figure(go.Heatmap(
+        z=z, x=[MODEL_LABELS.get(m, m) for m in d["models"]], y=terms,
+        text=[[f"{v:+.1f}" for v in row] for row in z],
+        texttemplate="%{text}", textfont=dict(size=10, color=TEXT_PRI),
+        colorscale=COLORSCALE_DIVERGE, zmid=0, zmin=-zmax, zmax=zmax,
+        colorbar=dict(title="z", tickfont=dict(color=TEXT_SEC)),
+        hovertemplate="<b>%{y}</b><br>%{x}<br>z: %{z:+.2f}<extra></extra>",
+    ))
+    fig.update_layout(**base_layout(title, height=max(460, 24 * len(terms) + 220), width=1000))
+    fig.update_yaxes(autorange="reversed", tickfont=dict(color=TEXT_PRI, size=11),
+                     gridcolor=BORDER)
+    fig.update_xaxes(tickangle=-25, tickfont=dict(color=TEXT_PRI, size=11))
+    return fig
+
+
+def i1_cross_model_similarity_data(data: InstrumentView, models: list[str],
+                                    embed_model: EmbeddingStore) -> dict:
     n       = len(models)
     sim_sum = np.zeros((n, n))
     count   = 0
@@ -560,14 +1372,19 @@ def i1_cross_model_similarity(data: dict, models: list[str],
             texts = []
             for cond in CONDITIONS:
                 texts.extend(get_responses(data, model, cond, q_id))
-            embs.append(avg_embedding(texts, embed_model) if texts else np.zeros(384))
-        for i in range(n):
-            for j in range(n):
-                sim_sum[i][j] += cosine_sim(embs[i], embs[j])
+            embs.append(avg_embedding(texts, embed_model) if texts else None)
+        dim  = next((len(e) for e in embs if e is not None), 1)
+        embs = np.stack([e if e is not None else np.zeros(dim) for e in embs])
+        sim_sum += cosine_matrix(embs)
         count += 1
 
-    mat = (sim_sum / max(count, 1)).tolist()
-    fig = go.Figure(go.Heatmap(
+    return {"models": models, "similarity": (sim_sum / max(count, 1)).tolist()}
+
+
+def i1_cross_model_similarity(d: dict) -> go.Figure:
+    labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    mat    = d["similarity"]
+    fig    = go.Figure(go.Heatmap(
         z=mat, x=labels, y=labels,
         colorscale=COLORSCALE_REDBLUE, zmin=0.5, zmax=1.0,
         text=[[f"{v:.3f}" for v in row] for row in mat],
@@ -585,22 +1402,30 @@ def i1_cross_model_similarity(data: dict, models: list[str],
     return fig
 
 
-def i1_baseline_vs_ceo(data: dict, models: list[str],
-                        embed_model: SentenceTransformer) -> go.Figure:
-    labels   = [MODEL_LABELS.get(m, m) for m in models]
-    q_labels = list(I1_QUESTIONS.values())
-    q_ids    = list(I1_QUESTIONS.keys())
-
+def i1_baseline_vs_ceo_data(data: InstrumentView, models: list[str],
+                             embed_model: EmbeddingStore, h1_stats: dict | None = None) -> dict:
     z = []
-    for q_id in q_ids:
-        row = []
-        for model in models:
-            b   = get_responses(data, model, "baseline", q_id)
-            c   = get_responses(data, model, "ceo",      q_id)
-            sim = cosine_sim(avg_embedding(b, embed_model),
-                             avg_embedding(c, embed_model)) if b and c else None
-            row.append(sim)
+    for q_id in I1_QUESTIONS:
+        row, present, b_embs, c_embs = [None] * len(models), [], [], []
+        for k, model in enumerate(models):
+            b = get_responses(data, model, "baseline", q_id)
+            c = get_responses(data, model, "ceo",      q_id)
+            if b and c:
+                present.append(k)
+                b_embs.append(avg_embedding(b, embed_model))
+                c_embs.append(avg_embedding(c, embed_model))
+        if present:
+            for k, sim in zip(present, rowwise_cosine(np.stack(b_embs), np.stack(c_embs))):
+                row[k] = float(sim)
         z.append(row)
+    return {"models": models, "questions": list(I1_QUESTIONS), "similarity": z,
+            "h1": h1_stats}
+
+
+def i1_baseline_vs_ceo(d: dict) -> go.Figure:
+    labels   = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    q_labels = [I1_QUESTIONS[q] for q in d["questions"]]
+    z        = d["similarity"]
 
     text = [[f"{v:.3f}" if v is not None else "N/A" for v in row] for row in z]
     fig  = go.Figure(go.Heatmap(
@@ -617,6 +1442,16 @@ def i1_baseline_vs_ceo(data: dict, models: list[str],
     ))
     fig.update_yaxes(autorange="reversed", tickfont=dict(color=TEXT_PRI))
     fig.update_xaxes(tickangle=-25, tickfont=dict(color=TEXT_PRI))
+    # Annotate with H1 stats
+    if d.get("h1"):
+        h1  = d["h1"]
+        ann = (f"H1 paired t-test (n={h1['n']}): t={h1['t']:.3f}, p={h1['p']:.4f} | "
+               f"within-I1={h1['within_mean']:.3f}, I1→I2={h1['cross_mean']:.3f} | "
+               f"supported={h1['supported']}")
+        current_title = fig.layout.title.text or ""
+        fig.update_layout(
+            title_text=current_title + f"<br><sup style='font-size:11px'>{ann}</sup>"
+        )
     return fig
 
 
@@ -624,30 +1459,27 @@ def i1_baseline_vs_ceo(data: dict, models: list[str],
 # INSTRUMENT 2 — S1: Word frequency
 # =============================================================================
 
-def i2_s1_wordfreq_cross_model(data: dict, models: list[str]) -> go.Figure:
-    col_labels, col_freqs = [], {}
+def i2_s1_wordfreq_cross_model_data(data: InstrumentView, models: list[str]) -> dict:
+    tm = get_term_matrix(data)
+    columns, groups = [], []
     for model in models:
-        texts = []
-        for cond in CONDITIONS:
-            texts.extend(get_responses(data, model, cond, "I2_S1"))
-        if not texts:
-            continue
-        tokens = tokenize(" ".join(texts))
-        total  = len(tokens) or 1
-        label  = MODEL_LABELS.get(model, model)
-        col_labels.append(label)
-        col_freqs[label] = {w: c / total for w, c in Counter(tokens).items()}
-
-    global_ctr = Counter()
-    for freq in col_freqs.values():
-        global_ctr.update(freq)
-    top_words = [w for w, _ in global_ctr.most_common(TOP_N_WORDS)]
+        docs = tm.docs([model], CONDITIONS, "I2_S1")
+        if docs:
+            columns.append(model)
+            groups.append(docs)
+
+    term_ids, freqs = tm.frequencies(groups)
+    top = tm.top_terms(term_ids, freqs.sum(axis=0), [d for g in groups for d in g], TOP_N_WORDS)
+    return {
+        "columns": columns,
+        "words":   [tm.terms[term_ids[i]] for i in top],
+        "z":       freqs[:, top].T.tolist(),
+    }
 
-    z = [[col_freqs.get(col, {}).get(w, 0.0) for col in col_labels]
-         for w in top_words]
 
+def i2_s1_wordfreq_cross_model(d: dict) -> go.Figure:
     fig = go.Figure(go.Heatmap(
-        z=z, x=col_labels, y=top_words,
+        z=d["z"], x=[MODEL_LABELS.get(m, m) for m in d["columns"]], y=d["words"],
         colorscale=COLORSCALE_REDBLUE,
         colorbar=dict(title="Norm. Freq", tickfont=dict(color=TEXT_SEC)),
         hovertemplate="<b>%{y}</b><br>%{x}<br>Freq: %{z:.4f}<extra></extra>",
@@ -663,29 +1495,37 @@ def i2_s1_wordfreq_cross_model(data: dict, models: list[str]) -> go.Figure:
     return fig
 
 
-def i2_s1_wordfreq_baseline_vs_ceo(data: dict, models: list[str]) -> go.Figure:
-    n   = len(models)
+def i2_s1_wordfreq_baseline_vs_ceo_data(data: InstrumentView, models: list[str]) -> dict:
+    # One group per model × condition; top words by raw count across all of them
+    tm       = get_term_matrix(data)
+    cells    = [(model, cond) for model in models for cond in CONDITIONS]
+    groups   = [tm.docs([model], [cond], "I2_S1") for model, cond in cells]
+    term_ids, freqs = tm.frequencies(groups)
+    counts   = np.asarray(tm.group_counts(groups)[:, term_ids].sum(axis=0)).ravel()
+    top      = tm.top_terms(term_ids, counts, [d for g in groups for d in g], 15)
+    cell_vals = freqs[:, top].tolist()
+    return {
+        "models": models,
+        "words":  [tm.terms[term_ids[i]] for i in top],
+        "freq":   {model: {cond: cell_vals[k * len(CONDITIONS) + j]
+                           for j, cond in enumerate(CONDITIONS)}
+                   for k, model in enumerate(models)},
+    }
+
+
+def i2_s1_wordfreq_baseline_vs_ceo(d: dict) -> go.Figure:
+    models    = d["models"]
+    top_words = d["words"]
     fig = make_subplots(
-        rows=1, cols=n,
+        rows=1, cols=len(models),
         subplot_titles=[MODEL_LABELS.get(m, m) for m in models],
         shared_yaxes=True,
     )
-
-    global_ctr = Counter()
-    for model in models:
-        for cond in CONDITIONS:
-            texts = get_responses(data, model, cond, "I2_S1")
-            global_ctr.update(tokenize(" ".join(texts)))
-    top_words  = [w for w, _ in global_ctr.most_common(15)]
     bar_colors = {"baseline": "#2176ae", "ceo": "#d97706"}
 
     for col_idx, model in enumerate(models, start=1):
         for cond in CONDITIONS:
-            texts  = get_responses(data, model, cond, "I2_S1")
-            tokens = tokenize(" ".join(texts))
-            total  = len(tokens) or 1
-            freqs  = Counter(tokens)
-            vals   = [freqs.get(w, 0) / total for w in top_words]
+            vals = d["freq"][model][cond]
             fig.add_trace(
                 go.Bar(
                     name=CONDITION_LABELS[cond],
@@ -731,30 +1571,89 @@ def i2_s1_wordfreq_baseline_vs_ceo(data: dict, models: list[str]) -> go.Figure:
 # INSTRUMENT 2 — S2: Responsibility radar + Accountability mechanisms Sankey
 # =============================================================================
 
-def i2_s2_responsibility_radar(data: dict, models: list[str]) -> go.Figure:
-    actors = list(ACTOR_KEYWORDS.keys())
+class ActorMatcher:
+    """
+    All ACTOR_KEYWORDS compiled into one alternation regex, so each response
+    is scanned once for every actor. A match is credited to every keyword it
+    starts with ("regulatory" counts for both "regulator" and "regulatory"),
+    which reproduces the counts of one word-prefix search per keyword.
+    Per-response counts are cached by text.
+    """
+
+    def __init__(self, actor_keywords: dict[str, list[str]]):
+        self.actors   = list(actor_keywords)
+        self.keywords = [(kw.lower(), i) for i, kws in enumerate(actor_keywords.values())
+                         for kw in kws]
+        alternation   = "|".join(re.escape(kw) for kw in
+                                 sorted({kw for kw, _ in self.keywords}, key=len, reverse=True))
+        self.pattern  = re.compile(rf"\b(?:{alternation})\w*\b")
+        self._match_counts: dict[str, np.ndarray] = {}
+        self._cache: dict[str, tuple[np.ndarray, int]] = {}
+
+    def _credit(self, match: str) -> np.ndarray:
+        vec = self._match_counts.get(match)
+        if vec is None:
+            vec = np.zeros(len(self.actors), dtype=np.int64)
+            for kw, actor in self.keywords:
+                if match.startswith(kw):
+                    vec[actor] += 1
+            self._match_counts[match] = vec
+        return vec
+
+    def counts(self, text: str) -> tuple[np.ndarray, int]:
+        """(keyword hits per actor, word count) for one response."""
+        if text not in self._cache:
+            lowered = text.lower()
+            hits    = np.zeros(len(self.actors), dtype=np.int64)
+            for match, n in Counter(self.pattern.findall(lowered)).items():
+                hits += n * self._credit(match)
+            self._cache[text] = (hits, len(lowered.split()))
+        return self._cache[text]
+
+    def total_counts(self, texts: list[str]) -> tuple[np.ndarray, int]:
+        """Summed (hits per actor, word count) over several responses."""
+        hits, words = np.zeros(len(self.actors), dtype=np.int64), 0
+        for text in texts:
+            h, w = self.counts(text)
+            hits, words = hits + h, words + w
+        return hits, words
+
+
+_actor_matcher: ActorMatcher | None = None
+
+
+def get_actor_matcher() -> ActorMatcher:
+    global _actor_matcher
+    if _actor_matcher is None:
+        _actor_matcher = ActorMatcher(ACTOR_KEYWORDS)
+    return _actor_matcher
+
+
+def i2_s2_responsibility_radar_data(data: InstrumentView, models: list[str]) -> dict:
+    """Actor keyword hits per 1000 words, per model × condition."""
+    matcher = get_actor_matcher()
+    scores  = {}
+    for model in models:
+        scores[model] = {}
+        for cond in CONDITIONS:
+            hits, words = matcher.total_counts(get_responses(data, model, cond, "I2_S2"))
+            total       = words or 1
+            scores[model][cond] = [int(h) / total * 1000 for h in hits]
+    return {"models": models, "actors": matcher.actors, "scores": scores}
+
+
+def i2_s2_responsibility_radar(d: dict) -> go.Figure:
+    actors      = d["actors"]
     axes_closed = actors + [actors[0]]
 
     fig = go.Figure()
 
-    for model in models:
+    for model in d["models"]:
         label = MODEL_LABELS.get(model, model)
         color = MODEL_COLORS.get(model, "#888888")
 
         for cond in CONDITIONS:
-            texts    = get_responses(data, model, cond, "I2_S2")
-            combined = " ".join(texts).lower()
-            total    = len(combined.split()) or 1
-
-            scores = []
-            for actor in actors:
-                keywords = ACTOR_KEYWORDS[actor]
-                count = sum(
-                    len(re.findall(rf"\b{kw}\w*\b", combined))
-                    for kw in keywords
-                )
-                scores.append(count / total * 1000)
-
+            scores        = d["scores"][model][cond]
             scores_closed = scores + [scores[0]]
 
             fig.add_trace(go.Scatterpolar(
@@ -799,10 +1698,75 @@ def i2_s2_responsibility_radar(data: dict, models: list[str]) -> go.Figure:
     return fig
 
 
-def i2_s2_accountability_sankey(data: dict, models: list[str]) -> go.Figure:
+def sankey_data(nodes: list[str], source_nodes: list[str], middle_nodes: list[str],
+                models: list[str], links: list[list], matches) -> dict:
+    """
+    Render-ready three-tier Sankey: node labels with their tier ("source",
+    "middle" or "target") and, for source nodes, the model matches(label, node)
+    first attributes them to. links are [source idx, target idx, weight, model
+    or None]; links out of a model carry its colour.
+    """
+    node_models = []
+    for n in nodes:
+        node_models.append(next((m for m in models if matches(MODEL_LABELS.get(m, m), n)), None)
+                           if n in source_nodes else None)
+    kinds = ["source" if n in source_nodes else "middle" if n in middle_nodes else "target"
+             for n in nodes]
+    return {"nodes": nodes, "kinds": kinds, "node_models": node_models, "links": links}
+
+
+def sankey_figure(d: dict, middle_color: str, target_color: str, title: str,
+                  value_name: str) -> go.Figure:
+    nodes = d["nodes"]
+    node_colors = []
+    for kind, model in zip(d["kinds"], d["node_models"]):
+        if kind == "source":
+            node_colors.append(MODEL_COLORS.get(model, "#9ca3af") if model else "#9ca3af")
+        else:
+            node_colors.append(middle_color if kind == "middle" else target_color)
+
+    link_src, link_tgt, link_val, link_color, link_label = [], [], [], [], []
+    for src, tgt, w, model in d["links"]:
+        link_src.append(src)
+        link_tgt.append(tgt)
+        link_val.append(w)
+        link_color.append(hex_to_rgba(MODEL_COLORS.get(model, "#888888")) if model
+                          else "rgba(160,168,176,0.6)")
+        link_label.append(f"{nodes[src]} → {nodes[tgt]}")
+
+    fig = go.Figure(go.Sankey(
+        arrangement="snap",
+        node=dict(
+            pad=20, thickness=18,
+            line=dict(color=BORDER, width=0.5),
+            label=nodes, color=node_colors,
+            hovertemplate="<b>%{label}</b><br>Flow: %{value}<extra></extra>",
+        ),
+        link=dict(
+            source=link_src, target=link_tgt, value=link_val,
+            color=link_color, label=link_label,
+            hovertemplate=f"%{{label}}<br>{value_name}: %{{value}}<extra></extra>",
+        ),
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text=title,
+            font=dict(family=SERIF, size=16, color=TEXT_PRI),
+            x=0.5, xanchor="center",
+        ),
+        paper_bgcolor=BG,
+        font=dict(family=MONO, color=TEXT_PRI, size=11),
+        margin=dict(l=40, r=40, t=100, b=40),
+        height=700, width=1400,
+    )
+    return fig
+
+
+def i2_s2_accountability_sankey_data(data: InstrumentView, models: list[str]) -> dict:
     """
-    Sankey: model × condition → responsible parties → accountability mechanisms.
-    Includes LLM synonym-deduplication of node labels before building the diagram.
+    Sankey flows: model × condition → responsible parties → accountability
+    mechanisms. Includes synonym-deduplication of node labels.
     """
     print("    Extracting S2 accountability structures via LLM...")
 
@@ -831,16 +1795,16 @@ def i2_s2_accountability_sankey(data: dict, models: list[str]) -> go.Figure:
                 for mech in mechanisms:
                     flow_records.append((src_label, party, mech))
 
-    # ---- LLM label deduplication ----
+    # ---- Label deduplication ----
     unique_parties = list(dict.fromkeys(all_parties))
     unique_mechs   = list(dict.fromkeys(all_mechanisms))
     if unique_parties:
-        print("    Clustering responsible-party synonyms via LLM...")
+        print("    Clustering responsible-party synonyms...")
         party_map = get_sankey_label_mapping(unique_parties, "accountability_responsible_parties")
     else:
         party_map = {}
     if unique_mechs:
-        print("    Clustering accountability-mechanism synonyms via LLM...")
+        print("    Clustering accountability-mechanism synonyms...")
         mech_map = get_sankey_label_mapping(unique_mechs, "accountability_mechanisms")
     else:
         mech_map = {}
@@ -866,85 +1830,42 @@ def i2_s2_accountability_sankey(data: dict, models: list[str]) -> go.Figure:
         flow1[(src, party)] += 1
         flow2[(party, mech)] += 1
 
-    link_src, link_tgt, link_val, link_color, link_label = [], [], [], [], []
-
+    links = []
     for model in models:
         label = MODEL_LABELS.get(model, model)
-        color = MODEL_COLORS.get(model, "#888888")
-        rgba  = hex_to_rgba(color)
         for cond in CONDITIONS:
             src_label = f"{label}\n({CONDITION_LABELS[cond]})"
             for party in party_nodes:
                 w = flow1.get((src_label, party), 0)
                 if w:
-                    link_src.append(node_idx[src_label])
-                    link_tgt.append(node_idx[party])
-                    link_val.append(w)
-                    link_color.append(rgba)
-                    link_label.append(f"{src_label} → {party}")
+                    links.append([node_idx[src_label], node_idx[party], w, model])
 
     for party in party_nodes:
         for mech in mech_nodes:
             w = flow2.get((party, mech), 0)
             if w:
-                link_src.append(node_idx[party])
-                link_tgt.append(node_idx[mech])
-                link_val.append(w)
-                link_color.append("rgba(160,168,176,0.6)")
-                link_label.append(f"{party} → {mech}")
+                links.append([node_idx[party], node_idx[mech], w, None])
 
-    node_colors = []
-    for n in nodes:
-        if n in source_nodes:
-            matched = "#9ca3af"
-            for model in models:
-                if MODEL_LABELS.get(model, model) in n:
-                    matched = MODEL_COLORS.get(model, "#9ca3af")
-                    break
-            node_colors.append(matched)
-        elif n in party_nodes:
-            node_colors.append("#2176ae")
-        else:
-            node_colors.append("#16a34a")
+    return sankey_data(nodes, source_nodes, party_nodes, models, links,
+                       lambda label, n: label in n)
 
-    fig = go.Figure(go.Sankey(
-        arrangement="snap",
-        node=dict(
-            pad=20, thickness=18,
-            line=dict(color=BORDER, width=0.5),
-            label=nodes, color=node_colors,
-            hovertemplate="<b>%{label}</b><br>Flow: %{value}<extra></extra>",
-        ),
-        link=dict(
-            source=link_src, target=link_tgt, value=link_val,
-            color=link_color, label=link_label,
-            hovertemplate="%{label}<br>Weight: %{value}<extra></extra>",
-        ),
-    ))
 
-    fig.update_layout(
-        title=dict(
-            text="S2 Accountability Mechanisms — Model × Role → Responsible Party → Mechanism<br>"
-                 "<sup>Housing denial scenario — LLM-extracted, run 1 per model/condition</sup>",
-            font=dict(family=SERIF, size=16, color=TEXT_PRI),
-            x=0.5, xanchor="center",
-        ),
-        paper_bgcolor=BG,
-        font=dict(family=MONO, color=TEXT_PRI, size=11),
-        margin=dict(l=40, r=40, t=100, b=40),
-        height=700, width=1400,
+def i2_s2_accountability_sankey(d: dict) -> go.Figure:
+    return sankey_figure(
+        d, middle_color="#2176ae", target_color="#16a34a", value_name="Weight",
+        title="S2 Accountability Mechanisms — Model × Role → Responsible Party → Mechanism<br>"
+              "<sup>Housing denial scenario — LLM-extracted, run 1 per model/condition</sup>",
     )
-    return fig
 
 
 # =============================================================================
 # INSTRUMENT 2 — S3: Enforcement challenges → solutions Sankey
 # =============================================================================
 
-def i2_s3_enforcement_sankey(data: dict, models: list[str]) -> go.Figure:
+def i2_s3_enforcement_sankey_data(data: InstrumentView, models: list[str]) -> dict:
     """
-    Sankey: model × condition → enforcement challenges → proposed solutions.
-    Includes LLM synonym-deduplication before building the diagram.
+    Sankey flows: model × condition → enforcement challenges → proposed
+    solutions. Includes synonym-deduplication of node labels.
     """
     print("    Extracting S3 enforcement structures via LLM...")
 
@@ -973,16 +1894,16 @@ def i2_s3_enforcement_sankey(data: dict, models: list[str]) -> go.Figure:
                 for sol in solutions:
                     flow_records.append((src_label, ch, sol))
 
-    # ---- LLM label deduplication ----
+    # ---- Label deduplication ----
     unique_ch  = list(dict.fromkeys(all_challenges))
     unique_sol = list(dict.fromkeys(all_solutions))
     if unique_ch:
-        print("    Clustering enforcement-challenge synonyms via LLM...")
+        print("    Clustering enforcement-challenge synonyms...")
         ch_map = get_sankey_label_mapping(unique_ch, "enforcement_challenges")
     else:
         ch_map = {}
     if unique_sol:
-        print("    Clustering enforcement-solution synonyms via LLM...")
+        print("    Clustering enforcement-solution synonyms...")
         sol_map = get_sankey_label_mapping(unique_sol, "enforcement_solutions")
     else:
         sol_map = {}
@@ -1008,103 +1929,135 @@ def i2_s3_enforcement_sankey(data: dict, models: list[str]) -> go.Figure:
         flow1[(src, ch)]  += 1
         flow2[(ch, sol)]  += 1
 
-    link_src, link_tgt, link_val, link_color, link_label = [], [], [], [], []
-
+    links = []
     for model in models:
         label = MODEL_LABELS.get(model, model)
-        color = MODEL_COLORS.get(model, "#888888")
-        rgba  = hex_to_rgba(color)
         for cond in CONDITIONS:
             src_label = f"{label}\n({CONDITION_LABELS[cond]})"
             for ch in challenge_nodes:
                 w = flow1.get((src_label, ch), 0)
                 if w:
-                    link_src.append(node_idx[src_label])
-                    link_tgt.append(node_idx[ch])
-                    link_val.append(w)
-                    link_color.append(rgba)
-                    link_label.append(f"{src_label} → {ch}")
+                    links.append([node_idx[src_label], node_idx[ch], w, model])
 
     for ch in challenge_nodes:
         for sol in solution_nodes:
             w = flow2.get((ch, sol), 0)
             if w:
-                link_src.append(node_idx[ch])
-                link_tgt.append(node_idx[sol])
-                link_val.append(w)
-                link_color.append("rgba(160,168,176,0.6)")
-                link_label.append(f"{ch} → {sol}")
+                links.append([node_idx[ch], node_idx[sol], w, None])
 
-    node_colors = []
-    for n in nodes:
-        if n in source_nodes:
-            matched = "#9ca3af"
-            for model in models:
-                if MODEL_LABELS.get(model, model) in n:
-                    matched = MODEL_COLORS.get(model, "#9ca3af")
-                    break
-            node_colors.append(matched)
-        elif n in challenge_nodes:
-            node_colors.append("#dc2626")
-        else:
-            node_colors.append("#16a34a")
+    return sankey_data(nodes, source_nodes, challenge_nodes, models, links,
+                       lambda label, n: label in n)
 
-    fig = go.Figure(go.Sankey(
-        arrangement="snap",
-        node=dict(
-            pad=20, thickness=18,
-            line=dict(color=BORDER, width=0.5),
-            label=nodes, color=node_colors,
-            hovertemplate="<b>%{label}</b><br>Flow: %{value}<extra></extra>",
-        ),
-        link=dict(
-            source=link_src, target=link_tgt, value=link_val,
-            color=link_color, label=link_label,
-            hovertemplate="%{label}<br>Weight: %{value}<extra></extra>",
-        ),
-    ))
 
-    fig.update_layout(
-        title=dict(
-            text="S3 Enforcement Challenges → Proposed Solutions<br>"
-                 "<sup>Audit jurisdiction scenario — LLM-extracted, run 1 per model/condition</sup>",
-            font=dict(family=SERIF, size=16, color=TEXT_PRI),
-            x=0.5, xanchor="center",
-        ),
-        paper_bgcolor=BG,
-        font=dict(family=MONO, color=TEXT_PRI, size=11),
-        margin=dict(l=40, r=40, t=100, b=40),
-        height=700, width=1400,
+def i2_s3_enforcement_sankey(d: dict) -> go.Figure:
+    return sankey_figure(
+        d, middle_color="#dc2626", target_color="#16a34a", value_name="Weight",
+        title="S3 Enforcement Challenges → Proposed Solutions<br>"
+              "<sup>Audit jurisdiction scenario — LLM-extracted, run 1 per model/condition</sup>",
     )
-    return fig
 
 
 # =============================================================================
 # INSTRUMENT 3 helpers
 # =============================================================================
 
-def extract_i3_scores(data: dict, models: list[str]) -> dict:
+class I3Scores:
     """
-    Flatten I3 parsed ratings into:
-      scores[model][condition][scenario_id][dimension] -> list of scores per run
+    I3 parsed ratings as a masked array shaped
+      (model, condition, run, scenario, dimension)
+    with one label list (and label -> position index) per axis. Missing runs,
+    scenarios or non-numeric scores are masked, so every summary below is a
+    single masked reduction rather than a loop over nested dicts.
     """
-    scores = {}
-    for model in models:
-        scores[model] = {}
-        for cond in CONDITIONS:
-            scores[model][cond] = {}
-            runs = data.get(model, {}).get(cond, {})
-            for run_num in sorted(runs.keys(), key=int):
-                parsed = runs[run_num].get("parsed")
+
+    MODEL, CONDITION, RUN, SCENARIO, DIM = range(5)
+
+    def __init__(self, values: np.ma.MaskedArray, models: list[str],
+                 conditions: list[str], runs: list[int],
+                 scenarios: list[str], dims: list[str]):
+        self.values     = values
+        self.models     = models
+        self.conditions = conditions
+        self.runs       = runs
+        self.scenarios  = scenarios
+        self.dims       = dims
+        self.model_idx  = {m: i for i, m in enumerate(models)}
+        self.cond_idx   = {c: i for i, c in enumerate(conditions)}
+        self.scen_idx   = {s: i for i, s in enumerate(scenarios)}
+        self.dim_idx    = {d: i for i, d in enumerate(dims)}
+
+    def __bool__(self) -> bool:
+        return bool(self.values.count())
+
+    def model_rows(self, models: list[str]) -> list[int]:
+        return [self.model_idx[m] for m in models]
+
+    def condition(self, cond: str) -> np.ma.MaskedArray:
+        """(model, run, scenario, dimension) slice for one condition."""
+        return self.values[:, self.cond_idx[cond]]
+
+    def cell_mean(self) -> np.ma.MaskedArray:
+        """Mean across runs → (model, condition, scenario, dimension)."""
+        return self.values.mean(axis=self.RUN)
+
+    def cell_std(self) -> np.ma.MaskedArray:
+        """Population std across runs → (model, condition, scenario, dimension)."""
+        return self.values.std(axis=self.RUN)
+
+    def delta(self, cond: str = "ceo", ref: str = "baseline") -> np.ma.MaskedArray:
+        """Run-mean difference cond − ref → (model, scenario, dimension)."""
+        means = self.cell_mean()
+        return means[:, self.cond_idx[cond]] - means[:, self.cond_idx[ref]]
+
+    def pooled(self, cond: str = "baseline") -> np.ma.MaskedArray:
+        """All runs × scenarios of one condition pooled → (model, pooled, dimension)."""
+        v = self.condition(cond)
+        return v.reshape(v.shape[0], -1, v.shape[-1])
+
+
+def extract_i3_scores(data: dict, models: list[str]) -> I3Scores:
+    """
+    Load I3 parsed ratings into an I3Scores tensor. The scenario and dimension
+    axes follow I3_SCENARIOS / I3_DIMENSIONS; the run axis covers every run
+    number that has a parsed response.
+    """
+    scenarios = list(I3_SCENARIOS)
+    dims      = list(I3_DIMENSIONS)
+    runs      = sorted({
+        int(run_num)
+        for model in models for cond in CONDITIONS
+        for run_num, entry in data.get(model, {}).get(cond, {}).items()
+        if entry.get("parsed")
+    })
+    run_idx  = {r: i for i, r in enumerate(runs)}
+    scen_idx = {s: i for i, s in enumerate(scenarios)}
+    dim_idx  = {d: i for i, d in enumerate(dims)}
+
+    values = np.full((len(models), len(CONDITIONS), len(runs), len(scenarios), len(dims)),
+                     np.nan)
+    for mi, model in enumerate(models):
+        for ci, cond in enumerate(CONDITIONS):
+            for run_num, entry in data.get(model, {}).get(cond, {}).items():
+                parsed = entry.get("parsed")
                 if not parsed:
                     continue
-                for s_id, dims in parsed.items():
-                    scores[model][cond].setdefault(s_id, {})
-                    for dim, val in dims.items():
-                        scores[model][cond][s_id].setdefault(dim, [])
-                        if isinstance(val.get("score"), (int, float)):
-                            scores[model][cond][s_id][dim].append(val["score"])
-    return scores
+                ri = run_idx[int(run_num)]
+                for s_id, s_dims in parsed.items():
+                    if s_id not in scen_idx:
+                        continue
+                    for dim, val in s_dims.items():
+                        score = val.get("score")
+                        if dim in dim_idx and isinstance(score, (int, float)):
+                            values[mi, ci, ri, scen_idx[s_id], dim_idx[dim]] = score
+
+    return I3Scores(np.ma.masked_invalid(values), list(models), list(CONDITIONS),
+                    runs, scenarios, dims)
+
+
+def ma_tolist(a: np.ma.MaskedArray) -> list:
+    """Masked array → nested list of floats, None where masked."""
+    a = np.ma.asarray(a)
+    return np.where(np.ma.getmaskarray(a), None, a.filled(0).astype(object)).tolist()
 
 
 def mean_std(values: list) -> tuple[float, float]:
@@ -1118,20 +2071,26 @@ def mean_std(values: list) -> tuple[float, float]:
 # INSTRUMENT 3 plots
 # =============================================================================
 
-def i3_grouped_bar(scores: dict, models: list[str], dimension: str,
-                   dim_label: str) -> go.Figure:
-    scenario_labels = list(I3_SCENARIOS.values())
-    scenario_ids    = list(I3_SCENARIOS.keys())
+def i3_grouped_bar_data(scores: I3Scores, models: list[str], dimension: str,
+                        dim_label: str) -> dict:
+    ci, di = scores.cond_idx["baseline"], scores.dim_idx[dimension]
+    rows   = scores.model_rows(models)
+    return {
+        "models":    models,
+        "scenarios": list(I3_SCENARIOS),
+        "dim_label": dim_label,
+        "mean":      ma_tolist(scores.cell_mean()[rows, ci, :, di]),
+        "std":       scores.cell_std()[rows, ci, :, di].filled(0).tolist(),
+    }
+
+
+def i3_grouped_bar(d: dict) -> go.Figure:
+    scenario_labels = [I3_SCENARIOS[s] for s in d["scenarios"]]
+    dim_label       = d["dim_label"]
     fig = go.Figure()
-    for model in models:
+    for model, means, errors in zip(d["models"], d["mean"], d["std"]):
         label = MODEL_LABELS.get(model, model)
         color = MODEL_COLORS.get(model, "#888888")
-        means, errors = [], []
-        for s_id in scenario_ids:
-            vals = scores.get(model, {}).get("baseline", {}).get(s_id, {}).get(dimension, [])
-            m, s = mean_std(vals)
-            means.append(m)
-            errors.append(s if s is not None else 0)
         fig.add_trace(go.Bar(
             name=label, x=scenario_labels, y=means,
             error_y=dict(type="data", array=errors, visible=True,
@@ -1160,21 +2119,18 @@ def i3_grouped_bar(scores: dict, models: list[str], dimension: str,
     return fig
 
 
-def i3_heatmap(scores: dict, models: list[str], dimension: str,
-               dim_label: str) -> go.Figure:
-    model_labels    = [MODEL_LABELS.get(m, m) for m in models]
-    scenario_labels = list(I3_SCENARIOS.values())
-    scenario_ids    = list(I3_SCENARIOS.keys())
-    z, text = [], []
-    for model in models:
-        row, row_text = [], []
-        for s_id in scenario_ids:
-            vals = scores.get(model, {}).get("baseline", {}).get(s_id, {}).get(dimension, [])
-            m, _ = mean_std(vals)
-            row.append(m)
-            row_text.append(f"{m:.1f}" if m is not None else "N/A")
-        z.append(row)
-        text.append(row_text)
+def i3_heatmap_data(scores: I3Scores, models: list[str], dimension: str,
+                    dim_label: str) -> dict:
+    z = ma_tolist(scores.cell_mean()[scores.model_rows(models),
+                                     scores.cond_idx["baseline"], :, scores.dim_idx[dimension]])
+    return {"models": models, "scenarios": list(I3_SCENARIOS), "dim_label": dim_label, "z": z}
+
+
+def i3_heatmap(d: dict) -> go.Figure:
+    model_labels    = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    scenario_labels = [I3_SCENARIOS[s] for s in d["scenarios"]]
+    dim_label, z    = d["dim_label"], d["z"]
+    text = [[f"{m:.1f}" if m is not None else "N/A" for m in row] for row in z]
     fig = go.Figure(go.Heatmap(
         z=z, x=scenario_labels, y=model_labels,
         text=text, texttemplate="%{text}", textfont=dict(size=12, color=TEXT_PRI),
@@ -1194,20 +2150,22 @@ def i3_heatmap(scores: dict, models: list[str], dimension: str,
     return fig
 
 
-def i3_radar(scores: dict, models: list[str], scenario_id: str,
-             scenario_label: str) -> go.Figure:
-    dims       = list(I3_DIMENSIONS.keys())
-    dim_labels = list(I3_DIMENSIONS.values())
-    closed     = dim_labels + [dim_labels[0]]
+def i3_radar_data(scores: I3Scores, models: list[str], scenario_id: str,
+                  scenario_label: str) -> dict:
+    all_vals = scores.cell_mean()[scores.model_rows(models), scores.cond_idx["baseline"],
+                                  scores.scen_idx[scenario_id]].filled(0).tolist()
+    return {"models": models, "dims": list(I3_DIMENSIONS), "scenario_label": scenario_label,
+            "scores": all_vals}
+
+
+def i3_radar(d: dict) -> go.Figure:
+    dim_labels     = [I3_DIMENSIONS[dim] for dim in d["dims"]]
+    closed         = dim_labels + [dim_labels[0]]
+    scenario_label = d["scenario_label"]
     fig = go.Figure()
-    for model in models:
+    for model, vals in zip(d["models"], d["scores"]):
         label = MODEL_LABELS.get(model, model)
         color = MODEL_COLORS.get(model, "#888888")
-        vals  = []
-        for dim in dims:
-            run_scores = scores.get(model, {}).get("baseline", {}).get(scenario_id, {}).get(dim, [])
-            m, _ = mean_std(run_scores)
-            vals.append(m if m is not None else 0)
         fig.add_trace(go.Scatterpolar(
             r=vals + [vals[0]], theta=closed, mode="lines+markers",
             name=label,
@@ -1233,37 +2191,26 @@ def i3_radar(scores: dict, models: list[str], scenario_id: str,
     return fig
 
 
-def i3_delta_heatmap(scores: dict, models: list[str],
-                     h2_stats: dict | None = None) -> go.Figure:
-    model_labels    = [MODEL_LABELS.get(m, m) for m in models]
-    scenario_labels = list(I3_SCENARIOS.values())
-    scenario_ids    = list(I3_SCENARIOS.keys())
+def i3_delta_heatmap_data(scores: I3Scores, models: list[str],
+                          h2_stats: dict | None = None) -> dict:
+    # CEO − baseline per dimension, averaged over the dimensions present in both
+    z = ma_tolist(scores.delta()[scores.model_rows(models)].mean(axis=-1))
+    return {"models": models, "scenarios": list(I3_SCENARIOS), "delta": z, "h2": h2_stats}
+
+
+def i3_delta_heatmap(d: dict) -> go.Figure:
+    model_labels    = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    scenario_labels = [I3_SCENARIOS[s] for s in d["scenarios"]]
     dims            = list(I3_DIMENSIONS.keys())
-    z, text = [], []
-    for model in models:
-        row, row_text = [], []
-        for s_id in scenario_ids:
-            deltas = []
-            for dim in dims:
-                b_vals = scores.get(model, {}).get("baseline", {}).get(s_id, {}).get(dim, [])
-                c_vals = scores.get(model, {}).get("ceo",      {}).get(s_id, {}).get(dim, [])
-                b_m, _ = mean_std(b_vals)
-                c_m, _ = mean_std(c_vals)
-                if b_m is not None and c_m is not None:
-                    deltas.append(c_m - b_m)
-            delta = float(np.mean(deltas)) if deltas else None
-            row.append(delta)
-            row_text.append(f"{delta:+.2f}" if delta is not None else "N/A")
-        z.append(row)
-        text.append(row_text)
+    z, h2_stats     = d["delta"], d["h2"]
+    text = [[f"{v:+.2f}" if v is not None else "N/A" for v in row] for row in z]
 
     subtitle = "Averaged across all three tripod dimensions — green = CEO rated higher"
     if h2_stats:
         parts = []
         for dim in dims:
             if dim in h2_stats:
-                d = h2_stats[dim]
-                parts.append(f"{I3_DIMENSIONS[dim]}: p={d['p']:.3f}")
+                parts.append(f"{I3_DIMENSIONS[dim]}: p={h2_stats[dim]['p']:.3f}")
         if parts:
             subtitle += "<br>H2 one-sample t-test: " + " | ".join(parts)
 
@@ -1286,26 +2233,27 @@ def i3_delta_heatmap(scores: dict, models: list[str],
     return fig
 
 
-def i3_condition_bars(scores: dict, models: list[str]) -> go.Figure:
-    scenario_labels = list(I3_SCENARIOS.values())
-    scenario_ids    = list(I3_SCENARIOS.keys())
-    dims            = list(I3_DIMENSIONS.keys())
-    n               = len(models)
-    fig = make_subplots(rows=1, cols=n,
+def i3_condition_bars_data(scores: I3Scores, models: list[str]) -> dict:
+    # (model, condition, scenario): run means averaged over dimensions
+    scen_means = ma_tolist(scores.cell_mean()[scores.model_rows(models)].mean(axis=-1))
+    return {
+        "models":    models,
+        "scenarios": list(I3_SCENARIOS),
+        "mean":      {model: {cond: scen_means[k][scores.cond_idx[cond]] for cond in CONDITIONS}
+                      for k, model in enumerate(models)},
+    }
+
+
+def i3_condition_bars(d: dict) -> go.Figure:
+    models          = d["models"]
+    scenario_labels = [I3_SCENARIOS[s] for s in d["scenarios"]]
+    fig = make_subplots(rows=1, cols=len(models),
                         subplot_titles=[MODEL_LABELS.get(m, m) for m in models],
                         shared_yaxes=True)
     cond_colors = {"baseline": "#2176ae", "ceo": "#d97706"}
     for col_idx, model in enumerate(models, start=1):
         for cond in CONDITIONS:
-            means = []
-            for s_id in scenario_ids:
-                dim_means = []
-                for dim in dims:
-                    vals = scores.get(model, {}).get(cond, {}).get(s_id, {}).get(dim, [])
-                    m, _ = mean_std(vals)
-                    if m is not None:
-                        dim_means.append(m)
-                means.append(float(np.mean(dim_means)) if dim_means else None)
+            means = d["mean"][model][cond]
             fig.add_trace(
                 go.Bar(name=CONDITION_LABELS[cond], x=scenario_labels, y=means,
                        marker=dict(
@@ -1361,7 +2309,7 @@ def extract_i4_scores(i4_data: dict, pairs: list[dict]) -> dict:
     return peer_scores
 
 
-def build_elp(i3_scores: dict, peer_scores: dict, pairs: list[dict],
+def build_elp(i3_scores: I3Scores, peer_scores: dict, pairs: list[dict],
               models: list[str]) -> dict:
     """
     Build the Epistemic Legitimacy Profile for each model.
@@ -1369,17 +2317,16 @@ def build_elp(i3_scores: dict, peer_scores: dict, pairs: list[dict],
     dims = list(I3_DIMENSIONS.keys())
     elp  = {}
 
-    for model in models:
+    # Baseline I3 scores pooled over runs × scenarios → (model, dimension)
+    i3_means = ma_tolist(i3_scores.pooled("baseline")[i3_scores.model_rows(models)].mean(axis=1))
+
+    for model, model_means in zip(models, i3_means):
         label = MODEL_LABELS.get(model, model)
 
-        i3_strict = {}
-        for dim in dims:
-            all_scores = []
-            for s_id in I3_SCENARIOS:
-                vals = i3_scores.get(model, {}).get("baseline", {}).get(s_id, {}).get(dim, [])
-                all_scores.extend(vals)
-            m, _ = mean_std(all_scores)
-            i3_strict[dim] = round(10 - m, 3) if m is not None else None
+        i3_strict = {
+            dim: round(10 - m, 3) if m is not None else None
+            for dim, m in zip(dims, model_means)
+        }
 
         i4_map = {
             "legal_certainty_adequacy":  "legal_certainty",
@@ -1423,9 +2370,20 @@ def build_elp(i3_scores: dict, peer_scores: dict, pairs: list[dict],
 # INSTRUMENT 4 / ELP plots
 # =============================================================================
 
-def i4_elp_radar(elp: dict, models: list[str]) -> go.Figure:
-    dims       = list(I3_DIMENSIONS.keys())
-    dim_labels = list(I3_DIMENSIONS.values())
+def i4_elp_radar_data(elp: dict, models: list[str]) -> dict:
+    dims = list(I3_DIMENSIONS.keys())
+    return {
+        "models": models,
+        "dims":   dims,
+        "strict": [[elp.get(m, {}).get("i3_strictness", {}).get(d) or 0 for d in dims]
+                   for m in models],
+        "peer":   [[elp.get(m, {}).get("i4_peer_mean", {}).get(d) or 0 for d in dims]
+                   for m in models],
+    }
+
+
+def i4_elp_radar(d: dict) -> go.Figure:
+    dim_labels = [I3_DIMENSIONS[dim] for dim in d["dims"]]
 
     axes        = ([f"Strict: {l}" for l in dim_labels] +
                    [f"Peer: {l}" for l in dim_labels])
@@ -1433,13 +2391,10 @@ def i4_elp_radar(elp: dict, models: list[str]) -> go.Figure:
 
     fig = go.Figure()
 
-    for model in models:
-        profile = elp.get(model, {})
-        label   = MODEL_LABELS.get(model, model)
-        color   = MODEL_COLORS.get(model, "#888888")
+    for model, strict_vals, peer_vals in zip(d["models"], d["strict"], d["peer"]):
+        label = MODEL_LABELS.get(model, model)
+        color = MODEL_COLORS.get(model, "#888888")
 
-        strict_vals = [profile.get("i3_strictness", {}).get(d) or 0 for d in dims]
-        peer_vals   = [profile.get("i4_peer_mean",  {}).get(d) or 0 for d in dims]
         vals_closed = strict_vals + peer_vals + [strict_vals[0]]
 
         fig.add_trace(go.Scatterpolar(
@@ -1477,29 +2432,27 @@ def i4_elp_radar(elp: dict, models: list[str]) -> go.Figure:
     return fig
 
 
-def i4_asymmetry_heatmap(elp: dict, models: list[str],
-                          h3_stats: dict | None = None) -> go.Figure:
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
-    dim_labels   = list(I3_DIMENSIONS.values())
-    dims         = list(I3_DIMENSIONS.keys())
+def i4_asymmetry_heatmap_data(elp: dict, models: list[str],
+                               h3_stats: dict | None = None) -> dict:
+    dims = list(I3_DIMENSIONS.keys())
+    z    = [[elp.get(model, {}).get("asymmetry", {}).get(dim) for dim in dims]
+            for model in models]
+    return {"models": models, "dims": dims, "asymmetry": z, "h3": h3_stats}
 
-    z, text = [], []
-    for model in models:
-        row, row_text = [], []
-        for dim in dims:
-            val = elp.get(model, {}).get("asymmetry", {}).get(dim)
-            row.append(val)
-            row_text.append(f"{val:+.2f}" if val is not None else "N/A")
-        z.append(row)
-        text.append(row_text)
+
+def i4_asymmetry_heatmap(d: dict) -> go.Figure:
+    model_labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    dims         = d["dims"]
+    dim_labels   = [I3_DIMENSIONS[dim] for dim in dims]
+    z, h3_stats  = d["asymmetry"], d["h3"]
+    text = [[f"{val:+.2f}" if val is not None else "N/A" for val in row] for row in z]
 
     subtitle = "Green = more lenient with peers than own I3 standards · Red = stricter with peers"
     if h3_stats:
         parts = []
         for dim in dims:
             if dim in h3_stats:
-                d = h3_stats[dim]
-                parts.append(f"{I3_DIMENSIONS[dim]}: d={d['cohens_d']:.2f}")
+                parts.append(f"{I3_DIMENSIONS[dim]}: d={h3_stats[dim]['cohens_d']:.2f}")
         if parts:
             subtitle += "<br>H3 Cohen's d vs zero: " + " | ".join(parts)
 
@@ -1526,29 +2479,24 @@ def i4_asymmetry_heatmap(elp: dict, models: list[str],
     return fig
 
 
-def i4_peer_scores_heatmap(peer_scores: dict, pairs: list[dict]) -> go.Figure:
-    dims       = list(I4_DIMENSIONS.keys())
-    dim_labels = list(I4_DIMENSIONS.values())
-
-    row_labels, z, text = [], [], []
-
+def i4_peer_scores_heatmap_data(peer_scores: dict, pairs: list[dict]) -> dict:
+    """One row per pair × question: [evaluator, evaluatee, question id]."""
+    dims = list(I4_DIMENSIONS.keys())
+    rows, z = [], []
     for pair in pairs:
-        pair_id   = pair["pair_id"]
-        evaluator = MODEL_LABELS.get(pair["evaluator"], pair["evaluator"])
-        evaluatee = MODEL_LABELS.get(pair["evaluatee"], pair["evaluatee"])
-
         for q_id in ["I1_Q1", "I1_Q2", "I1_Q3", "I2_S1", "I2_S2", "I2_S3"]:
-            q_label = I4_QUESTION_LABELS.get(q_id, q_id)
-            dim_scores = peer_scores.get(pair_id, {}).get(q_id, {})
+            dim_scores = peer_scores.get(pair["pair_id"], {}).get(q_id, {})
+            rows.append([pair["evaluator"], pair["evaluatee"], q_id])
+            z.append([dim_scores.get(dim) for dim in dims])
+    return {"dims": dims, "rows": rows, "z": z}
 
-            row_labels.append(f"{evaluator}→{evaluatee}<br>{q_label}")
-            row, row_text = [], []
-            for dim in dims:
-                val = dim_scores.get(dim)
-                row.append(val)
-                row_text.append(str(int(val)) if val is not None else "—")
-            z.append(row)
-            text.append(row_text)
+
+def i4_peer_scores_heatmap(d: dict) -> go.Figure:
+    dim_labels = [I4_DIMENSIONS[dim] for dim in d["dims"]]
+    z          = d["z"]
+    row_labels = [f"{MODEL_LABELS.get(ev, ev)}→{MODEL_LABELS.get(ee, ee)}<br>"
+                  f"{I4_QUESTION_LABELS.get(q_id, q_id)}" for ev, ee, q_id in d["rows"]]
+    text = [[str(int(val)) if val is not None else "—" for val in row] for row in z]
 
     fig = go.Figure(go.Heatmap(
         z=z, x=dim_labels, y=row_labels,
@@ -1576,47 +2524,130 @@ def i4_peer_scores_heatmap(peer_scores: dict, pairs: list[dict]) -> go.Figure:
     return fig
 
 
+# =============================================================================
+# Citation overlap
+# Sources become a sparse (group × normalized source name) count matrix; all
+# pairwise Jaccard, overlap-coefficient and count-weighted cosine similarities
+# then come from one sparse product. Groups are any combination of model,
+# condition, run and question.
+# =============================================================================
+
+class CitationOverlap:
+    """
+    Pairwise citation similarity between groups of one instrument's sources.
+
+    `by` names the grouping columns; `keys` fixes row order (as tuples over
+    `by`) and keeps groups with no citations as all-zero rows. Without `keys`,
+    rows are the observed groups in first-seen order.
+    """
+
+    def __init__(self, index: SourceIndex, by: tuple[str, ...] = ("model",),
+                 keys: list[tuple] | None = None, conditions: list[str] | None = None):
+        from scipy import sparse
+        import pandas as pd
+
+        df = index.rows(conditions=conditions)
+        df = df[df["normalized_name"] != ""]
+        row_codes, groups = pd.MultiIndex.from_frame(df[list(by)].astype(object)).factorize()
+        col_codes, names  = pd.factorize(df["normalized_name"])
+        groups = list(groups)
+
+        if keys is not None:
+            pos       = {k: i for i, k in enumerate(keys)}
+            remap     = np.array([pos.get(g, -1) for g in groups], dtype=np.intp)
+            row_codes = remap[row_codes] if len(row_codes) else row_codes
+            keep      = row_codes >= 0
+            row_codes, col_codes = row_codes[keep], col_codes[keep]
+            groups    = list(keys)
+
+        self.by     = tuple(by)
+        self.keys   = groups
+        self.names  = list(names)
+        self.counts = sparse.csr_matrix(
+            (np.ones(len(row_codes)), (row_codes, col_codes)),
+            shape=(len(groups), len(self.names)),
+        )
+        self.incidence = (self.counts > 0).astype(float)
+
+    def _intersections(self) -> tuple[np.ndarray, np.ndarray]:
+        inter = (self.incidence @ self.incidence.T).toarray()
+        return inter, np.diag(inter).copy()
+
+    def jaccard(self) -> np.ndarray:
+        """|A ∩ B| / |A ∪ B| over distinct names (0 where both sets are empty)."""
+        inter, sizes = self._intersections()
+        union = sizes[:, None] + sizes[None, :] - inter
+        return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+    def overlap(self) -> np.ndarray:
+        """|A ∩ B| / min(|A|, |B|) — 1.0 when one set is contained in the other."""
+        inter, sizes = self._intersections()
+        smaller = np.minimum(sizes[:, None], sizes[None, :])
+        return np.divide(inter, smaller, out=np.zeros_like(inter), where=smaller > 0)
+
+    def weighted(self) -> np.ndarray:
+        """Cosine similarity of citation-count vectors (repeat citations weigh more)."""
+        dot   = (self.counts @ self.counts.T).toarray()
+        norms = np.sqrt(np.diag(dot))
+        denom = norms[:, None] * norms[None, :]
+        return np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0)
+
+
+def overlap_heatmap_data(overlap: CitationOverlap, models: list[str]) -> dict:
+    return {
+        "models":   models,
+        "jaccard":  overlap.jaccard().tolist(),
+        "overlap":  overlap.overlap().tolist(),
+        "weighted": overlap.weighted().tolist(),
+    }
+
+
+def overlap_heatmap(d: dict, title: str) -> go.Figure:
+    """Jaccard heatmap with overlap coefficient and weighted cosine on hover."""
+    labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    jac    = d["jaccard"]
+    more   = np.stack([np.array(d["overlap"]), np.array(d["weighted"])], axis=-1)
+    fig = go.Figure(go.Heatmap(
+        z=jac, x=labels, y=labels,
+        text=[[f"{v:.3f}" for v in row] for row in jac],
+        texttemplate="%{text}", textfont=dict(size=13, color=TEXT_PRI),
+        customdata=more.tolist(),
+        colorscale=COLORSCALE_REDBLUE, zmin=0, zmax=1,
+        colorbar=dict(title="Jaccard Sim.", tickfont=dict(color=TEXT_SEC)),
+        hovertemplate="<b>%{y}</b> vs <b>%{x}</b><br>Jaccard: %{z:.3f}"
+                      "<br>Overlap coeff.: %{customdata[0]:.3f}"
+                      "<br>Weighted cosine: %{customdata[1]:.3f}<extra></extra>",
+    ))
+    fig.update_layout(**base_layout(title, height=520, width=700))
+    fig.update_yaxes(autorange="reversed", tickfont=dict(color=TEXT_PRI))
+    fig.update_xaxes(tickangle=-25, tickfont=dict(color=TEXT_PRI))
+    return fig
+
+
 # =============================================================================
 # I1 self-reported source helpers and plots
 # Works with the new {raw, parsed: {response, sources}} I1 format.
 # Gracefully skips models whose data is still in the old plain-string format.
 # =============================================================================
 
-def get_i1_sources(data: dict, model: str) -> list[dict]:
+def get_i1_sources(data: InstrumentView, model: str) -> list[dict]:
     """
     Extract all self-reported source dicts from I1 parsed data for one model.
     Each source dict is augmented with '_question' and '_condition' keys.
     Returns [] if the model's data is still in the legacy string format.
     """
-    sources = []
-    for cond in CONDITIONS:
-        for run_str, qs in data.get(model, {}).get(cond, {}).items():
-            if not isinstance(qs, dict):
-                continue
-            for q_id, val in qs.items():
-                if not isinstance(val, dict):
-                    continue
-                parsed = val.get("parsed") or {}
-                for s in parsed.get("sources", []):
-                    if isinstance(s, dict):
-                        sources.append({**s, "_question": q_id, "_condition": cond})
-    return sources
+    return data.source_records(model, CONDITIONS)
 
 
-def i1_has_source_data(data: dict, models: list[str]) -> bool:
+def i1_has_source_data(data: InstrumentView, models: list[str]) -> bool:
     """Return True if at least one model has I1 source citations in the new format."""
     return any(bool(get_i1_sources(data, m)) for m in models)
 
 
-def i1_source_type_stacked_bar(data: dict, models: list[str]) -> go.Figure:
-    """
-    Grouped + stacked bar: % of each source type per model.
-    One bar group per model, stacked by source type.
-    """
+def i1_source_type_stacked_bar_data(data: InstrumentView, models: list[str]) -> dict:
+    """% of each source type per model → pct[type][model]."""
     all_types = list(SOURCE_TYPE_LABELS.keys())
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
-    fig = go.Figure()
-
+    pct = []
     for stype in all_types:
         vals = []
         for model in models:
@@ -1624,7 +2655,19 @@ def i1_source_type_stacked_bar(data: dict, models: list[str]) -> go.Figure:
             total   = len(sources) or 1
             count   = sum(1 for s in sources if s.get("type") == stype)
             vals.append(count / total * 100)
+        pct.append(vals)
+    return {"models": models, "types": all_types, "pct": pct}
 
+
+def i1_source_type_stacked_bar(d: dict) -> go.Figure:
+    """
+    Grouped + stacked bar: % of each source type per model.
+    One bar group per model, stacked by source type.
+    """
+    model_labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    fig = go.Figure()
+
+    for stype, vals in zip(d["types"], d["pct"]):
         fig.add_trace(go.Bar(
             name=SOURCE_TYPE_LABELS.get(stype, stype),
             x=model_labels,
@@ -1661,30 +2704,33 @@ def i1_source_type_stacked_bar(data: dict, models: list[str]) -> go.Figure:
     return fig
 
 
-def i1_source_legitimacy_proxy_heatmap(data: dict, models: list[str]) -> go.Figure:
-    """
-    Heatmap: rows=models, cols=legitimacy tiers 1-4.
-    Legitimacy tier is derived from source type via SOURCE_TYPE_TO_TIER.
-    """
-    tier_labels  = ["Tier 1\nPrimary Legal", "Tier 2\nSecondary",
-                    "Tier 3\nLow Authority", "Tier 4\nVague / Implicit"]
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
-
-    z, text = [], []
+def i1_source_legitimacy_proxy_heatmap_data(data: InstrumentView, models: list[str]) -> dict:
+    """% of citations per legitimacy tier 1-4 (via SOURCE_TYPE_TO_TIER) per model."""
+    z = []
     for model in models:
         sources = get_i1_sources(data, model)
         total   = len(sources) or 1
-        row, row_text = [], []
+        row     = []
         for tier in [1, 2, 3, 4]:
             count = sum(
                 1 for s in sources
                 if SOURCE_TYPE_TO_TIER.get(s.get("type", "implicit_only"), 4) == tier
             )
-            pct = count / total * 100
-            row.append(pct)
-            row_text.append(f"{pct:.1f}%")
+            row.append(count / total * 100)
         z.append(row)
-        text.append(row_text)
+    return {"models": models, "pct": z}
+
+
+def i1_source_legitimacy_proxy_heatmap(d: dict) -> go.Figure:
+    """
+    Heatmap: rows=models, cols=legitimacy tiers 1-4.
+    Legitimacy tier is derived from source type via SOURCE_TYPE_TO_TIER.
+    """
+    tier_labels  = ["Tier 1\nPrimary Legal", "Tier 2\nSecondary",
+                    "Tier 3\nLow Authority", "Tier 4\nVague / Implicit"]
+    model_labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    z    = d["pct"]
+    text = [[f"{pct:.1f}%" for pct in row] for row in z]
 
     fig = go.Figure(go.Heatmap(
         z=z, x=tier_labels, y=model_labels,
@@ -1710,60 +2756,27 @@ def i1_source_legitimacy_proxy_heatmap(data: dict, models: list[str]) -> go.Figu
     return fig
 
 
-def i1_source_overlap_heatmap(data: dict, models: list[str]) -> go.Figure:
+def i1_source_overlap_heatmap_data(data: InstrumentView, models: list[str]) -> dict:
+    overlap = CitationOverlap(data.source_index, keys=[(m,) for m in models],
+                              conditions=CONDITIONS)
+    return overlap_heatmap_data(overlap, models)
+
+
+def i1_source_overlap_heatmap(d: dict) -> go.Figure:
     """
     Jaccard similarity matrix of I1 self-reported source-name sets across models.
     """
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
-    source_sets  = {
-        model: {
-            (s.get("name") or "").lower().strip()
-            for s in get_i1_sources(data, model)
-            if (s.get("name") or "").strip()
-        }
-        for model in models
-    }
-
-    z, text = [], []
-    for m1 in models:
-        row, row_text = [], []
-        for m2 in models:
-            a, b = source_sets.get(m1, set()), source_sets.get(m2, set())
-            jac  = len(a & b) / len(a | b) if (a or b) else 0.0
-            row.append(jac)
-            row_text.append(f"{jac:.3f}")
-        z.append(row)
-        text.append(row_text)
-
-    fig = go.Figure(go.Heatmap(
-        z=z, x=model_labels, y=model_labels,
-        text=text, texttemplate="%{text}", textfont=dict(size=13, color=TEXT_PRI),
-        colorscale=COLORSCALE_REDBLUE, zmin=0, zmax=1,
-        colorbar=dict(title="Jaccard Sim.", tickfont=dict(color=TEXT_SEC)),
-        hovertemplate="<b>%{y}</b> vs <b>%{x}</b><br>Jaccard: %{z:.3f}<extra></extra>",
-    ))
-    fig.update_layout(**base_layout(
+    return overlap_heatmap(
+        d,
         "I1 Self-Reported Citation Overlap — Cross-Model Jaccard Similarity<br>"
         "<sup>Shared source names across models — higher = shared epistemic tradition</sup>",
-        height=520, width=700,
-    ))
-    fig.update_yaxes(autorange="reversed", tickfont=dict(color=TEXT_PRI))
-    fig.update_xaxes(tickangle=-25, tickfont=dict(color=TEXT_PRI))
-    return fig
+    )
 
 
-def i1_jurisdiction_breakdown(data: dict, models: list[str]) -> go.Figure:
-    """
-    Grouped bar: % of citations from each jurisdiction per model.
-    """
+def i1_jurisdiction_breakdown_data(data: InstrumentView, models: list[str]) -> dict:
+    """% of citations from each jurisdiction per model → pct[jurisdiction][model]."""
     jurisdictions = I5_JURISDICTIONS[:-1] + ["other"]   # keep same order as radar
-    model_labels  = [MODEL_LABELS.get(m, m) for m in models]
-    juris_colors  = {
-        "EU": "#2176ae", "US": "#dc2626", "UN": "#16a34a",
-        "UK": "#d97706", "unspecified": "#9ca3af", "other": "#7c3aed",
-    }
-    fig = go.Figure()
-
+    pct = []
     for j in jurisdictions:
         vals = []
         for model in models:
@@ -1780,7 +2793,22 @@ def i1_jurisdiction_breakdown(data: dict, models: list[str]) -> go.Figure:
                     if (s.get("jurisdiction") or "").strip().upper() == j.upper()
                 )
             vals.append(count / total * 100)
+        pct.append(vals)
+    return {"models": models, "jurisdictions": jurisdictions, "pct": pct}
+
+
+def i1_jurisdiction_breakdown(d: dict) -> go.Figure:
+    """
+    Grouped bar: % of citations from each jurisdiction per model.
+    """
+    model_labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    juris_colors = {
+        "EU": "#2176ae", "US": "#dc2626", "UN": "#16a34a",
+        "UK": "#d97706", "unspecified": "#9ca3af", "other": "#7c3aed",
+    }
+    fig = go.Figure()
 
+    for j, vals in zip(d["jurisdictions"], d["pct"]):
         fig.add_trace(go.Bar(
             name=j,
             x=model_labels,
@@ -1917,82 +2945,84 @@ def save_hypothesis_results(stats_results: dict, out_dir: Path) -> None:
 # Prints results to stdout. Returns a dict for annotating plots.
 # =============================================================================
 
+HYPOTHESES = ["h1", "h2", "h3", "h4"]
+
+
 def run_hypothesis_tests(
-    i1_data: dict | None,
-    i2_data: dict | None,
-    i3_scores: dict | None,
+    i1_data: InstrumentView | None,
+    i2_data: InstrumentView | None,
+    i3_scores: I3Scores | None,
     elp: dict | None,
-    i5_data: dict | None,
+    i5_data: InstrumentView | None,
     models: list[str],
-    embed_model: SentenceTransformer | None,
+    embed_model: EmbeddingStore | None,
+    hypotheses: list[str] | None = None,
 ) -> dict:
     """
-    Run H1–H4 hypothesis tests on available data and print results.
-    Returns stats_results dict used to annotate plots.
+    Run H1–H4 hypothesis tests (or the given subset of HYPOTHESES) on available
+    data and print results. Returns stats_results dict used to annotate plots;
+    it has one key per test run.
     """
+    from scipy import stats
+
     hr = "=" * 70
     print(f"\n{hr}")
     print("HYPOTHESIS TEST RESULTS")
     print(hr)
 
     dims = list(I3_DIMENSIONS.keys())
-    results = {"h1": {}, "h2": {}, "h3": {}, "h4": {}}
+    hypotheses = hypotheses or HYPOTHESES
+    results = {h: {} for h in hypotheses}
 
     # ------------------------------------------------------------------
     # H1: Surface competence vs scenario divergence
     # Paired t-test: within-model I1 run similarity vs I1→I2 cross-instrument similarity
     # H1 predicts I1→I2 similarity significantly lower than I1→I1.
     # ------------------------------------------------------------------
-    print("\n--- H1: Surface competence vs scenario divergence ---")
-    if i1_data and i2_data and embed_model:
-        dim_pairs = [("I1_Q1", "I2_S1"), ("I1_Q2", "I2_S2"), ("I1_Q3", "I2_S3")]
-        within_sims, cross_sims = [], []
+    if "h1" in hypotheses:
+        print("\n--- H1: Surface competence vs scenario divergence ---")
+        if i1_data and i2_data and embed_model:
+            within_sims, i1_texts, i2_texts = [], [], []
 
-        for model in models:
-            for i1_qid, i2_sid in dim_pairs:
+            for model, run_texts, i1_text, i2_text in h1_text_pairs(i1_data, i2_data, models):
                 # Within-I1 pairwise similarity across 3 runs
-                run_texts = [
-                    _extract_text(i1_data.get(model, {}).get("baseline", {}).get(str(r), {}).get(i1_qid, ""))
-                    for r in [1, 2, 3]
-                ]
-                run_texts = [t for t in run_texts if t]
                 if len(run_texts) < 2:
                     continue
-                embs = embed_model.encode(run_texts, show_progress_bar=False)
-                pair_sims = [cosine_sim(embs[a], embs[b])
-                             for a, b in combinations(range(len(embs)), 2)]
-                w_sim = float(np.mean(pair_sims))
-
-                # I1→I2 cross-instrument similarity
-                i1_text = _extract_text(i1_data.get(model, {}).get("baseline", {}).get("1", {}).get(i1_qid, ""))
-                i2_text = _extract_text(i2_data.get(model, {}).get("baseline", {}).get("1", {}).get(i2_sid, ""))
+                sims = cosine_matrix(embed_model.encode(run_texts, show_progress_bar=False))
+                w_sim = float(sims[np.triu_indices(len(run_texts), k=1)].mean())
+
+                # I1→I2 cross-instrument similarity (computed in one batch below)
                 if not i1_text or not i2_text:
                     continue
-                e1 = embed_model.encode([i1_text], show_progress_bar=False)[0]
-                e2 = embed_model.encode([i2_text], show_progress_bar=False)[0]
-                c_sim = cosine_sim(e1, e2)
-
                 within_sims.append(w_sim)
-                cross_sims.append(c_sim)
-
-        if len(within_sims) >= 2 and len(within_sims) == len(cross_sims):
-            t_stat, p_val = stats.ttest_rel(within_sims, cross_sims)
-            w_mean = float(np.mean(within_sims))
-            c_mean = float(np.mean(cross_sims))
-            supported = w_mean > c_mean and p_val < 0.05
-            print(f"  Within-model I1 mean similarity:       {w_mean:.4f}")
-            print(f"  I1→I2 cross-instrument mean similarity: {c_mean:.4f}")
-            print(f"  Paired t-test: t={t_stat:.3f}, p={p_val:.4f}")
-            print(f"  H1 supported (I1→I2 < I1→I1, p<0.05): {supported}")
-            results["h1"] = {
-                "within_mean": w_mean, "cross_mean": c_mean,
-                "t": float(t_stat), "p": float(p_val), "supported": supported,
-                "n": len(within_sims),
-            }
+                i1_texts.append(i1_text)
+                i2_texts.append(i2_text)
+
+            cross_sims = []
+            if i1_texts:
+                cross_sims = rowwise_cosine(
+                    embed_model.encode(i1_texts, show_progress_bar=False),
+                    embed_model.encode(i2_texts, show_progress_bar=False),
+                ).tolist()
+
+            if len(within_sims) >= 2 and len(within_sims) == len(cross_sims):
+                t_stat, p_val = stats.ttest_rel(within_sims, cross_sims)
+                w_mean = float(np.mean(within_sims))
+                c_mean = float(np.mean(cross_sims))
+                supported = w_mean > c_mean and p_val < 0.05
+                print(f"  Within-model I1 mean similarity:       {w_mean:.4f}")
+                print(f"  I1→I2 cross-instrument mean similarity: {c_mean:.4f}")
+                print(f"  Paired t-test: t={t_stat:.3f}, p={p_val:.4f}")
+                print(f"  H1 supported (I1→I2 < I1→I1, p<0.05): {supported}")
+                results["h1"] = {
+                    "within_mean": w_mean, "cross_mean": c_mean,
+                    "t": float(t_stat), "p": float(p_val), "supported": supported,
+                    "n": len(within_sims),
+                }
+            else:
+                print("  [skip] Insufficient paired observations for t-test.")
         else:
-            print("  [skip] Insufficient paired observations for t-test.")
-    else:
-        print("  [skip] Requires i1_data, i2_data, and embedding model.")
+            print("  [skip] Requires i1_data, i2_data, and embedding model.")
 
     # ------------------------------------------------------------------
     # H2: CEO shift largest for enforceability
@@ -2000,54 +3030,44 @@ def run_hypothesis_tests(
     # Friedman test comparing deltas across dimensions
     # H2 predicts enforceability delta most negative.
     # ------------------------------------------------------------------
-    print("\n--- H2: CEO shift largest for enforceability ---")
-    if i3_scores:
-        h2_dim_deltas = {dim: [] for dim in dims}
-
-        for model in models:
+    if "h2" in hypotheses:
+        print("\n--- H2: CEO shift largest for enforceability ---")
+        if i3_scores:
+            # Per model × dimension: CEO − baseline averaged over scenarios (0 if none)
+            model_deltas  = (i3_scores.delta()[i3_scores.model_rows(models)]
+                             .mean(axis=1).filled(0.0))
+            h2_dim_deltas = {dim: model_deltas[:, i].tolist() for i, dim in enumerate(dims)}
+
+            h2_results = {}
             for dim in dims:
-                model_dim_deltas = []
-                for s_id in I3_SCENARIOS:
-                    b_vals = i3_scores.get(model, {}).get("baseline", {}).get(s_id, {}).get(dim, [])
-                    c_vals = i3_scores.get(model, {}).get("ceo",      {}).get(s_id, {}).get(dim, [])
-                    b_m, _ = mean_std(b_vals)
-                    c_m, _ = mean_std(c_vals)
-                    if b_m is not None and c_m is not None:
-                        model_dim_deltas.append(c_m - b_m)
-                h2_dim_deltas[dim].append(
-                    float(np.mean(model_dim_deltas)) if model_dim_deltas else 0.0
-                )
-
-        h2_results = {}
-        for dim in dims:
-            arr = np.array(h2_dim_deltas[dim])
-            if len(arr) >= 2:
-                t, p = stats.ttest_1samp(arr, 0)
-                h2_results[dim] = {
-                    "mean_delta": float(arr.mean()),
-                    "t": float(t), "p": float(p),
-                }
-                print(f"  {I3_DIMENSIONS[dim]}: mean Δ={arr.mean():+.3f}, "
-                      f"t={t:.3f}, p={p:.4f}")
-
-        # Friedman test
-        arrays = [np.array(h2_dim_deltas[d]) for d in dims]
-        if all(len(a) >= 3 for a in arrays) and len({len(a) for a in arrays}) == 1:
-            fstat, fp = stats.friedmanchisquare(*arrays)
-            h2_results["friedman"] = {"stat": float(fstat), "p": float(fp)}
-            print(f"  Friedman test across dimensions: χ²={fstat:.3f}, p={fp:.4f}")
-
-        # H2 check: enforceability most negative
-        enf_delta = h2_results.get("enforceability", {}).get("mean_delta")
-        other_deltas = [h2_results.get(d, {}).get("mean_delta") for d in dims
-                        if d != "enforceability" and h2_results.get(d)]
-        if enf_delta is not None and other_deltas:
-            supported = all(enf_delta <= o for o in other_deltas)
-            print(f"  H2 enforceability most negative delta: {supported}")
-
-        results["h2"] = h2_results
-    else:
-        print("  [skip] Requires i3_scores.")
+                arr = np.array(h2_dim_deltas[dim])
+                if len(arr) >= 2:
+                    t, p = stats.ttest_1samp(arr, 0)
+                    h2_results[dim] = {
+                        "mean_delta": float(arr.mean()),
+                        "t": float(t), "p": float(p),
+                    }
+                    print(f"  {I3_DIMENSIONS[dim]}: mean Δ={arr.mean():+.3f}, "
+                          f"t={t:.3f}, p={p:.4f}")
+
+            # Friedman test
+            arrays = [np.array(h2_dim_deltas[d]) for d in dims]
+            if all(len(a) >= 3 for a in arrays) and len({len(a) for a in arrays}) == 1:
+                fstat, fp = stats.friedmanchisquare(*arrays)
+                h2_results["friedman"] = {"stat": float(fstat), "p": float(fp)}
+                print(f"  Friedman test across dimensions: χ²={fstat:.3f}, p={fp:.4f}")
+
+            # H2 check: enforceability most negative
+            enf_delta = h2_results.get("enforceability", {}).get("mean_delta")
+            other_deltas = [h2_results.get(d, {}).get("mean_delta") for d in dims
+                            if d != "enforceability" and h2_results.get(d)]
+            if enf_delta is not None and other_deltas:
+                supported = all(enf_delta <= o for o in other_deltas)
+                print(f"  H2 enforceability most negative delta: {supported}")
+
+            results["h2"] = h2_results
+        else:
+            print("  [skip] Requires i3_scores.")
 
     # ------------------------------------------------------------------
     # H3: Asymmetry smallest for enforceability
@@ -2055,114 +3075,117 @@ def run_hypothesis_tests(
     # Effect size: Cohen's d vs zero
     # H3 predicts enforceability asymmetry smallest in absolute value.
     # ------------------------------------------------------------------
-    print("\n--- H3: Asymmetry smallest for enforceability ---")
-    if elp:
-        h3_results = {}
-        for dim in dims:
-            asym_vals = [elp.get(m, {}).get("asymmetry", {}).get(dim) for m in models]
-            asym_vals = [v for v in asym_vals if v is not None]
-            if len(asym_vals) >= 2:
-                arr = np.array(asym_vals)
-                t, p = stats.ttest_1samp(arr, 0)
-                d = float(arr.mean() / arr.std()) if arr.std() > 0 else 0.0
-                h3_results[dim] = {
-                    "mean": float(arr.mean()), "cohens_d": d,
-                    "t": float(t), "p": float(p),
-                }
-                print(f"  {I3_DIMENSIONS[dim]}: mean={arr.mean():+.3f}, "
-                      f"Cohen's d={d:.3f}, t={t:.3f}, p={p:.4f}")
-
-        abs_asym = {d: abs(h3_results[d]["mean"]) for d in h3_results}
-        if abs_asym:
-            smallest = min(abs_asym, key=abs_asym.get)
-            supported = smallest == "enforceability"
-            print(f"  Smallest absolute asymmetry: {I3_DIMENSIONS.get(smallest, smallest)}")
-            print(f"  H3 enforceability asymmetry smallest: {supported}")
-
-        results["h3"] = h3_results
-    else:
-        print("  [skip] Requires ELP (i4_data + i3_scores + pairs).")
+    if "h3" in hypotheses:
+        print("\n--- H3: Asymmetry smallest for enforceability ---")
+        if elp:
+            h3_results = {}
+            for dim in dims:
+                asym_vals = [elp.get(m, {}).get("asymmetry", {}).get(dim) for m in models]
+                asym_vals = [v for v in asym_vals if v is not None]
+                if len(asym_vals) >= 2:
+                    arr = np.array(asym_vals)
+                    t, p = stats.ttest_1samp(arr, 0)
+                    d = float(arr.mean() / arr.std()) if arr.std() > 0 else 0.0
+                    h3_results[dim] = {
+                        "mean": float(arr.mean()), "cohens_d": d,
+                        "t": float(t), "p": float(p),
+                    }
+                    print(f"  {I3_DIMENSIONS[dim]}: mean={arr.mean():+.3f}, "
+                          f"Cohen's d={d:.3f}, t={t:.3f}, p={p:.4f}")
+
+            abs_asym = {d: abs(h3_results[d]["mean"]) for d in h3_results}
+            if abs_asym:
+                smallest = min(abs_asym, key=abs_asym.get)
+                supported = smallest == "enforceability"
+                print(f"  Smallest absolute asymmetry: {I3_DIMENSIONS.get(smallest, smallest)}")
+                print(f"  H3 enforceability asymmetry smallest: {supported}")
+
+            results["h3"] = h3_results
+        else:
+            print("  [skip] Requires ELP (i4_data + i3_scores + pairs).")
 
     # ------------------------------------------------------------------
     # H4: Epistemic basis inconsistency
     # Spearman correlation: mean source legitimacy tier vs I3 enforceability
     # H4 predicts lower-legitimacy sources → less consistent normative positions
     # ------------------------------------------------------------------
-    print("\n--- H4: Epistemic basis inconsistency ---")
-    if i5_data and i3_scores:
-        per_model_rows = []
+    if "h4" in hypotheses:
+        print("\n--- H4: Epistemic basis inconsistency ---")
+        if i5_data and i3_scores:
+            per_model_rows = []
+
+            # Baseline enforceability pooled over runs × scenarios, per model
+            enf      = i3_scores.pooled("baseline")[i3_scores.model_rows(models), :,
+                                                    i3_scores.dim_idx["enforceability"]]
+            enf_mean = ma_tolist(enf.mean(axis=1))
+            enf_var  = ma_tolist(enf.var(axis=1))
+
+            # Source profile per model in one group-by (missing tier → 4,
+            # missing verifiable → True, missing jurisdiction → "unspecified")
+            src  = i5_data.source_index.rows(conditions=CONDITIONS)
+            tier = src["tier"].fillna(4).astype(float)
+            prof = src.assign(
+                tier=tier,
+                low=tier >= 3,
+                unver=~src["verifiable"].fillna(True).astype(bool),
+                juris=src["jurisdiction"].astype(object).fillna("unspecified"),
+            ).groupby(src["model"].astype(object)).agg(
+                n=("tier", "size"), tier_sum=("tier", "sum"), low=("low", "sum"),
+                unver=("unver", "sum"), n_juris=("juris", "nunique"),
+            )
 
-        for model in models:
-            all_sources = []
-            for cond in CONDITIONS:
-                for run_str, questions in i5_data.get(model, {}).get(cond, {}).items():
-                    if not isinstance(questions, dict):
-                        continue
-                    for q_id, q_data in questions.items():
-                        if not isinstance(q_data, dict):
-                            continue
-                        parsed = q_data.get("parsed") or {}
-                        all_sources.extend(
-                            s for s in parsed.get("sources", [])
-                            if isinstance(s, dict)
-                        )
-
-            if not all_sources:
-                per_model_rows.append(None)
-                continue
+            for mi, model in enumerate(models):
+                if model not in prof.index:
+                    per_model_rows.append(None)
+                    continue
 
-            tiers      = [s.get("legitimacy_tier", 4) for s in all_sources]
-            mean_tier  = float(np.mean(tiers))
-            pct_low    = sum(1 for t in tiers if t >= 3) / len(tiers) * 100
-            pct_unver  = sum(1 for s in all_sources
-                             if not s.get("verifiable", True)) / len(all_sources) * 100
-            n_juris    = len({s.get("jurisdiction", "unspecified") for s in all_sources})
-
-            enf_scores = []
-            for s_id in I3_SCENARIOS:
-                enf_scores.extend(
-                    i3_scores.get(model, {}).get("baseline", {}).get(s_id, {})
-                    .get("enforceability", [])
-                )
-            mean_enf = float(np.mean(enf_scores)) if enf_scores else None
-            var_enf  = float(np.var(enf_scores))  if enf_scores else None
-
-            per_model_rows.append({
-                "Model":                 MODEL_LABELS.get(model, model),
-                "Mean Legitimacy Tier":  round(mean_tier, 3),
-                "% Tier 3–4 Sources":   round(pct_low, 1),
-                "% Unverifiable":        round(pct_unver, 1),
-                "Unique Jurisdictions":  n_juris,
-                "Mean Enforceability":   round(mean_enf, 3) if mean_enf else None,
-                "Enforceability Var.":   round(var_enf, 3)  if var_enf  else None,
-            })
-
-        valid = [r for r in per_model_rows if r and r["Mean Enforceability"] is not None]
-        if valid:
-            df = pd.DataFrame(valid)
-            print(df.to_string(index=False))
-
-        if len(valid) >= 3:
-            tier_arr = np.array([r["Mean Legitimacy Tier"] for r in valid])
-            enf_arr  = np.array([r["Mean Enforceability"]  for r in valid])
-            rho, p   = stats.spearmanr(tier_arr, enf_arr)
-            results["h4"]["spearman_tier_enf"] = {"rho": float(rho), "p": float(p)}
-            print(f"\n  Spearman ρ (mean tier vs enforceability mean): ρ={rho:.3f}, p={p:.4f}")
-
-            valid_var = [r for r in valid if r["Enforceability Var."] is not None]
-            if len(valid_var) >= 3:
-                tv = np.array([r["Mean Legitimacy Tier"]  for r in valid_var])
-                vv = np.array([r["Enforceability Var."] for r in valid_var])
-                rho_v, p_v = stats.spearmanr(tv, vv)
-                results["h4"]["spearman_tier_var"] = {"rho": float(rho_v), "p": float(p_v)}
-                print(f"  Spearman ρ (mean tier vs enforceability variance): ρ={rho_v:.3f}, p={p_v:.4f}")
-
-            supported = rho > 0 and p < 0.05
-            print(f"  H4 supported (lower-quality sources → higher variance): {supported}")
-
-        results["h4"]["per_model"] = per_model_rows
-    else:
-        print("  [skip] Requires i5_data and i3_scores.")
+                p_row      = prof.loc[model]
+                n          = int(p_row["n"])
+                mean_tier  = float(p_row["tier_sum"]) / n
+                pct_low    = int(p_row["low"]) / n * 100
+                pct_unver  = int(p_row["unver"]) / n * 100
+                n_juris    = int(p_row["n_juris"])
+
+                mean_enf = enf_mean[mi]
+                var_enf  = enf_var[mi]
+
+                per_model_rows.append({
+                    "Model":                 MODEL_LABELS.get(model, model),
+                    "Mean Legitimacy Tier":  round(mean_tier, 3),
+                    "% Tier 3–4 Sources":   round(pct_low, 1),
+                    "% Unverifiable":        round(pct_unver, 1),
+                    "Unique Jurisdictions":  n_juris,
+                    "Mean Enforceability":   round(mean_enf, 3) if mean_enf else None,
+                    "Enforceability Var.":   round(var_enf, 3)  if var_enf  else None,
+                })
+
+            valid = [r for r in per_model_rows if r and r["Mean Enforceability"] is not None]
+            if valid:
+                import pandas as pd
+                df = pd.DataFrame(valid)
+                print(df.to_string(index=False))
+
+            if len(valid) >= 3:
+                tier_arr = np.array([r["Mean Legitimacy Tier"] for r in valid])
+                enf_arr  = np.array([r["Mean Enforceability"]  for r in valid])
+                rho, p   = stats.spearmanr(tier_arr, enf_arr)
+                results["h4"]["spearman_tier_enf"] = {"rho": float(rho), "p": float(p)}
+                print(f"\n  Spearman ρ (mean tier vs enforceability mean): ρ={rho:.3f}, p={p:.4f}")
+
+                valid_var = [r for r in valid if r["Enforceability Var."] is not None]
+                if len(valid_var) >= 3:
+                    tv = np.array([r["Mean Legitimacy Tier"]  for r in valid_var])
+                    vv = np.array([r["Enforceability Var."] for r in valid_var])
+                    rho_v, p_v = stats.spearmanr(tv, vv)
+                    results["h4"]["spearman_tier_var"] = {"rho": float(rho_v), "p": float(p_v)}
+                    print(f"  Spearman ρ (mean tier vs enforceability variance): ρ={rho_v:.3f}, p={p_v:.4f}")
+
+                supported = rho > 0 and p < 0.05
+                print(f"  H4 supported (lower-quality sources → higher variance): {supported}")
+
+            results["h4"]["per_model"] = per_model_rows
+        else:
+            print("  [skip] Requires i5_data and i3_scores.")
 
     print(f"\n{hr}\n")
     return results
@@ -2172,31 +3195,38 @@ def run_hypothesis_tests(
 # INSTRUMENT 5 helpers
 # =============================================================================
 
-def get_i5_sources(data: dict, model: str,
-                   condition: str | None = None) -> list[dict]:
-    """Return a flat list of all source dicts for a model (optionally filtered by condition)."""
-    sources = []
-    conds = [condition] if condition else list(data.get(model, {}).keys())
-    for cond in conds:
-        for run_str, questions in data.get(model, {}).get(cond, {}).items():
-            if not isinstance(questions, dict):
-                continue
-            for q_id, q_data in questions.items():
-                if not isinstance(q_data, dict):
-                    continue
-                parsed = q_data.get("parsed") or {}
-                sources.extend(
-                    s for s in parsed.get("sources", [])
-                    if isinstance(s, dict)
-                )
-    return sources
+def i5_flow_labels(data: InstrumentView, models: list[str]) -> list[tuple[str, str, str]]:
+    """
+    (model, source type, jurisdiction) per citation, models in the given order,
+    with blank types → "unverifiable" and blank jurisdictions → "unspecified".
+    """
+    index = data.source_index
+    out   = []
+    for model in models:
+        df    = index.rows(model)
+        types = df["type"].astype(object).fillna("").to_numpy()
+        juris = df["jurisdiction"].astype(object).fillna("").to_numpy()
+        out.extend(
+            (model, t or "unverifiable", j.strip() or "unspecified")
+            for t, j in zip(types, juris)
+        )
+    return out
 
 
 # =============================================================================
 # INSTRUMENT 5 plots
 # =============================================================================
 
-def i5_source_legitimacy_heatmap(data: dict, models: list[str]) -> go.Figure:
+def i5_source_legitimacy_heatmap_data(data: InstrumentView, models: list[str]) -> dict:
+    """% of citations per legitimacy tier 1-4 per model."""
+    index  = data.source_index
+    counts = index.counts("tier", models).reindex(columns=[1, 2, 3, 4], fill_value=0)
+    totals = index.totals(models).replace(0, 1)
+    return {"models": models,
+            "pct":    (counts.div(totals, axis=0) * 100).to_numpy(dtype=float).tolist()}
+
+
+def i5_source_legitimacy_heatmap(d: dict) -> go.Figure:
     """
     Heatmap: rows=models, cols=legitimacy tiers 1-4, values=% of citations.
     Colorscale: green (tier 1) to red (tier 4).
@@ -2205,20 +3235,9 @@ def i5_source_legitimacy_heatmap(data: dict, models: list[str]) -> go.Figure:
         "Tier 1\nPrimary Legal", "Tier 2\nSecondary",
         "Tier 3\nUnverifiable", "Tier 4\nVague/Fabricated",
     ]
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
-
-    z, text = [], []
-    for model in models:
-        all_sources = get_i5_sources(data, model)
-        total = len(all_sources) or 1
-        row, row_text = [], []
-        for tier in [1, 2, 3, 4]:
-            count = sum(1 for s in all_sources if s.get("legitimacy_tier") == tier)
-            pct = count / total * 100
-            row.append(pct)
-            row_text.append(f"{pct:.1f}%")
-        z.append(row)
-        text.append(row_text)
+    model_labels = [MODEL_LABELS.get(m, m) for m in d["models"]]
+    z    = d["pct"]
+    text = [[f"{pct:.1f}%" for pct in row] for row in z]
 
     fig = go.Figure(go.Heatmap(
         z=z, x=tier_labels, y=model_labels,
@@ -2244,37 +3263,29 @@ def i5_source_legitimacy_heatmap(data: dict, models: list[str]) -> go.Figure:
     return fig
 
 
-def i5_source_type_sankey(data: dict, models: list[str]) -> go.Figure:
+def i5_source_type_sankey_data(data: InstrumentView, models: list[str]) -> dict:
     """
-    Sankey: model → source type → jurisdiction.
-    Uses LLM deduplication on source types and jurisdictions.
+    Sankey flows: model → source type → jurisdiction.
+    Uses label deduplication on source types and jurisdictions.
     """
     print("    Extracting I5 source type flows...")
 
-    flow_records = []
-    for model in models:
-        label = MODEL_LABELS.get(model, model)
-        sources = get_i5_sources(data, model)
-        for s in sources:
-            stype = s.get("type", "unverifiable") or "unverifiable"
-            juris = (s.get("jurisdiction") or "unspecified").strip() or "unspecified"
-            flow_records.append((label, stype, juris))
+    flow_records = [(MODEL_LABELS.get(model, model), stype, juris)
+                    for model, stype, juris in i5_flow_labels(data, models)]
 
     if not flow_records:
-        fig = go.Figure()
-        fig.update_layout(**base_layout("I5 Source Type Sankey — No data"))
-        return fig
+        return sankey_data([], [], [], models, [], None)
 
     all_stypes = list({r[1] for r in flow_records})
     all_juris  = list({r[2] for r in flow_records})
 
     if all_stypes:
-        print("    Clustering source-type synonyms via LLM...")
+        print("    Clustering source-type synonyms...")
         stype_map = get_sankey_label_mapping(all_stypes, "i5_source_types")
     else:
         stype_map = {}
     if all_juris:
-        print("    Clustering jurisdiction synonyms via LLM...")
+        print("    Clustering jurisdiction synonyms...")
         juris_map = get_sankey_label_mapping(all_juris, "i5_jurisdictions")
     else:
         juris_map = {}
@@ -2295,125 +3306,86 @@ def i5_source_type_sankey(data: dict, models: list[str]) -> go.Figure:
         flow1[(src, st)] += 1
         flow2[(st, j)]   += 1
 
-    link_src, link_tgt, link_val, link_color, link_label = [], [], [], [], []
-
+    links = []
     for model in models:
         label = MODEL_LABELS.get(model, model)
-        color = MODEL_COLORS.get(model, "#888888")
-        rgba  = hex_to_rgba(color)
         for st in type_nodes:
             w = flow1.get((label, st), 0)
             if w:
-                link_src.append(node_idx[label])
-                link_tgt.append(node_idx[st])
-                link_val.append(w)
-                link_color.append(rgba)
-                link_label.append(f"{label} → {st}")
+                links.append([node_idx[label], node_idx[st], w, model])
 
     for st in type_nodes:
         for j in juris_nodes:
             w = flow2.get((st, j), 0)
             if w:
-                link_src.append(node_idx[st])
-                link_tgt.append(node_idx[j])
-                link_val.append(w)
-                link_color.append("rgba(160,168,176,0.6)")
-                link_label.append(f"{st} → {j}")
+                links.append([node_idx[st], node_idx[j], w, None])
 
-    node_colors = []
-    for n in nodes:
-        if n in source_nodes:
-            matched = "#9ca3af"
-            for model in models:
-                if MODEL_LABELS.get(model, model) == n:
-                    matched = MODEL_COLORS.get(model, "#9ca3af")
-                    break
-            node_colors.append(matched)
-        elif n in type_nodes:
-            node_colors.append("#2176ae")
-        else:
-            node_colors.append("#7c3aed")
+    return sankey_data(nodes, source_nodes, type_nodes, models, links,
+                       lambda label, n: label == n)
 
-    fig = go.Figure(go.Sankey(
-        arrangement="snap",
-        node=dict(
-            pad=20, thickness=18,
-            line=dict(color=BORDER, width=0.5),
-            label=nodes, color=node_colors,
-            hovertemplate="<b>%{label}</b><br>Flow: %{value}<extra></extra>",
-        ),
-        link=dict(
-            source=link_src, target=link_tgt, value=link_val,
-            color=link_color, label=link_label,
-            hovertemplate="%{label}<br>Count: %{value}<extra></extra>",
-        ),
-    ))
-    fig.update_layout(
-        title=dict(
-            text="I5 Epistemic Sources — Model → Source Type → Jurisdiction<br>"
-                 "<sup>LLM-extracted citations, all conditions and runs combined</sup>",
-            font=dict(family=SERIF, size=16, color=TEXT_PRI),
-            x=0.5, xanchor="center",
-        ),
-        paper_bgcolor=BG,
-        font=dict(family=MONO, color=TEXT_PRI, size=11),
-        margin=dict(l=40, r=40, t=100, b=40),
-        height=700, width=1400,
+
+def i5_source_type_sankey(d: dict) -> go.Figure:
+    if not d["nodes"]:
+        fig = go.Figure()
+        fig.update_layout(**base_layout("I5 Source Type Sankey — No data"))
+        return fig
+    return sankey_figure(
+        d, middle_color="#2176ae", target_color="#7c3aed", value_name="Count",
+        title="I5 Epistemic Sources — Model → Source Type → Jurisdiction<br>"
+              "<sup>LLM-extracted citations, all conditions and runs combined</sup>",
     )
-    return fig
 
 
-def i5_citation_overlap_heatmap(data: dict, models: list[str]) -> go.Figure:
+def i5_citation_overlap_heatmap_data(data: InstrumentView, models: list[str]) -> dict:
+    overlap = CitationOverlap(data.source_index, keys=[(m,) for m in models])
+    return overlap_heatmap_data(overlap, models)
+
+
+def i5_citation_overlap_heatmap(d: dict) -> go.Figure:
     """
     Jaccard similarity matrix of source-name sets across models.
     """
-    model_labels = [MODEL_LABELS.get(m, m) for m in models]
+    return overlap_heatmap(
+        d,
+        "I5 Citation Overlap — Cross-Model Jaccard Similarity<br>"
+        "<sup>Similarity of source-name sets — higher = shared epistemic tradition</sup>",
+    )
 
-    source_sets = {
-        model: {
-            (s.get("name") or "").lower().strip()
-            for s in get_i5_sources(data, model)
-            if (s.get("name") or "").strip()
-        }
-        for model in models
-    }
 
-    z, text = [], []
-    for m1 in models:
-        row, row_text = [], []
-        for m2 in models:
-            a, b = source_sets.get(m1, set()), source_sets.get(m2, set())
-            jac  = len(a & b) / len(a | b) if (a or b) else 0.0
-            row.append(jac)
-            row_text.append(f"{jac:.3f}")
-        z.append(row)
-        text.append(row_text)
+def i5_jurisdiction_radar_data(data: InstrumentView, models: list[str],
+                                h4_stats: dict | None = None) -> dict:
+    """% of citations per I5_JURISDICTIONS axis per model ("other" = remainder)."""
+    juris_axes = I5_JURISDICTIONS[:]
 
-    fig = go.Figure(go.Heatmap(
-        z=z, x=model_labels, y=model_labels,
-        text=text, texttemplate="%{text}", textfont=dict(size=13, color=TEXT_PRI),
-        colorscale=COLORSCALE_REDBLUE, zmin=0, zmax=1,
-        colorbar=dict(title="Jaccard Sim.", tickfont=dict(color=TEXT_SEC)),
-        hovertemplate="<b>%{y}</b> vs <b>%{x}</b><br>Jaccard: %{z:.3f}<extra></extra>",
-    ))
-    fig.update_layout(**base_layout(
-        "I5 Citation Overlap — Cross-Model Jaccard Similarity<br>"
-        "<sup>Similarity of source-name sets — higher = shared epistemic tradition</sup>",
-        height=520, width=700,
-    ))
-    fig.update_yaxes(autorange="reversed", tickfont=dict(color=TEXT_PRI))
-    fig.update_xaxes(tickangle=-25, tickfont=dict(color=TEXT_PRI))
-    return fig
+    # Citations per model × jurisdiction, matched case-insensitively
+    index  = data.source_index
+    juris  = index.df["jurisdiction"].astype(object).fillna("").str.strip().str.upper()
+    counts = index.counts(juris, models)
+    totals = index.totals(models).replace(0, 1)
+
+    pct = []
+    for model in models:
+        total = int(totals[model])
+        vals = []
+        accounted = 0
+        for j in juris_axes[:-1]:  # all except "other"
+            count = int(counts.at[model, j.upper()]) if j.upper() in counts.columns else 0
+            share = count / total * 100
+            vals.append(share)
+            accounted += share
+        vals.append(max(0.0, 100.0 - accounted))  # "other"
+        pct.append(vals)
+    return {"models": models, "jurisdictions": juris_axes, "pct": pct, "h4": h4_stats}
 
 
-def i5_jurisdiction_radar(data: dict, models: list[str],
-                           h4_stats: dict | None = None) -> go.Figure:
+def i5_jurisdiction_radar(d: dict) -> go.Figure:
     """
     Radar chart: one trace per model, axes = major jurisdictions.
     Values = % of citations from that jurisdiction.
     """
-    juris_axes  = I5_JURISDICTIONS[:]
+    juris_axes  = d["jurisdictions"]
     axes_closed = juris_axes + [juris_axes[0]]
+    h4_stats    = d["h4"]
 
     subtitle = "% of citations from each jurisdiction — shows geographic bias in epistemic basis"
     if h4_stats and h4_stats.get("spearman_tier_enf"):
@@ -2423,23 +3395,9 @@ def i5_jurisdiction_radar(data: dict, models: list[str],
 
     fig = go.Figure()
 
-    for model in models:
-        label   = MODEL_LABELS.get(model, model)
-        color   = MODEL_COLORS.get(model, "#888888")
-        sources = get_i5_sources(data, model)
-        total   = len(sources) or 1
-
-        vals = []
-        accounted = 0
-        for j in juris_axes[:-1]:  # all except "other"
-            count = sum(
-                1 for s in sources
-                if (s.get("jurisdiction") or "").strip().upper() == j.upper()
-            )
-            pct = count / total * 100
-            vals.append(pct)
-            accounted += pct
-        vals.append(max(0.0, 100.0 - accounted))  # "other"
+    for model, vals in zip(d["models"], d["pct"]):
+        label = MODEL_LABELS.get(model, model)
+        color = MODEL_COLORS.get(model, "#888888")
 
         vals_closed = vals + [vals[0]]
 
@@ -2478,101 +3436,421 @@ def i5_jurisdiction_radar(data: dict, models: list[str],
     return fig
 
 
+# =============================================================================
+# Build graph
+# Every figure and results file is a Target that declares the datasets it
+# reads and the parameters it is drawn with. Fingerprints of both (plus the
+# plotting code) are kept per target in BUILD_MANIFEST_FILE; a target is only
+# rebuilt when one of them changed or an output is missing, and the reason is
+# printed. --force rebuilds everything, or the targets matching given globs.
+#
+# Figures are built in two steps: a compute function (the <figure>_data()
+# functions above) whose JSON-ready result is kept in
+# <instrument>/data/<figure>.json, and a render function that draws the
+# figure from that dict alone. --restyle re-renders every saved figure from
+# its data without loading any inputs, for colour, label or layout changes;
+# it does not mark targets current, so a later normal run still rebuilds any
+# whose code changed.
+# =============================================================================
+
+INPUT_FILES = {
+    **{f"instrument_{i}": RAW_DIR / f"instrument_{i}.json" for i in range(1, 6)},
+    "peer_eval_pairs": PEER_EVAL_FILE,
+}
+# Local modules whose code shapes target outputs: table loading, figure
+# export and the LLM cache the Sankey targets read through. profiling.py is
+# left out as it only writes results/profile.json, which is not a target.
+CODE_FILES = [Path(__file__), *(Path(__file__).with_name(name) for name in
+                                ("response_tables.py", "figure_export.py", "llm_cache.py"))]
+
+# Datasets each hypothesis test reads
+HYPOTHESIS_INPUTS = {
+    "h1": ["instrument_1", "instrument_2"],
+    "h2": ["instrument_3"],
+    "h3": ["instrument_3", "instrument_4", "peer_eval_pairs"],
+    "h4": ["instrument_3", "instrument_5"],
+}
+
+
+def file_digest(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def params_digest(params: dict) -> str:
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def figure_data_path(path_stem: Path) -> Path:
+    return path_stem.parent / "data" / f"{path_stem.name}.json"
+
+
+def save_figure_data(data: dict, render, path_stem: Path) -> dict:
+    """
+    Write a figure's computed data with the name of its render function and
+    return it as read back, so a fresh build and a --restyle render identical input.
+    """
+    payload = json.dumps({"render": render.__name__, "data": data}, ensure_ascii=False)
+    path    = figure_data_path(path_stem)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(payload, encoding="utf-8")
+    return json.loads(payload)["data"]
+
+
+class Target:
+    """
+    One build output. Figure targets compute their data with build(), draw
+    it with render(data) and are written by save_fig() to RESULTS_DIR / name;
+    file targets write `files` themselves. `needs` names shared prerequisites
+    (e.g. "embeddings:figures", "sankey:i2") prepared once for all stale targets.
+    `stats` names the hypothesis test annotating the figure; its result is
+    added to params once the selected tests have run.
+    """
+
+    def __init__(self, name: str, build, inputs: list[str], render=None,
+                 params: dict | None = None, files: list[Path] | None = None,
+                 needs: set[str] | None = None, stats: str | None = None):
+        self.name   = name
+        self.build  = build
+        self.render = render
+        self.inputs = inputs
+        self.params = params or {}
+        self.files  = files
+        self.needs  = needs or set()
+        self.stats  = stats
+
+    @property
+    def stem(self) -> Path | None:
+        return None if self.files is not None else RESULTS_DIR / self.name
+
+    @property
+    def outputs(self) -> list[Path]:
+        if self.files is not None:
+            return self.files
+        return [figure_data_path(self.stem)] + [output_path(self.stem, fmt)
+                                                for fmt in FIGURE_FORMATS]
+
+
+class BuildGraph:
+    """Compares targets against the manifest, builds the stale ones and records them."""
+
+    def __init__(self, manifest_file: Path, force: list[str] | None = None):
+        self.manifest_file = manifest_file
+        self.force         = force      # None: incremental; []: everything; else glob patterns
+        self.manifest: dict[str, dict] = {}
+        if manifest_file.exists():
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        self.code    = hashlib.sha256(b"".join(p.read_bytes() for p in CODE_FILES)).hexdigest()
+        self.built   = 0
+        self.current = 0
+        self._inputs: dict[str, str | None] = {}
+
+    def input_digest(self, name: str) -> str | None:
+        if name not in self._inputs:
+            self._inputs[name] = file_digest(INPUT_FILES[name])
+        return self._inputs[name]
+
+    def reasons(self, target: Target) -> list[str]:
+        """Why target must be rebuilt ([] when it is up to date)."""
+        if self.force is not None and (
+                not self.force or any(fnmatch(target.name, pat) for pat in self.force)):
+            return ["forced"]
+        entry = self.manifest.get(target.name)
+        if entry is None:
+            return ["new target"]
+        reasons = []
+        missing = [p.name for p in target.outputs if not p.exists()]
+        if missing:
+            reasons.append("output missing: " + ", ".join(missing))
+        changed = [n for n in target.inputs
+                   if entry.get("inputs", {}).get(n) != self.input_digest(n)]
+        if changed:
+            reasons.append("input changed: " + ", ".join(changed))
+        if entry.get("params") != params_digest(target.params):
+            reasons.append("parameters changed")
+        if entry.get("code") != self.code:
+            reasons.append("code changed")
+        return reasons
+
+    def plan(self, targets: list[Target]) -> list[tuple[Target, list[str]]]:
+        plan = [(t, r) for t in targets if (r := self.reasons(t))]
+        self.current += len(targets) - len(plan)
+        return plan
+
+    def build(self, plan: list[tuple[Target, list[str]]], prepare=None) -> dict:
+        """Build planned targets after prepare(needs); returns {name: build() result}."""
+        needs = set().union(*(t.needs for t, _ in plan))
+        if needs and prepare:
+            prepare(needs)
+        results = {}
+        for target, reasons in plan:
+            print(f"  [build] {target.name} — {'; '.join(reasons)}")
+            with stage(target.name, kind="figure" if target.render else "file"):
+                results[target.name] = target.build()
+                if target.render is not None:
+                    data = save_figure_data(results[target.name], target.render, target.stem)
+                    results[target.name] = target.render(data)
+            if target.stem is not None:
+                # Recorded once the exporter has written it, so a failed
+                # render is retried on the next run
+                save_fig(results[target.name], target.stem,
+                         on_done=lambda target=target: self.record(target))
+            else:
+                self.record(target)
+        get_exporter().wait()
+        return results
+
+    def record(self, target: Target) -> None:
+        self.manifest[target.name] = {
+            "inputs":  {n: self.input_digest(n) for n in target.inputs},
+            "params":  params_digest(target.params),
+            "code":    self.code,
+            "outputs": [str(p) for p in target.outputs],
+        }
+        self.built += 1
+        self.save()
+
+    def restyle(self) -> None:
+        """
+        Re-render every figure from its saved data. The manifest is left as it
+        is: a restyle cannot tell a rendering change from a compute change, so
+        the next normal run still rebuilds targets whose code has changed.
+        """
+        for path in sorted(RESULTS_DIR.glob("*/data/*.json")):
+            name = f"{path.parent.parent.name}/{path.stem}"
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            render = globals().get(saved.get("render", ""))
+            if not callable(render):
+                print(f"  [skip] {name}: unknown render function {saved.get('render')!r}")
+                continue
+            print(f"  [restyle] {name}")
+            save_fig(render(saved["data"]), RESULTS_DIR / name,
+                     on_done=self._restyled)
+        get_exporter().wait()
+
+    def _restyled(self) -> None:
+        self.built += 1
+
+    def save(self) -> None:
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_file)
+
+
 # =============================================================================
 # Main
 # =============================================================================
 
-def _try_load(instrument_id: str) -> dict | None:
-    path = RAW_DIR / f"{instrument_id}.json"
-    if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return None
+def _try_load(tables: ResponseTables, instrument_id: str) -> InstrumentView | None:
+    view = tables.view(instrument_id)
+    return view if view else None
 
 
-if __name__ == "__main__":
+class PlotInputs:
+    """
+    Instrument views and the scores derived from them. Views are cheap; I3
+    scores, I4 peer scores and ELP profiles are computed on first use, so
+    runs that select other targets never pay for them.
+    """
+
+    def __init__(self, raw_dir: Path = RAW_DIR):
+        self.tables = load_tables(raw_dir)
+        self.i1     = _try_load(self.tables, "instrument_1")
+        self.i2     = _try_load(self.tables, "instrument_2")
+        self.i3     = _try_load(self.tables, "instrument_3")
+        self.i5     = _try_load(self.tables, "instrument_5")
+
+        # Determine model list from first available dataset
+        self.models = None
+        for _d in [self.i1, self.i2, self.i3, self.i5]:
+            if _d:
+                self.models = _d.models
+                break
+
+        # Load peer eval pairs
+        self.pairs = []
+        if PEER_EVAL_FILE.exists():
+            with open(PEER_EVAL_FILE, "r", encoding="utf-8") as f:
+                self.pairs = json.load(f)["pairs"]
+
+        self._i3_scores:   I3Scores | None = None
+        self._peer_scores: dict | None = None
+        self._elp:         dict | None = None
+
+    @property
+    def i4_raw(self) -> dict | None:
+        # Peer ratings stay nested: pair → question
+        return self.tables.raw("instrument_4")
+
+    @property
+    def has_elp(self) -> bool:
+        """Whether ELP profiles can be built, without building them."""
+        return bool(self.i4_raw and self.i3 and self.pairs)
+
+    @property
+    def i3_scores(self) -> I3Scores | None:
+        if self._i3_scores is None and self.i3:
+            with stage("i3 scores"):
+                self._i3_scores = extract_i3_scores(self.i3.raw, self.models)
+        return self._i3_scores
+
+    @property
+    def peer_scores(self) -> dict | None:
+        if self._peer_scores is None and self.has_elp:
+            print("Extracting I4 peer scores...")
+            with stage("i4 peer scores"):
+                self._peer_scores = extract_i4_scores(self.i4_raw, self.pairs)
+        return self._peer_scores
+
+    @property
+    def elp(self) -> dict | None:
+        if self._elp is None and self.has_elp:
+            peer_scores = self.peer_scores
+            i3_scores   = self.i3_scores
+            print("Building ELP profiles...")
+            with stage("elp profiles"):
+                self._elp = build_elp(i3_scores, peer_scores, self.pairs, self.models)
+        return self._elp
+
+
+def select_targets(targets: list[Target], figures: list[str] | None) -> list[Target]:
+    """Targets whose name contains one of the patterns (globs allowed); all for None."""
+    if figures is None:
+        return targets
+    return [t for t in targets if any(fnmatch(t.name, f"*{pat}*") for pat in figures)]
+
+
+def run_plots(instruments: list[str] | None = None, figures: list[str] | None = None,
+              hypotheses: list[str] | None = None, force: list[str] | None = None,
+              formats: list[str] | None = None, workers: int | None = None,
+              restyle: bool = False, trace_memory: bool = False) -> None:
+    """
+    Build figures and hypothesis tests for `instruments` (default ACTIVE_INSTRUMENTS).
+
+    figures:    target name patterns, e.g. "sankey" or "instrument_3/scores_*";
+                None builds every target of the instruments, [] none
+    hypotheses: subset of HYPOTHESES to run; None runs the ones the selected
+                figures are annotated with (all of them on a full run), [] none
+    force / formats / workers / restyle / trace_memory: as the command-line flags
+    """
+    global ACTIVE_INSTRUMENTS, FIGURE_FORMATS, RENDER_WORKERS, PROFILE_TRACE_MEMORY
+    full_run = instruments is None and figures is None
+    if instruments:
+        ACTIVE_INSTRUMENTS = list(instruments)
+    if formats:
+        FIGURE_FORMATS = [fmt for fmt in formats if fmt != "none"]
+    if workers:
+        RENDER_WORKERS = workers
+    if trace_memory:
+        PROFILE_TRACE_MEMORY = True
+    get_profiler()
+
+    if restyle:
+        graph = BuildGraph(BUILD_MANIFEST_FILE)
+        print("Re-rendering figures from saved data...")
+        with stage("restyle"):
+            graph.restyle()
+        with stage("wait for exports"):
+            get_exporter().close()
+        if "json" in FIGURE_FORMATS:
+            print(f"  Saved: {write_index(RESULTS_DIR, 'Framing the Neutral — results')}")
+        print(f"\nRestyle complete: {graph.built} figure(s) re-rendered")
+        write_profile()
+        return
+
     _load_sankey_cache()
 
     # -------------------------------------------------------------------------
-    # Pre-load all available data
+    # Load instrument views; derived scores are computed on first use
     # -------------------------------------------------------------------------
-    i1_data = _try_load("instrument_1")
-    i2_data = _try_load("instrument_2")
-    i3_data = _try_load("instrument_3")
-    i4_data = _try_load("instrument_4")
-    i5_data = _try_load("instrument_5")
-
-    # Determine model list from first available dataset
-    models = None
-    for _d in [i1_data, i2_data, i3_data, i5_data]:
-        if _d:
-            models = list(_d.keys())
-            break
+    with stage("load data"):
+        inp = PlotInputs(RAW_DIR)
+    i1_data = inp.i1
+    i2_data = inp.i2
+    i3_data = inp.i3
+    i5_data = inp.i5
+    models  = inp.models
     if models is None:
         print("[error] No instrument data found in data/raw/. Exiting.")
-        import sys; sys.exit(1)
-
-    # Load peer eval pairs
-    pairs = []
-    if PEER_EVAL_FILE.exists():
-        with open(PEER_EVAL_FILE, "r", encoding="utf-8") as f:
-            pairs = json.load(f)["pairs"]
-
-    # Pre-compute I3 scores and ELP
-    i3_scores  = extract_i3_scores(i3_data, models) if i3_data else None
-    peer_scores = None
-    elp         = None
-    if i4_data and i3_scores and pairs:
-        print("Extracting I4 peer scores...")
-        peer_scores = extract_i4_scores(i4_data, pairs)
-        print("Building ELP profiles...")
-        elp = build_elp(i3_scores, peer_scores, pairs, models)
-
-    # Load embedding model (needed for I1 plots and H1)
-    embed_model = None
-    if i1_data:
-        print("Loading embedding model...")
-        embed_model = SentenceTransformer(EMBEDDING_MODEL)
+        raise SystemExit(1)
+
+    graph = BuildGraph(BUILD_MANIFEST_FILE, force=force)
+
+    def prepare(needs: set[str]) -> None:
+        """Load the embedding store and run the Sankey LLM calls stale targets need."""
+        # The embedding model itself only loads if some text has not been
+        # encoded on a previous run
+        emb = {n.split(":", 1)[1] for n in needs if n.startswith("embeddings:")}
+        if emb:
+            with stage("prefetch embeddings"):
+                prefetch_embeddings(get_embedding_store(), i1_data, i2_data, models,
+                                    figures="figures" in emb, h1="h1" in emb)
+        sankey_i2 = i2_data if "sankey:i2" in needs else None
+        sankey_i5 = i5_data if "sankey:i5" in needs else None
+        if sankey_i2 or sankey_i5:
+            print("\nPrefetching Sankey LLM calls...")
+            with stage("prefetch sankey llm"):
+                prefetch_sankey_llm(sankey_i2, sankey_i5, models)
+
+    def save_json(obj, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+        print(f"  Saved: {path}")
 
     # -------------------------------------------------------------------------
-    # Hypothesis tests — printed to stdout before any plotting
+    # Figure and results-file targets. Builds read stats_results when they
+    # run, after the hypothesis tests below have filled it in.
     # -------------------------------------------------------------------------
-    stats_results = run_hypothesis_tests(
-        i1_data, i2_data, i3_scores, elp, i5_data, models, embed_model
-    )
+    stats_results: dict = {}
+    targets: list[Target] = []
 
-    # Save hypothesis results to results/hypothesis_tests/
-    print("Saving hypothesis test results...")
-    save_hypothesis_results(stats_results, RESULTS_DIR / "hypothesis_tests")
+    def add(name: str, build, inputs: list[str], **kwargs) -> None:
+        kwargs.setdefault("params", {})["models"] = models
+        targets.append(Target(name, build, inputs, **kwargs))
 
     # -------------------------------------------------------------------------
     # Instrument 1
     # -------------------------------------------------------------------------
     if "instrument_1" in ACTIVE_INSTRUMENTS and i1_data:
-        out = RESULTS_DIR / "instrument_1"
-        print("\nBuilding I1 word frequency heatmaps...")
+        i1 = ["instrument_1"]
         for q_id, q_label in I1_QUESTIONS.items():
             slug = q_label.lower().replace(" ", "_")
-            save_fig(i1_wordfreq_heatmap(i1_data, q_id, q_label, models),
-                     out / f"wordfreq_{slug}")
-
-        print("Building I1 cross-model similarity...")
-        save_fig(i1_cross_model_similarity(i1_data, models, embed_model),
-                 out / "similarity_cross_model")
-
-        print("Building I1 baseline vs CEO shift...")
-        fig_bvc = i1_baseline_vs_ceo(i1_data, models, embed_model)
-        # Annotate with H1 stats
-        if stats_results.get("h1"):
-            h1 = stats_results["h1"]
-            ann = (f"H1 paired t-test (n={h1['n']}): t={h1['t']:.3f}, p={h1['p']:.4f} | "
-                   f"within-I1={h1['within_mean']:.3f}, I1→I2={h1['cross_mean']:.3f} | "
-                   f"supported={h1['supported']}")
-            current_title = fig_bvc.layout.title.text or ""
-            fig_bvc.update_layout(
-                title_text=current_title + f"<br><sup style='font-size:11px'>{ann}</sup>"
-            )
-        save_fig(fig_bvc, out / "similarity_baseline_vs_ceo")
+            add(f"instrument_1/wordfreq_{slug}",
+                lambda q_id=q_id, q_label=q_label:
+                    i1_wordfreq_heatmap_data(i1_data, q_id, q_label, models),
+                i1, render=i1_wordfreq_heatmap)
+
+        for q_id, q_label in I1_QUESTIONS.items():
+            slug = q_label.lower().replace(" ", "_")
+            for contrast in ("model", "ceo"):
+                add(f"instrument_1/distinctive_{contrast}_{slug}",
+                    lambda q_id=q_id, q_label=q_label, contrast=contrast:
+                        i1_distinctive_words_heatmap_data(i1_data, q_id, q_label, models,
+                                                          contrast),
+                    i1, render=i1_distinctive_words_heatmap)
+        words_file = RESULTS_DIR / "instrument_1" / "distinctive_words.json"
+        add("instrument_1/distinctive_words.json",
+            lambda: save_json(distinctive_words_table(i1_data, models), words_file),
+            i1, files=[words_file])
+
+        add("instrument_1/similarity_cross_model",
+            lambda: i1_cross_model_similarity_data(i1_data, models, get_embedding_store()),
+            i1, render=i1_cross_model_similarity, needs={"embeddings:figures"})
+        add("instrument_1/similarity_baseline_vs_ceo",
+            lambda: i1_baseline_vs_ceo_data(i1_data, models, get_embedding_store(),
+                                            h1_stats=stats_results.get("h1")),
+            i1, render=i1_baseline_vs_ceo, needs={"embeddings:figures"}, stats="h1")
     elif "instrument_1" in ACTIVE_INSTRUMENTS:
         print("[skip] instrument_1.json not found")
 
@@ -2580,83 +3858,76 @@ if __name__ == "__main__":
     # Instrument 2
     # -------------------------------------------------------------------------
     if "instrument_2" in ACTIVE_INSTRUMENTS and i2_data:
-        out = RESULTS_DIR / "instrument_2"
-        print("\nBuilding I2 S1 word frequency — cross-model...")
-        save_fig(i2_s1_wordfreq_cross_model(i2_data, models),
-                 out / "s1_wordfreq_cross_model")
-
-        print("Building I2 S1 word frequency — baseline vs CEO...")
-        save_fig(i2_s1_wordfreq_baseline_vs_ceo(i2_data, models),
-                 out / "s1_wordfreq_baseline_vs_ceo")
-
-        print("Building I2 S2 responsibility radar...")
-        save_fig(i2_s2_responsibility_radar(i2_data, models),
-                 out / "s2_responsibility_radar")
-
-        print("Building I2 S2 accountability mechanisms Sankey...")
-        save_fig(i2_s2_accountability_sankey(i2_data, models),
-                 out / "s2_accountability_sankey")
-
-        print("Building I2 S3 enforcement challenges Sankey...")
-        save_fig(i2_s3_enforcement_sankey(i2_data, models),
-                 out / "s3_enforcement_sankey")
+        i2 = ["instrument_2"]
+        add("instrument_2/s1_wordfreq_cross_model",
+            lambda: i2_s1_wordfreq_cross_model_data(i2_data, models),
+            i2, render=i2_s1_wordfreq_cross_model)
+        add("instrument_2/s1_wordfreq_baseline_vs_ceo",
+            lambda: i2_s1_wordfreq_baseline_vs_ceo_data(i2_data, models),
+            i2, render=i2_s1_wordfreq_baseline_vs_ceo)
+        add("instrument_2/s2_responsibility_radar",
+            lambda: i2_s2_responsibility_radar_data(i2_data, models),
+            i2, render=i2_s2_responsibility_radar)
+        add("instrument_2/s2_accountability_sankey",
+            lambda: i2_s2_accountability_sankey_data(i2_data, models),
+            i2, render=i2_s2_accountability_sankey, needs={"sankey:i2"})
+        add("instrument_2/s3_enforcement_sankey",
+            lambda: i2_s3_enforcement_sankey_data(i2_data, models),
+            i2, render=i2_s3_enforcement_sankey, needs={"sankey:i2"})
     elif "instrument_2" in ACTIVE_INSTRUMENTS:
         print("[skip] instrument_2.json not found")
 
     # -------------------------------------------------------------------------
     # Instrument 3
     # -------------------------------------------------------------------------
-    if "instrument_3" in ACTIVE_INSTRUMENTS and i3_data and i3_scores:
-        out = RESULTS_DIR / "instrument_3"
-        print("\nBuilding I3 grouped bar charts...")
+    if "instrument_3" in ACTIVE_INSTRUMENTS and i3_data:
+        i3 = ["instrument_3"]
         for dim, dim_label in I3_DIMENSIONS.items():
-            save_fig(i3_grouped_bar(i3_scores, models, dim, dim_label),
-                     out / f"scores_grouped_bar_{dim}")
+            add(f"instrument_3/scores_grouped_bar_{dim}",
+                lambda dim=dim, dim_label=dim_label:
+                    i3_grouped_bar_data(inp.i3_scores, models, dim, dim_label),
+                i3, render=i3_grouped_bar)
 
-        print("Building I3 heatmaps...")
         for dim, dim_label in I3_DIMENSIONS.items():
-            save_fig(i3_heatmap(i3_scores, models, dim, dim_label),
-                     out / f"scores_heatmap_{dim}")
+            add(f"instrument_3/scores_heatmap_{dim}",
+                lambda dim=dim, dim_label=dim_label:
+                    i3_heatmap_data(inp.i3_scores, models, dim, dim_label),
+                i3, render=i3_heatmap)
 
-        print("Building I3 radar charts...")
         for s_id, s_label in I3_SCENARIOS.items():
-            save_fig(i3_radar(i3_scores, models, s_id, s_label),
-                     out / f"scores_radar_{s_id.lower()}")
-
-        print("Building I3 condition delta heatmap...")
-        save_fig(i3_delta_heatmap(i3_scores, models, h2_stats=stats_results.get("h2")),
-                 out / "condition_delta_heatmap")
-
-        print("Building I3 condition side-by-side bars...")
-        save_fig(i3_condition_bars(i3_scores, models),
-                 out / "condition_side_by_side")
+            add(f"instrument_3/scores_radar_{s_id.lower()}",
+                lambda s_id=s_id, s_label=s_label:
+                    i3_radar_data(inp.i3_scores, models, s_id, s_label),
+                i3, render=i3_radar)
+
+        add("instrument_3/condition_delta_heatmap",
+            lambda: i3_delta_heatmap_data(inp.i3_scores, models,
+                                          h2_stats=stats_results.get("h2")),
+            i3, render=i3_delta_heatmap, stats="h2")
+        add("instrument_3/condition_side_by_side",
+            lambda: i3_condition_bars_data(inp.i3_scores, models),
+            i3, render=i3_condition_bars)
     elif "instrument_3" in ACTIVE_INSTRUMENTS:
         print("[skip] instrument_3.json not found")
 
     # -------------------------------------------------------------------------
     # Instrument 4 + ELP
     # -------------------------------------------------------------------------
-    if "instrument_4" in ACTIVE_INSTRUMENTS and i4_data and elp:
-        out = RESULTS_DIR / "instrument_4"
-        out.mkdir(parents=True, exist_ok=True)
-
-        # Save ELP JSON
-        elp_out = out / "elp_profiles.json"
-        with open(elp_out, "w", encoding="utf-8") as f:
-            json.dump(elp, f, indent=2, ensure_ascii=False)
-        print(f"\n  Saved ELP profiles: {elp_out}")
-
-        print("Building ELP radar (all models)...")
-        save_fig(i4_elp_radar(elp, models),
-                 out / "elp_radar_all_models")
-
-        print("Building I4 asymmetry heatmap...")
-        save_fig(i4_asymmetry_heatmap(elp, models, h3_stats=stats_results.get("h3")),
-                 out / "asymmetry_heatmap")
-
-        print("Building I4 raw peer scores heatmap...")
-        save_fig(i4_peer_scores_heatmap(peer_scores, pairs),
-                 out / "peer_scores_heatmap")
+    if "instrument_4" in ACTIVE_INSTRUMENTS and inp.has_elp:
+        elp_inputs = ["instrument_3", "instrument_4", "peer_eval_pairs"]
+        elp_file   = RESULTS_DIR / "instrument_4" / "elp_profiles.json"
+        add("instrument_4/elp_profiles.json", lambda: save_json(inp.elp, elp_file),
+            elp_inputs, files=[elp_file])
+        add("instrument_4/elp_radar_all_models",
+            lambda: i4_elp_radar_data(inp.elp, models),
+            elp_inputs, render=i4_elp_radar)
+        add("instrument_4/asymmetry_heatmap",
+            lambda: i4_asymmetry_heatmap_data(inp.elp, models,
+                                              h3_stats=stats_results.get("h3")),
+            elp_inputs, render=i4_asymmetry_heatmap, stats="h3")
+        add("instrument_4/peer_scores_heatmap",
+            lambda: i4_peer_scores_heatmap_data(inp.peer_scores, inp.pairs),
+            ["instrument_4", "peer_eval_pairs"], render=i4_peer_scores_heatmap)
     elif "instrument_4" in ACTIVE_INSTRUMENTS:
         print("[skip] instrument_4.json not found or ELP could not be computed")
 
@@ -2674,47 +3945,41 @@ if __name__ == "__main__":
     # Plots are produced from whichever source(s) are available.
     # -------------------------------------------------------------------------
     if "instrument_5" in ACTIVE_INSTRUMENTS:
-        out = RESULTS_DIR / "instrument_5"
-
         # ---- A. I5 extracted sources ----
         if i5_data:
-            print("\n[I5-A] Building extracted source legitimacy heatmap...")
-            save_fig(i5_source_legitimacy_heatmap(i5_data, models),
-                     out / "extracted_source_legitimacy_heatmap")
-
-            print("[I5-A] Building extracted source type Sankey...")
-            save_fig(i5_source_type_sankey(i5_data, models),
-                     out / "extracted_source_type_sankey")
-
-            print("[I5-A] Building extracted citation overlap heatmap...")
-            save_fig(i5_citation_overlap_heatmap(i5_data, models),
-                     out / "extracted_citation_overlap_heatmap")
-
-            print("[I5-A] Building extracted jurisdiction radar...")
-            save_fig(i5_jurisdiction_radar(i5_data, models,
-                                           h4_stats=stats_results.get("h4")),
-                     out / "extracted_jurisdiction_radar")
+            i5 = ["instrument_5"]
+            add("instrument_5/extracted_source_legitimacy_heatmap",
+                lambda: i5_source_legitimacy_heatmap_data(i5_data, models),
+                i5, render=i5_source_legitimacy_heatmap)
+            add("instrument_5/extracted_source_type_sankey",
+                lambda: i5_source_type_sankey_data(i5_data, models),
+                i5, render=i5_source_type_sankey, needs={"sankey:i5"})
+            add("instrument_5/extracted_citation_overlap_heatmap",
+                lambda: i5_citation_overlap_heatmap_data(i5_data, models),
+                i5, render=i5_citation_overlap_heatmap)
+            add("instrument_5/extracted_jurisdiction_radar",
+                lambda: i5_jurisdiction_radar_data(i5_data, models,
+                                                   h4_stats=stats_results.get("h4")),
+                i5, render=i5_jurisdiction_radar, stats="h4")
         else:
             print("\n[I5-A] instrument_5.json not found — skipping extracted-source plots.")
             print("       Run collect_llm_responses.py with instrument_5 active to generate it.")
 
         # ---- B. I1 self-reported sources ----
         if i1_data and i1_has_source_data(i1_data, models):
-            print("\n[I5-B] Building I1 self-reported source type distribution...")
-            save_fig(i1_source_type_stacked_bar(i1_data, models),
-                     out / "i1_source_type_distribution")
-
-            print("[I5-B] Building I1 self-reported source legitimacy proxy heatmap...")
-            save_fig(i1_source_legitimacy_proxy_heatmap(i1_data, models),
-                     out / "i1_source_legitimacy_proxy")
-
-            print("[I5-B] Building I1 self-reported citation overlap heatmap...")
-            save_fig(i1_source_overlap_heatmap(i1_data, models),
-                     out / "i1_citation_overlap")
-
-            print("[I5-B] Building I1 self-reported jurisdiction breakdown...")
-            save_fig(i1_jurisdiction_breakdown(i1_data, models),
-                     out / "i1_jurisdiction_breakdown")
+            i1 = ["instrument_1"]
+            add("instrument_5/i1_source_type_distribution",
+                lambda: i1_source_type_stacked_bar_data(i1_data, models),
+                i1, render=i1_source_type_stacked_bar)
+            add("instrument_5/i1_source_legitimacy_proxy",
+                lambda: i1_source_legitimacy_proxy_heatmap_data(i1_data, models),
+                i1, render=i1_source_legitimacy_proxy_heatmap)
+            add("instrument_5/i1_citation_overlap",
+                lambda: i1_source_overlap_heatmap_data(i1_data, models),
+                i1, render=i1_source_overlap_heatmap)
+            add("instrument_5/i1_jurisdiction_breakdown",
+                lambda: i1_jurisdiction_breakdown_data(i1_data, models),
+                i1, render=i1_jurisdiction_breakdown)
         else:
             print("\n[I5-B] No I1 source citation data found.")
             print("       Re-run collect_llm_responses.py with updated I1 prompts to populate.")
@@ -2722,5 +3987,106 @@ if __name__ == "__main__":
         if not i5_data and not (i1_data and i1_has_source_data(i1_data, models)):
             print("[skip] No source data available for Instrument 5 analysis.")
 
-    _save_sankey_cache()
-    print("\nAll plots complete.")
+    targets = select_targets(targets, figures)
+    if figures and not targets:
+        print(f"[skip] No targets match {' '.join(figures)}")
+
+    # -------------------------------------------------------------------------
+    # Hypothesis tests — printed to stdout before any plotting; reloaded from
+    # results.json when none of their inputs changed. Only the tests asked for
+    # (or annotating a selected figure) run, and only their inputs are loaded.
+    # -------------------------------------------------------------------------
+    if hypotheses is None:
+        hypotheses = HYPOTHESES if full_run else [t.stats for t in targets if t.stats]
+    hypotheses = [h for h in HYPOTHESES if h in hypotheses]
+    if hypotheses:
+        stats_dir = RESULTS_DIR / "hypothesis_tests"
+        h1_data   = "h1" in hypotheses and bool(i1_data and i2_data)
+
+        def build_stats() -> dict:
+            embed_model = get_embedding_store() if h1_data else None
+            i3_scores   = inp.i3_scores if {"h2", "h4"} & set(hypotheses) else None
+            elp         = inp.elp if "h3" in hypotheses else None
+            results = run_hypothesis_tests(i1_data, i2_data, i3_scores, elp, i5_data, models,
+                                           embed_model, hypotheses)
+            # A partial run keeps the other tests' last results in results.json
+            results_file = stats_dir / "results.json"
+            if hypotheses != HYPOTHESES and results_file.exists():
+                with open(results_file, "r", encoding="utf-8") as f:
+                    merged = {**json.load(f), **results}
+                results = {h: merged[h] for h in HYPOTHESES if h in merged}
+            print("Saving hypothesis test results...")
+            save_hypothesis_results(results, stats_dir)
+            return results
+
+        stats_target = Target(
+            "hypothesis_tests", build_stats,
+            inputs=sorted({n for h in hypotheses for n in HYPOTHESIS_INPUTS[h]}),
+            params={"models": models, "hypotheses": hypotheses},
+            files=[stats_dir / "results.json", stats_dir / "summary.txt"],
+            needs={"embeddings:h1"} if h1_data else set(),
+        )
+        stats_plan = graph.plan([stats_target])
+        if stats_plan:
+            results = graph.build(stats_plan, prepare)["hypothesis_tests"]
+        else:
+            print("Hypothesis tests up to date — loading results.json")
+            with open(stats_dir / "results.json", "r", encoding="utf-8") as f:
+                results = json.load(f)
+        # Figures are annotated from the JSON form so that a reloaded and a
+        # freshly computed result fingerprint identically
+        stats_results.update(json.loads(json.dumps(results, default=str)))
+
+    for target in targets:
+        if target.stats:
+            target.params[target.stats] = stats_results.get(target.stats)
+
+    if targets:
+        print(f"\nBuilding figures ({len(targets)} targets)...")
+        graph.build(graph.plan(targets), prepare)
+        with stage("wait for exports"):
+            get_exporter().close()
+        if "json" in FIGURE_FORMATS:
+            with stage("write index"):
+                print(f"  Saved: {write_index(RESULTS_DIR, 'Framing the Neutral — results')}")
+
+    with stage("save caches"):
+        _save_sankey_cache()
+        _save_extraction_cache()
+        if _embedding_store:
+            _embedding_store.save()
+    llm_cache.print_cache_report()
+    if _exporter and _exporter.failed:
+        print(f"\n[warn] {_exporter.failed} figure(s) failed to render; they will be "
+              f"rebuilt on the next run")
+    print(f"\nAll plots complete: {graph.built} built, {graph.current} up to date "
+          f"[{BUILD_MANIFEST_FILE}]")
+    write_profile()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build figures and H1–H4 hypothesis tests from data/raw/.")
+    parser.add_argument("--instruments", nargs="+", metavar="ID",
+                        choices=[f"instrument_{i}" for i in range(1, 6)],
+                        help="instruments to plot (default: ACTIVE_INSTRUMENTS)")
+    parser.add_argument("--skip-stats", action="store_true",
+                        help="skip H1–H4; figures are drawn without stats annotations")
+    parser.add_argument("--force", nargs="*", metavar="PATTERN",
+                        help="rebuild even if up to date: everything, or the targets "
+                             "matching these globs (e.g. 'instrument_3/*')")
+    parser.add_argument("--formats", nargs="+", metavar="FMT", choices=[*FORMATS, "none"],
+                        help=f"figure formats to write (default: {' '.join(FIGURE_FORMATS)}); "
+                             "'none' builds targets without writing figures")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help=f"figure export processes (default: {RENDER_WORKERS})")
+    parser.add_argument("--restyle", action="store_true",
+                        help="only re-render figures from their saved <instrument>/data/ "
+                             "JSON (after colour, label or layout changes)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help=f"record per-stage Python allocation peaks in {PROFILE_FILE} "
+                             "(tracemalloc; slower)")
+    args = parser.parse_args()
+    run_plots(args.instruments, hypotheses=[] if args.skip_stats else None,
+              force=args.force, formats=args.formats, workers=args.workers,
+              restyle=args.restyle, trace_memory=args.trace_memory)
@@ -0,0 +1,184 @@
+"""
+profiling.py
+
+Stage-level timing for plot_response_results.py.
+
+A Profiler records each `with profiler.stage(name):` block. For every stage
+it keeps:
+  - wall and CPU seconds, and how often the stage ran;
+  - the process's peak resident set size (RSS) so far;
+  - the largest traced Python allocation inside the stage, when tracemalloc
+    is on (it slows allocation-heavy code noticeably, so it is opt-in);
+  - the change in every registered counter, e.g. LLM calls, cache hits or
+    texts encoded.
+Stages nest, so a stage's time includes its children's. Work timed elsewhere,
+such as figure exports in worker processes, is added with record().
+
+write() saves everything as JSON. print_summary() lists the slowest stages
+first, with each one's change since the previous profile file so that
+regressions stand out.
+"""
+
+import json
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter, process_time
+
+SUMMARY_ROWS = 15   # stages shown in the console summary
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unavailable, e.g. Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Stage:
+    """Accumulated measurements for one stage name."""
+
+    def __init__(self, name: str, kind: str):
+        self.name        = name
+        self.kind        = kind
+        self.calls       = 0
+        self.seconds     = 0.0
+        self.cpu_seconds: float | None = None   # unknown for record()ed stages
+        self.rss_mb: float | None     = None
+        self.py_peak_mb: float | None = None
+        self.counters: dict[str, float] = {}
+
+    def as_dict(self) -> dict:
+        out = {
+            "name":        self.name,
+            "kind":        self.kind,
+            "calls":       self.calls,
+            "seconds":     round(self.seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4) if self.cpu_seconds is not None else None,
+            "rss_mb":      self.rss_mb,
+        }
+        if self.py_peak_mb is not None:
+            out["py_peak_mb"] = self.py_peak_mb
+        if self.counters:
+            out["counters"] = {k: round(v, 4) for k, v in self.counters.items()}
+        return out
+
+
+class Profiler:
+    """
+    Collects Stage entries. `counters` maps a name to a zero-argument callable
+    returning a running total; each stage records how much it grew.
+    """
+
+    def __init__(self, counters: dict | None = None, trace_memory: bool = False):
+        self.counters     = counters or {}
+        self.trace_memory = trace_memory
+        self.started      = datetime.now(timezone.utc)
+        self.stages: dict[str, Stage] = {}
+        self._t0    = perf_counter()
+        self._stack: list[list[float]] = []   # traced peak seen so far, per open stage
+        self._initial = self._snapshot()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _snapshot(self) -> dict[str, float]:
+        return {name: fn() for name, fn in self.counters.items()}
+
+    def _entry(self, name: str, kind: str) -> Stage:
+        if name not in self.stages:
+            self.stages[name] = Stage(name, kind)
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self, name: str, kind: str = "stage"):
+        if self.trace_memory:
+            if self._stack:
+                self._stack[-1][0] = max(self._stack[-1][0], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._stack.append([0.0])
+        before = self._snapshot()
+        wall, cpu = perf_counter(), process_time()
+        try:
+            yield
+        finally:
+            entry = self._entry(name, kind)
+            entry.calls       += 1
+            entry.seconds     += perf_counter() - wall
+            entry.cpu_seconds  = (entry.cpu_seconds or 0.0) + process_time() - cpu
+            entry.rss_mb       = peak_rss_mb()
+            for key, value in self._snapshot().items():
+                if value != before[key]:
+                    entry.counters[key] = entry.counters.get(key, 0) + value - before[key]
+            peak = self._stack.pop()[0]
+            if self.trace_memory:
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                entry.py_peak_mb = round(max(entry.py_peak_mb or 0.0, peak / 1024 / 1024), 1)
+                if self._stack:
+                    self._stack[-1][0] = max(self._stack[-1][0], peak)
+
+    def record(self, name: str, seconds: float, kind: str = "stage") -> None:
+        """Add a stage timed outside this process (e.g. in a worker)."""
+        entry = self._entry(name, kind)
+        entry.calls   += 1
+        entry.seconds += seconds
+
+    def totals(self) -> dict[str, float]:
+        """Counter growth since the profiler was created."""
+        now = self._snapshot()
+        return {k: round(now[k] - self._initial.get(k, 0), 4) for k in now}
+
+    def as_dict(self, extra: dict | None = None) -> dict:
+        stages = sorted(self.stages.values(), key=lambda s: -s.seconds)
+        return {
+            "started":       self.started.isoformat(timespec="seconds"),
+            "total_seconds": round(perf_counter() - self._t0, 3),
+            "peak_rss_mb":   peak_rss_mb(),
+            "counters":      self.totals(),
+            **(extra or {}),
+            "stages":        [s.as_dict() for s in stages],
+        }
+
+    def write(self, path: Path, extra: dict | None = None) -> dict:
+        """
+        Write the profile to path and return the one it replaces (or {}),
+        for print_summary() to compare against.
+        """
+        previous = {}
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    previous = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                previous = {}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(extra), f, indent=2, ensure_ascii=False)
+        return previous
+
+    def print_summary(self, previous: dict | None = None, rows: int = SUMMARY_ROWS) -> None:
+        prof = self.as_dict()
+        last = {s["name"]: s["seconds"] for s in (previous or {}).get("stages", [])}
+        rss  = f"{prof['peak_rss_mb']:.0f} MB" if prof["peak_rss_mb"] is not None else "n/a"
+        print(f"\nProfile: {prof['total_seconds']:.1f}s total, peak RSS {rss}")
+        counters = " ".join(f"{k}={v:g}" for k, v in prof["counters"].items())
+        if counters:
+            print(f"  {counters}")
+        print(f"  {'seconds':>8} {'cpu':>8} {'vs last':>8} {'calls':>5}  stage")
+        for s in prof["stages"][:rows]:
+            delta = (f"{s['seconds'] - last[s['name']]:+.2f}" if s["name"] in last else "new")
+            counters = " ".join(f"{k}={v:g}" for k, v in s.get("counters", {}).items())
+            cpu      = f"{s['cpu_seconds']:.2f}" if s["cpu_seconds"] is not None else "-"
+            print(f"  {s['seconds']:>8.2f} {cpu:>8} {delta:>8} "
+                  f"{s['calls']:>5}  {s['name']}" + (f"  [{counters}]" if counters else ""))
+        hidden = len(prof["stages"]) - rows
+        if hidden > 0:
+            print(f"  ... {hidden} more stage(s)")
+        for kind in sorted({s["kind"] for s in prof["stages"]} - {"stage"}):
+            group = [s for s in prof["stages"] if s["kind"] == kind]
+            print(f"  {kind}: {len(group)} in {sum(s['seconds'] for s in group):.2f}s")
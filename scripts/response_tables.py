@@ -0,0 +1,381 @@
+"""
+response_tables.py
+
+Shared data-access layer for the analysis scripts (plot_response_results.py,
+extract_rq_quotes.py). Loads the collected instrument files in data/raw/ once
+into two tidy pandas tables:
+
+  responses  one row per (instrument, model, condition, run, question)
+             instrument, model, condition, run, question, text, raw, parse_ok
+  sources    one row per cited source (I1 self-reported, I5 extracted)
+             instrument, model, condition, run, question, name,
+             normalized_name, type, jurisdiction, tier, verifiable, quote
+
+Key columns are categoricals. Both tables are cached as Parquet in
+data/raw/_tables/ and rebuilt whenever an instrument file changes.
+Per-instrument sources are served through a SourceIndex, which groups rows
+by (model, condition) once so figures aggregate instead of rescanning.
+
+`text` follows the analysis convention: the parsed "response" field when the
+response was JSON (I1), otherwise the raw reply. I3 ratings and I4 peer scores
+are nested objects rather than text; their parsed dicts remain available via
+ResponseTables.raw(instrument_id).
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAW_DIR        = Path("data/raw")
+TABLES_DIR     = RAW_DIR / "_tables"
+SCHEMA_VERSION = 2
+
+INSTRUMENTS = ["instrument_1", "instrument_2", "instrument_3", "instrument_4", "instrument_5"]
+
+# Instruments whose runs hold {question_id: response}; I3 stores one response per run
+QUESTION_INSTRUMENTS = ["instrument_1", "instrument_2", "instrument_5"]
+I3_QUESTION          = "I3"
+
+# Instruments whose parsed responses carry a "sources" list
+SOURCE_INSTRUMENTS = ["instrument_1", "instrument_5"]
+
+RESPONSE_CATEGORICALS = ["instrument", "model", "condition", "question"]
+SOURCE_CATEGORICALS   = ["instrument", "model", "condition", "question", "type", "jurisdiction"]
+
+
+# =============================================================================
+# Flattening
+# =============================================================================
+
+def response_text(val) -> str:
+    """
+    Response text from either a legacy plain string or a {raw, parsed} dict.
+    Uses parsed["response"] where present (I1), else the raw reply.
+    """
+    if isinstance(val, str):
+        return val
+    if isinstance(val, dict):
+        parsed = val.get("parsed") or {}
+        text   = parsed.get("response") if isinstance(parsed, dict) else None
+        return text or val.get("raw") or ""
+    return ""
+
+
+def normalize_source_name(name) -> str:
+    """Case- and whitespace-insensitive source name used to match citations."""
+    return name.lower().strip() if isinstance(name, str) else ""
+
+
+def _sorted_runs(runs: dict) -> list[str]:
+    """Run keys in numeric order; non-numeric keys are not runs and are skipped."""
+    return sorted((r for r in runs if str(r).isdigit()), key=int)
+
+
+def _flatten(instrument_id: str, data: dict, responses: list, sources: list) -> None:
+    for model, conds in data.items():
+        if not isinstance(conds, dict):
+            continue
+        for cond, runs in conds.items():
+            if not isinstance(runs, dict):
+                continue
+            for run in _sorted_runs(runs):
+                entry = runs[run]
+                if instrument_id == "instrument_3":
+                    questions = {I3_QUESTION: entry}
+                elif isinstance(entry, dict):
+                    questions = entry
+                else:
+                    continue
+                for q_id, val in questions.items():
+                    parsed = val.get("parsed") if isinstance(val, dict) else None
+                    responses.append({
+                        "instrument": instrument_id,
+                        "model":      model,
+                        "condition":  cond,
+                        "run":        int(run),
+                        "question":   q_id,
+                        "text":       response_text(val),
+                        "raw":        val.get("raw") if isinstance(val, dict) else val,
+                        "parse_ok":   bool(parsed),
+                    })
+                    if instrument_id not in SOURCE_INSTRUMENTS or not isinstance(parsed, dict):
+                        continue
+                    for s in parsed.get("sources", []) or []:
+                        if not isinstance(s, dict):
+                            continue
+                        sources.append({
+                            "instrument":   instrument_id,
+                            "model":        model,
+                            "condition":    cond,
+                            "run":          int(run),
+                            "question":     q_id,
+                            "name":         s.get("name"),
+                            "normalized_name": normalize_source_name(s.get("name")),
+                            "type":         s.get("type"),
+                            "jurisdiction": s.get("jurisdiction"),
+                            "tier":         s.get("legitimacy_tier"),
+                            "verifiable":   s.get("verifiable"),
+                            "quote":        s.get("quote"),
+                        })
+
+
+def _frame(rows: list[dict], columns: list[str], categoricals: list[str]) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=columns)
+    for col in categoricals:
+        # Keep first-seen order so model / condition order matches the source files
+        df[col] = pd.Categorical(df[col], categories=list(dict.fromkeys(df[col].dropna())))
+    df["run"] = df["run"].astype("int16")
+    return df
+
+
+def build_tables(raw: dict[str, dict]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    responses, sources = [], []
+    for instrument_id in INSTRUMENTS:
+        if instrument_id in raw and instrument_id != "instrument_4":
+            _flatten(instrument_id, raw[instrument_id], responses, sources)
+
+    resp_df = _frame(
+        responses,
+        ["instrument", "model", "condition", "run", "question", "text", "raw", "parse_ok"],
+        RESPONSE_CATEGORICALS,
+    )
+    src_df = _frame(
+        sources,
+        ["instrument", "model", "condition", "run", "question", "name", "normalized_name",
+         "type", "jurisdiction", "tier", "verifiable", "quote"],
+        SOURCE_CATEGORICALS,
+    )
+    # Tier and verifiable come straight from LLM output: anything that is not
+    # a tier 1-4 or a real boolean becomes NA rather than failing the cast
+    tier = pd.to_numeric(src_df["tier"], errors="coerce")
+    src_df["tier"]       = tier.where(tier.isin([1, 2, 3, 4])).astype("Int8")
+    src_df["verifiable"] = src_df["verifiable"].map(
+        lambda v: v if v is True or v is False else pd.NA).astype("boolean")
+    return resp_df, src_df
+
+
+# =============================================================================
+# Parquet cache
+# =============================================================================
+
+def _fingerprint(raw_dir: Path) -> dict:
+    files = {}
+    for instrument_id in INSTRUMENTS:
+        p = raw_dir / f"{instrument_id}.json"
+        if p.exists():
+            st = p.stat()
+            files[instrument_id] = [st.st_size, st.st_mtime_ns]
+    return {"schema": SCHEMA_VERSION, "files": files}
+
+
+def _read_cache(tables_dir: Path, fingerprint: dict):
+    manifest = tables_dir / "manifest.json"
+    if not manifest.exists():
+        return None
+    with open(manifest, "r", encoding="utf-8") as f:
+        if json.load(f) != fingerprint:
+            return None
+    try:
+        return (pd.read_parquet(tables_dir / "responses.parquet"),
+                pd.read_parquet(tables_dir / "sources.parquet"))
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _write_cache(tables_dir: Path, fingerprint: dict,
+                 responses: pd.DataFrame, sources: pd.DataFrame) -> None:
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        responses.to_parquet(tables_dir / "responses.parquet", index=False)
+        sources.to_parquet(tables_dir / "sources.parquet", index=False)
+    except ImportError:
+        print("  [tables] pyarrow not installed — Parquet cache disabled")
+        return
+    with open(tables_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f, indent=2)
+
+
+# =============================================================================
+# Access
+# =============================================================================
+
+class SourceIndex:
+    """
+    One instrument's sources with categorical codes and a (model, condition)
+    → row-positions index, built once. rows() / counts() / totals() are
+    cheap selections and group-bys over it rather than per-model scans.
+    """
+
+    def __init__(self, sources: pd.DataFrame):
+        self.df         = sources.reset_index(drop=True)
+        self.models     = list(self.df["model"].cat.categories)
+        self.conditions = list(self.df["condition"].cat.categories)
+        self.groups: dict[tuple[str, str], np.ndarray] = dict(
+            self.df.groupby(["model", "condition"], observed=True, sort=False).indices
+        )
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def codes(self, column: str) -> np.ndarray:
+        """Integer category codes of a categorical column (-1 = missing)."""
+        return self.df[column].cat.codes.to_numpy()
+
+    def positions(self, model: str | None = None,
+                  conditions: list[str] | None = None) -> np.ndarray:
+        """Row positions for a model / conditions, in table order."""
+        if model is None and conditions is None:
+            return np.arange(len(self.df))
+        models = self.models if model is None else [model]
+        conds  = self.conditions if conditions is None else conditions
+        parts  = [self.groups[(m, c)] for m in models for c in conds if (m, c) in self.groups]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+
+    def rows(self, model: str | None = None,
+             conditions: list[str] | None = None) -> pd.DataFrame:
+        return self.df.iloc[self.positions(model, conditions)]
+
+    def counts(self, column: str | pd.Series, models: list[str],
+               conditions: list[str] | None = None) -> pd.DataFrame:
+        """
+        models × values citation counts of a column, or of a derived key Series
+        aligned with self.df (missing values dropped).
+        """
+        df  = self.df if conditions is None else self.rows(conditions=conditions)
+        col = df[column] if isinstance(column, str) else column.loc[df.index]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            col = col.astype(object)
+        table = df.groupby([df["model"].astype(object), col], sort=False).size().unstack(fill_value=0)
+        return table.reindex(models, fill_value=0)
+
+    def totals(self, models: list[str], conditions: list[str] | None = None) -> pd.Series:
+        """Citations per model."""
+        df = self.df if conditions is None else self.rows(conditions=conditions)
+        return df["model"].astype(object).value_counts().reindex(models, fill_value=0)
+
+
+class InstrumentView:
+    """
+    Rows of one instrument, with dict indexes built on first use so per-figure
+    lookups (texts for a model × condition × question, sources for a model)
+    are O(1) instead of DataFrame scans.
+    """
+
+    def __init__(self, tables: "ResponseTables", instrument_id: str):
+        self.tables        = tables
+        self.instrument_id = instrument_id
+        self.responses     = tables.responses[tables.responses["instrument"] == instrument_id]
+        self.sources       = tables.sources[tables.sources["instrument"] == instrument_id]
+        self._texts: dict | None = None
+        self._runs:  dict | None = None
+        self._source_index: SourceIndex | None = None
+
+    def __bool__(self) -> bool:
+        return not self.responses.empty
+
+    @property
+    def models(self) -> list[str]:
+        return list(dict.fromkeys(self.responses["model"].astype(str)))
+
+    @property
+    def raw(self) -> dict:
+        return self.tables.raw(self.instrument_id) or {}
+
+    def _build_index(self) -> None:
+        self._texts, self._runs = {}, {}
+        df = self.responses
+        for model, cond, q, run, text in zip(df["model"], df["condition"], df["question"],
+                                             df["run"], df["text"]):
+            self._runs[(model, cond, q, int(run))] = text
+            if text:
+                self._texts.setdefault((model, cond, q), []).append(text)
+
+    def texts(self, model: str, condition: str, question: str) -> list[str]:
+        """Non-empty response texts for a model × condition × question, in run order."""
+        if self._texts is None:
+            self._build_index()
+        return self._texts.get((model, condition, question), [])
+
+    def text(self, model: str, condition: str, question: str, run: int = 1) -> str:
+        if self._runs is None:
+            self._build_index()
+        return self._runs.get((model, condition, question, run), "") or ""
+
+    @property
+    def source_index(self) -> SourceIndex:
+        if self._source_index is None:
+            self._source_index = SourceIndex(self.sources)
+        return self._source_index
+
+    def source_records(self, model: str | None = None,
+                       conditions: list[str] | None = None) -> list[dict]:
+        """
+        Sources as dicts in the collected JSON shape (name, type, jurisdiction,
+        legitimacy_tier, verifiable, quote; absent fields omitted), tagged with
+        _question / _condition.
+        """
+        df  = self.source_index.rows(model, conditions)
+        out = []
+        for row in df.itertuples(index=False):
+            rec = {"_question": row.question, "_condition": row.condition}
+            for key, val in (("name", row.name), ("type", row.type),
+                             ("jurisdiction", row.jurisdiction), ("quote", row.quote)):
+                if isinstance(val, str):
+                    rec[key] = val
+            if not pd.isna(row.tier):
+                rec["legitimacy_tier"] = int(row.tier)
+            if not pd.isna(row.verifiable):
+                rec["verifiable"] = bool(row.verifiable)
+            out.append(rec)
+        return out
+
+
+class ResponseTables:
+    """responses / sources tables for every collected instrument."""
+
+    def __init__(self, responses: pd.DataFrame, sources: pd.DataFrame,
+                 raw_dir: Path = RAW_DIR, raw: dict[str, dict] | None = None):
+        self.responses = responses
+        self.sources   = sources
+        self.raw_dir   = raw_dir
+        self._raw      = dict(raw or {})
+        self._views: dict[str, InstrumentView] = {}
+
+    def raw(self, instrument_id: str) -> dict | None:
+        """Nested JSON for one instrument (loaded on demand; used for I3/I4 parsed scores)."""
+        if instrument_id not in self._raw:
+            path = self.raw_dir / f"{instrument_id}.json"
+            self._raw[instrument_id] = None
+            if path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    self._raw[instrument_id] = json.load(f)
+        return self._raw[instrument_id]
+
+    def view(self, instrument_id: str) -> InstrumentView:
+        if instrument_id not in self._views:
+            self._views[instrument_id] = InstrumentView(self, instrument_id)
+        return self._views[instrument_id]
+
+
+def load_tables(raw_dir: Path = RAW_DIR, refresh: bool = False) -> ResponseTables:
+    """
+    Load responses / sources from the Parquet cache, rebuilding it from the
+    instrument JSON files when they have changed (or refresh=True).
+    """
+    tables_dir  = raw_dir / TABLES_DIR.name
+    fingerprint = _fingerprint(raw_dir)
+    cached      = None if refresh else _read_cache(tables_dir, fingerprint)
+    if cached is not None:
+        return ResponseTables(*cached, raw_dir=raw_dir)
+
+    raw = {}
+    for instrument_id in fingerprint["files"]:
+        with open(raw_dir / f"{instrument_id}.json", "r", encoding="utf-8") as f:
+            raw[instrument_id] = json.load(f)
+    responses, sources = build_tables(raw)
+    _write_cache(tables_dir, fingerprint, responses, sources)
+    print(f"  [tables] {len(responses)} responses, {len(sources)} sources "
+          f"→ {tables_dir}/")
+    return ResponseTables(responses, sources, raw_dir=raw_dir, raw=raw)